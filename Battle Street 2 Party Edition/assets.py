@@ -0,0 +1,135 @@
+import hashlib
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp')
+SOUND_EXTENSIONS = ('.wav', '.ogg', '.mp3')
+
+class AssetManager:
+    """ Decodes images and sounds on worker threads, converts images to the display
+    format on the main thread and keeps resized variants in an on-disk cache """
+
+    def __init__(self, resource_path, external_path, workers=2):
+        # Files next to the executable override the bundled ones
+        self.resource_path = resource_path
+        self.external_path = external_path
+        self.cache_dir = external_path("asset_cache")
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="assets")
+        self.images = {} # (path, max_width, alpha) -> converted Surface
+        self.sounds = {} # path -> Sound
+        self.pending = {} # key -> Future
+        self.failed = {} # key -> exception, a broken file is only decoded (and reported) once
+
+    def resolve(self, relative_path):
+        external = self.external_path(relative_path)
+        if os.path.exists(external):
+            return external
+        return self.resource_path(relative_path)
+
+    def list_files(self, folder, extensions):
+        folder_path = self.resolve(folder)
+        if not os.path.isdir(folder_path):
+            return []
+        return [os.path.join(folder, f) for f in os.listdir(folder_path) if f.lower().endswith(extensions)]
+
+    def list_images(self, folder):
+        return self.list_files(folder, IMAGE_EXTENSIONS)
+
+    def list_sounds(self, folder):
+        return self.list_files(folder, SOUND_EXTENSIONS)
+
+    # Images
+
+    def request_image(self, relative_path, max_width=None, alpha=True):
+        # Start decoding in the background, get_image() picks the result up later
+        key = (relative_path, max_width, alpha)
+        if key not in self.images and key not in self.pending and key not in self.failed:
+            self.pending[key] = self.pool.submit(self.decode_image, relative_path, max_width)
+        return key
+
+    def image_ready(self, relative_path, max_width=None, alpha=True):
+        key = (relative_path, max_width, alpha)
+        # Never true after a failed decode, nothing more will arrive
+        return key in self.images or (key in self.pending and self.pending[key].done())
+
+    def get_image(self, relative_path, max_width=None, alpha=True):
+        key = self.request_image(relative_path, max_width, alpha)
+        image = self.images.get(key)
+        if image is None:
+            if key in self.failed:
+                raise self.failed[key]
+            try:
+                image = self.pending.pop(key).result()
+            except Exception as e:
+                self.failed[key] = e
+                raise
+            # Converting needs the display, so it stays on the main thread
+            if pygame.display.get_surface() is not None:
+                image = image.convert_alpha() if alpha else image.convert()
+            self.images[key] = image
+        return image
+
+    def decode_image(self, relative_path, max_width):
+        # Runs on a worker thread
+        path = self.resolve(relative_path)
+        with open(path, "rb") as f:
+            data = f.read()
+
+        cached_path = None
+        if max_width:
+            digest = hashlib.sha1(data).hexdigest()
+            cached_path = os.path.join(self.cache_dir, f"{digest}_w{max_width}.png")
+            if os.path.exists(cached_path):
+                try:
+                    return pygame.image.load(cached_path)
+                except Exception as e:
+                    print(f"Ignoring broken cached asset {cached_path}: {e}")
+
+        image = pygame.image.load(io.BytesIO(data), os.path.basename(path))
+        # Scale to fit reasonably if too big
+        if max_width and image.get_width() > max_width:
+            scale = max_width / image.get_width()
+            image = pygame.transform.scale(image, (int(image.get_width()*scale), int(image.get_height()*scale)))
+            self.store_cached(image, cached_path)
+        return image
+
+    def store_cached(self, image, cached_path):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = cached_path + ".tmp.png"
+            pygame.image.save(image, temp_path)
+            os.replace(temp_path, cached_path)
+        except Exception as e:
+            # Read-only install dir etc, we just scale again next launch
+            print(f"Could not cache asset {cached_path}: {e}")
+
+    # Sounds
+
+    def request_sound(self, relative_path):
+        key = ("sound", relative_path)
+        if relative_path not in self.sounds and key not in self.pending and key not in self.failed:
+            self.pending[key] = self.pool.submit(self.decode_sound, relative_path)
+        return key
+
+    def get_sound(self, relative_path):
+        key = self.request_sound(relative_path)
+        sound = self.sounds.get(relative_path)
+        if sound is None:
+            if key in self.failed:
+                raise self.failed[key]
+            try:
+                sound = self.sounds[relative_path] = self.pending.pop(key).result()
+            except Exception as e:
+                self.failed[key] = e
+                raise
+        return sound
+
+    def decode_sound(self, relative_path):
+        # Runs on a worker thread, needs pygame.mixer to be initialized
+        return pygame.mixer.Sound(self.resolve(relative_path))
+
+    def shutdown(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
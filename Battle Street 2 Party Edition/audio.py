@@ -0,0 +1,207 @@
+import array
+import math
+import os
+import random
+import sys
+from collections import OrderedDict
+
+import pygame
+
+MIX_FREQUENCY = 22050
+MIX_BUFFER = 512 # Samples, about 23 ms
+MAX_CHANNELS = 8 # More would only mix sounds nobody can pick out
+
+# Built-in effects: name -> (wave, start Hz, end Hz, seconds, volume) segments played in order.
+# A sounds/<name>.wav (or .ogg) next to the game replaces the built-in one.
+EFFECTS = {
+    "hit": [("noise", 0, 0, 0.04, 0.5), ("square", 180, 80, 0.08, 0.4)],
+    "coin": [("square", 988, 988, 0.05, 0.25), ("square", 1319, 1319, 0.15, 0.25)],
+    "brick": [("square", 660, 330, 0.06, 0.25)],
+    "dice": [("noise", 0, 0, 0.02, 0.2)],
+    "star": [("square", 523, 523, 0.08, 0.25), ("square", 659, 659, 0.08, 0.25), ("square", 784, 784, 0.2, 0.25)],
+}
+
+# Scene (see Game.scene_label) -> music/<track>.ogg; minigames without an entry use "minigame"
+MUSIC_TRACKS = {
+    "TITLE": "title",
+    "HIGH_SCORES": "title",
+    "EXPANSION_MENU": "title",
+    "BOARD": "board",
+    "BossFightMinigame": "boss",
+    "GAME_OVER": "victory",
+}
+
+_audio = None
+
+def play(name):
+    # Fire and forget, cheap enough for minigame update loops. Silent until the
+    # AudioManager is initialized (and always when audio is off).
+    if _audio is not None:
+        _audio.play(name)
+
+def synthesize(segments, frequency, channels):
+    # 16-bit samples for the mixer format; noise comes from its own generator so
+    # building sounds never shifts the game's random sequence
+    noise = random.Random(0)
+    release = int(frequency * 0.01) # Fade the last 10 ms, a hard stop clicks
+    samples = array.array("h")
+    for wave, start, end, seconds, volume in segments:
+        count = max(1, int(seconds * frequency))
+        phase = 0.0
+        for i in range(count):
+            phase += (start + (end - start) * i / count) / frequency
+            if wave == "square":
+                value = 1.0 if phase % 1.0 < 0.5 else -1.0
+            elif wave == "noise":
+                value = noise.uniform(-1.0, 1.0)
+            else:
+                value = math.sin(phase * 2 * math.pi)
+            envelope = min(1.0, (count - i) / release)
+            samples.append(int(value * volume * envelope * 32767))
+    if channels > 1:
+        interleaved = array.array("h", bytes(len(samples) * 2 * channels))
+        for c in range(channels):
+            interleaved[c::channels] = samples
+        samples = interleaved
+    return pygame.mixer.Sound(buffer=samples.tobytes())
+
+class AudioManager:
+    """ Sound effects and music around pygame.mixer. Effects are decoded (or synthesized)
+    once into an LRU cache bounded in bytes, and played on a fixed set of channels:
+    when all are busy the new sound is dropped instead of cutting one off or waiting.
+    Music is streamed from disk by mixer.music, one track per scene.
+    Headless runs (SDL_VIDEODRIVER=dummy) use SDL's dummy audio driver, so everything
+    runs the same without a sound card. --mute or BS2_AUDIO=0 turns audio off. """
+
+    def __init__(self, assets, enabled=None, cache_bytes=4 * 1024 * 1024, max_channels=MAX_CHANNELS):
+        global _audio
+        if enabled is None:
+            enabled = "--mute" not in sys.argv and os.environ.get("BS2_AUDIO", "1") != "0"
+        self.assets = assets
+        self.enabled = enabled
+        self.ready = False
+        self.cache_bytes = cache_bytes
+        self.max_channels = max_channels
+        self.frequency = MIX_FREQUENCY
+        self.channels = 1
+        self.bytes_per_second = MIX_FREQUENCY * 2
+
+        self.files = {} # Effect or track name -> file, from sounds/ and music/
+        self.tracks = {}
+        self.cache = OrderedDict() # name -> Sound, least recently played first
+        self.sizes = {} # name -> bytes
+        self.cached_bytes = 0
+        self.track = None
+        self.scene = None
+
+        self.played = 0
+        self.dropped = 0 # All channels busy
+        self.misses = 0 # Loaded on play, outside the warm-up
+        _audio = self
+
+    def init(self):
+        if not self.enabled:
+            return
+        if os.environ.get("SDL_VIDEODRIVER") == "dummy":
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+        try:
+            pygame.mixer.init(MIX_FREQUENCY, -16, 1, MIX_BUFFER)
+        except pygame.error as e:
+            print(f"Audio disabled: {e}")
+            self.enabled = False
+            return
+        pygame.mixer.set_num_channels(self.max_channels)
+        self.frequency, size, self.channels = pygame.mixer.get_init()
+        self.bytes_per_second = self.frequency * abs(size) // 8 * self.channels
+        for path in self.assets.list_sounds("sounds"):
+            name = os.path.splitext(os.path.basename(path))[0]
+            self.files[name] = path
+            self.assets.request_sound(path) # Decoded on the asset workers meanwhile
+        for path in self.assets.list_sounds("music"):
+            self.tracks[os.path.splitext(os.path.basename(path))[0]] = path
+        self.ready = True
+
+    def preload(self):
+        # Warm-up task: open the device, then one effect per slice
+        self.init()
+        yield
+        for name in EFFECTS:
+            if self.ready:
+                self.load(name)
+                yield
+
+    def load(self, name):
+        sound = self.cache.get(name)
+        if sound is not None:
+            return sound
+        try:
+            if name in self.files:
+                sound = self.assets.get_sound(self.files[name])
+            elif name in EFFECTS:
+                sound = synthesize(EFFECTS[name], self.frequency, self.channels)
+            else:
+                return None
+        except Exception as e:
+            print(f"Error loading sound {name}: {e}")
+            self.files.pop(name, None)
+            return None
+        size = int(sound.get_length() * self.bytes_per_second)
+        self.cache[name] = sound
+        self.sizes[name] = size
+        self.cached_bytes += size
+        while self.cached_bytes > self.cache_bytes and len(self.cache) > 1:
+            evicted, _ = self.cache.popitem(last=False)
+            self.cached_bytes -= self.sizes.pop(evicted)
+        return sound
+
+    def play(self, name):
+        sound = self.cache.get(name)
+        if sound is None:
+            if not self.ready:
+                return
+            self.misses += 1
+            sound = self.load(name)
+            if sound is None:
+                return
+        else:
+            self.cache.move_to_end(name)
+        channel = pygame.mixer.find_channel() # Never steals a playing channel
+        if channel is None:
+            self.dropped += 1
+            return
+        channel.play(sound)
+        self.played += 1
+
+    def frame(self, scene):
+        # Called once per frame with the scene label, switches music on changes
+        if scene == self.scene:
+            return
+        self.scene = scene
+        if self.ready:
+            self.play_music(MUSIC_TRACKS.get(scene, "minigame" if scene.endswith("Minigame") else None))
+
+    def play_music(self, track):
+        if track == self.track:
+            return
+        self.track = track
+        path = self.tracks.get(track)
+        if path is None:
+            pygame.mixer.music.fadeout(500)
+            return
+        try:
+            # Only the stream is opened here, mixer.music decodes as it plays
+            pygame.mixer.music.load(self.assets.resolve(path))
+            pygame.mixer.music.play(-1, fade_ms=500)
+        except pygame.error as e:
+            print(f"Error playing music {path}: {e}")
+            self.tracks.pop(track, None)
+
+    def report(self):
+        if self.ready:
+            print(f"Audio: {self.played} played, {self.dropped} dropped (channels busy), {self.misses} loaded late, "
+                  f"{len(self.cache)} cached ({self.cached_bytes / 1024:.0f} KB)")
+
+    def shutdown(self):
+        if self.ready:
+            pygame.mixer.quit()
+            self.ready = False
@@ -0,0 +1,164 @@
+import argparse
+import os
+import random
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+# Workers are headless, silent and keep no scores: bot games never reach scores.db
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("BS2_AUDIO", "0")
+os.environ.setdefault("BS2_SCORES", "0")
+
+FPS = 60
+MAX_GAME_TICKS = 500000 # A board the bot can't finish counts as stuck
+
+_game = None # One Game per worker process, reused for every chunk
+
+def init_worker(expansion):
+    global _game
+    sys.stdout = open(os.devnull, "w") # Thousands of games' worth of menu prints
+    import main
+    _game = main.Game()
+    _game.expansion_enabled = expansion
+
+def new_stats():
+    return {
+        "games": 0,
+        "stuck": 0,
+        "ticks": 0,
+        "played": Counter(), # minigame -> times played
+        "won": Counter(), # minigame -> times a star (or the boss) was won
+        "minigame_ticks": Counter(), # minigame -> ticks spent in it
+        "rolls_to_boss": Counter(), # rolls before the first boss fight -> games
+        "boss_attempts": Counter(), # boss fights per game -> games
+        "final_stars": Counter(), # stars a player ended a game with -> players
+    }
+
+def merge(total, stats):
+    for key, value in stats.items():
+        if isinstance(value, Counter):
+            total[key].update(value)
+        else:
+            total[key] += value
+
+def play_chunk(task):
+    # Runs in a worker: plays `games` boards with its own seed, returns the counts
+    seed, games, players = task
+    from bots import Bot
+    game = _game
+    random.seed(seed)
+    game.bot = Bot(seed, players=players)
+    stats = new_stats()
+
+    rolls = 0
+    boss_attempts = 0
+    game_ticks = 0
+    entered = None # (name, turn, stars before, tick) of the running minigame
+    tick = 0
+    while game.bot.games < games:
+        state = game.state
+        game.tick()
+        tick += 1
+        game_ticks += 1
+
+        if game.state == "MINIGAME" and entered is None:
+            name = type(game.current_minigame).__name__
+            entered = (name, game.turn, game.stars[game.turn], tick)
+            if name == "BossFightMinigame":
+                if boss_attempts == 0:
+                    stats["rolls_to_boss"][rolls] += 1
+                boss_attempts += 1
+            else:
+                rolls += 1
+        elif state == "MINIGAME" and game.state != "MINIGAME":
+            name, turn, stars_before, start = entered
+            entered = None
+            stats["played"][name] += 1
+            stats["minigame_ticks"][name] += tick - start
+            if name == "BossFightMinigame":
+                won = game.state == "GAME_OVER"
+            else:
+                won = game.stars[turn] > stars_before
+            if won:
+                stats["won"][name] += 1
+
+        if game.state == "GAME_OVER" or game_ticks > MAX_GAME_TICKS:
+            if game.state == "GAME_OVER":
+                stats["games"] += 1
+                stats["boss_attempts"][boss_attempts] += 1
+                for player in range(game.num_players):
+                    stats["final_stars"][game.stars[player]] += 1
+            else:
+                stats["stuck"] += 1
+                game.bot.games += 1 # Give up on this board
+                game.enter_state("TITLE")
+                entered = None
+            rolls = 0
+            boss_attempts = 0
+            game_ticks = 0
+    stats["ticks"] = tick
+    return stats
+
+def mean_of(counter):
+    count = sum(counter.values())
+    return sum(value * n for value, n in counter.items()) / count if count else 0.0
+
+def percentile_of(counter, p):
+    count = sum(counter.values())
+    seen = 0
+    for value in sorted(counter):
+        seen += counter[value]
+        if seen >= count * p:
+            return value
+    return 0
+
+def report(stats, elapsed, workers):
+    games = stats["games"]
+    print(f"{games} games ({stats['stuck']} stuck) on {workers} workers in {elapsed:.1f} s: "
+          f"{games / elapsed:.1f} games/s, {stats['ticks'] / elapsed:,.0f} ticks/s")
+    print()
+    print(f"{'Minigame':<24}{'played':>8}{'win rate':>10}{'avg s':>8}")
+    for name in sorted(stats["played"]):
+        played = stats["played"][name]
+        seconds = stats["minigame_ticks"][name] / played / FPS
+        print(f"{name:<24}{played:>8}{stats['won'][name] / played:>10.1%}{seconds:>8.1f}")
+    print()
+    rolls = stats["rolls_to_boss"]
+    if rolls:
+        print(f"Rolls to reach the boss: mean {mean_of(rolls):.1f}, median {percentile_of(rolls, 0.5)}, "
+              f"p90 {percentile_of(rolls, 0.9)}, max {max(rolls)}")
+    attempts = stats["boss_attempts"]
+    if attempts:
+        print(f"Boss fights per game: mean {mean_of(attempts):.2f}")
+    print("Final stars per player: " + ", ".join(f"{stars}: {n}" for stars, n in sorted(stats["final_stars"].items())))
+
+def main():
+    parser = argparse.ArgumentParser(description="Play many bot games headless and report balance statistics")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk", type=int, default=5, help="games per task")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--players", type=int, default=1)
+    parser.add_argument("--expansion", action="store_true", help="roll up to 12 (expansion minigames)")
+    args = parser.parse_args()
+
+    # Every chunk gets its own seed, so results don't depend on how chunks land on workers
+    tasks = []
+    remaining = args.games
+    while remaining > 0:
+        games = min(args.chunk, remaining)
+        tasks.append((args.seed * 1000003 + len(tasks), games, args.players))
+        remaining -= games
+
+    start = time.perf_counter()
+    total = new_stats()
+    with ProcessPoolExecutor(args.workers, initializer=init_worker, initargs=(args.expansion,)) as pool:
+        for stats in pool.map(play_chunk, tasks):
+            merge(total, stats)
+    report(total, time.perf_counter() - start, args.workers)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import queue
+import threading
+import time
+
+class BatchWriter:
+    """ Writer thread behind a queue, shared by the telemetry log and the scoreboard. The
+    game thread only puts records; the thread hands them to write(batch) once FLUSH_RECORDS
+    have piled up or FLUSH_SECONDS have gone by, so a slow disk never costs a frame.
+    setup() runs first on the thread (returning False gives up), teardown() after the
+    last batch. flush() waits until everything put so far has been written. """
+
+    FLUSH_RECORDS = 64
+    FLUSH_SECONDS = 1.0
+
+    def __init__(self, name, write, setup=None, teardown=None):
+        self.name = name
+        self.write = write
+        self.setup = setup
+        self.teardown = teardown
+        self.queue = queue.SimpleQueue()
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self.write_loop, name=self.name, daemon=True)
+        self.thread.start()
+
+    def put(self, record):
+        self.queue.put(record)
+
+    def write_loop(self):
+        # None stops, an Event asks for everything before it to be written
+        if self.setup and self.setup() is False:
+            return
+        batch = []
+        waiters = []
+        deadline = time.monotonic() + self.FLUSH_SECONDS
+        running = True
+        while running:
+            try:
+                record = self.queue.get(timeout=max(0.0, deadline - time.monotonic()))
+                if record is None:
+                    running = False
+                elif isinstance(record, threading.Event):
+                    waiters.append(record)
+                else:
+                    batch.append(record)
+            except queue.Empty:
+                pass
+            now = time.monotonic()
+            if waiters or not running or len(batch) >= self.FLUSH_RECORDS or now >= deadline:
+                if batch:
+                    self.write(batch)
+                    batch = []
+                for waiter in waiters:
+                    waiter.set()
+                waiters = []
+                deadline = now + self.FLUSH_SECONDS
+        if self.teardown:
+            self.teardown()
+
+    def flush(self, timeout=1.0):
+        if self.thread and self.thread.is_alive():
+            done = threading.Event()
+            self.queue.put(done)
+            done.wait(timeout)
+
+    def stop(self):
+        # Writes whatever is still queued, then joins the thread
+        if not self.thread:
+            return False
+        self.queue.put(None)
+        self.thread.join()
+        self.thread = None
+        return True
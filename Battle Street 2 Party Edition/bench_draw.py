@@ -0,0 +1,50 @@
+import os
+import sys
+import time
+
+# Run headless so this works on CI and over SSH
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+import minigames
+
+WARMUP_FRAMES = 120 # Let entities spawn before measuring
+FRAMES = 600
+
+def bench(cls, screen, font):
+    game = cls(screen, font, 1)
+    keys = pygame.key.get_pressed()
+    for _ in range(WARMUP_FRAMES):
+        game.handle_input(keys, None)
+        game.update()
+
+    total = 0.0
+    for _ in range(FRAMES):
+        game.handle_input(keys, None)
+        game.update()
+        start = time.perf_counter()
+        game.draw()
+        total += time.perf_counter() - start
+    return total / FRAMES * 1000
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((minigames.SCREEN_WIDTH, minigames.SCREEN_HEIGHT))
+    font = pygame.font.Font(None, 74)
+
+    names = sys.argv[1:]
+    classes = [getattr(minigames, name) for name in dir(minigames) if name.endswith("Minigame")]
+    classes = [cls for cls in classes if issubclass(cls, minigames.Minigame) and cls is not minigames.Minigame]
+    if names:
+        classes = [cls for cls in classes if cls.__name__ in names]
+
+    print(f"{'Minigame':<24}{'draw ms/frame':>14}")
+    for cls in classes:
+        # Same random state for every run so before/after numbers compare
+        minigames.random.seed(1234)
+        print(f"{cls.__name__:<24}{bench(cls, screen, font):>14.3f}")
+    pygame.quit()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+import random
+from collections import deque
+
+import pygame
+from minigames import SCREEN_WIDTH, SCREEN_HEIGHT
+
+DIRECTION_KEYS = {(-1, 0): pygame.K_LEFT, (1, 0): pygame.K_RIGHT, (0, -1): pygame.K_UP, (0, 1): pygame.K_DOWN}
+
+# Title screen key for each player count
+TITLE_KEYS = {1: pygame.K_SPACE, 2: pygame.K_b, 3: pygame.K_x, 4: pygame.K_y}
+
+class BotKeys:
+    """ Stands in for pygame.key.get_pressed(), indexed by key constant """
+
+    def __init__(self, pressed=()):
+        self.pressed = set(pressed)
+
+    def __getitem__(self, key):
+        return key in self.pressed
+
+class VirtualJoystick:
+    """ Stands in for a pygame Joystick: left stick on axes 0/1, A on button 0 """
+
+    def __init__(self, instance_id=-1):
+        self.instance_id = instance_id
+        self.axes = [0.0] * 4
+        self.buttons = [False] * 12
+
+    def get_instance_id(self):
+        return self.instance_id
+
+    def get_name(self):
+        return "Bot Controller"
+
+    def get_numaxes(self):
+        return len(self.axes)
+
+    def get_numbuttons(self):
+        return len(self.buttons)
+
+    def get_numhats(self):
+        return 0
+
+    def get_axis(self, axis):
+        return self.axes[axis]
+
+    def get_button(self, button):
+        return self.buttons[button]
+
+    def set_from_keys(self, pressed):
+        # Same intent as the keys: arrows on the stick, space on A
+        self.axes[0] = (pygame.K_RIGHT in pressed) - (pygame.K_LEFT in pressed)
+        self.axes[1] = (pygame.K_DOWN in pressed) - (pygame.K_UP in pressed)
+        self.buttons[0] = pygame.K_SPACE in pressed
+
+def steer(dx, dy, deadzone=3):
+    # Arrow keys that move by (dx, dy)
+    pressed = set()
+    if dx < -deadzone: pressed.add(pygame.K_LEFT)
+    elif dx > deadzone: pressed.add(pygame.K_RIGHT)
+    if dy < -deadzone: pressed.add(pygame.K_UP)
+    elif dy > deadzone: pressed.add(pygame.K_DOWN)
+    return pressed
+
+def nearest(rects, x, y):
+    return min(rects, key=lambda r: (r.centerx - x) ** 2 + (r.centery - y) ** 2, default=None)
+
+# Policies: minigame, rng -> set of pressed keys. They only read the minigame's state.
+
+def battle_policy(m, rng):
+    p, enemy = m.p1_rect, m.p2_rect
+    pressed = steer(enemy.centerx - p.centerx, enemy.centery - p.centery, deadzone=30)
+    if (p.centerx - enemy.centerx) ** 2 + (p.centery - enemy.centery) ** 2 < 65 ** 2:
+        pressed.add(pygame.K_SPACE)
+    return pressed
+
+def racing_policy(m, rng):
+    return {pygame.K_SPACE}
+
+def pong_policy(m, rng):
+    # Track the ball while it comes at us, drift back to the middle otherwise
+    target = m.ball_y if m.ball_dx < 0 else SCREEN_HEIGHT // 2
+    return steer(0, target - (m.p1_y + m.paddle_h // 2), deadzone=8)
+
+def dodgeball_policy(m, rng):
+    p = m.player_rect
+    # Pushed away from every close ball, gently pulled back to the middle
+    fx = (SCREEN_WIDTH // 2 - p.centerx) * 0.00002
+    fy = (SCREEN_HEIGHT // 2 - p.centery) * 0.00002
+    for obj in m.falling_objects:
+        r = obj['rect']
+        dx = p.centerx - r.centerx
+        dy = p.centery - r.centery
+        d2 = dx * dx + dy * dy
+        if d2 < 220 ** 2:
+            fx += dx / (d2 + 1)
+            fy += dy / (d2 + 1)
+    return steer(fx, fy, deadzone=0.002)
+
+def target_policy(m, rng):
+    c = m.crosshair_rect
+    target = nearest(m.targets, c.centerx, c.centery)
+    if target is None:
+        return set()
+    pressed = steer(target.centerx - c.centerx, target.centery - c.centery, deadzone=6)
+    if c.colliderect(target):
+        pressed.add(pygame.K_SPACE)
+    return pressed
+
+def coin_policy(m, rng):
+    p = m.player_rect
+    coin = nearest(m.coins, p.centerx, p.centery)
+    if coin is None:
+        return set()
+    return steer(coin.centerx - p.centerx, coin.centery - p.centery)
+
+def snake_policy(m, rng):
+    # Only decide on the tick before the snake moves, next_direction holds in between
+    if m.move_timer != m.speed_delay:
+        return set()
+    cell = m.cell_size
+    head = m.snake[0]
+    body = set(m.snake[:-1]) # The tail moves out of the way
+    best = None
+    for direction, key in DIRECTION_KEYS.items():
+        if direction == (-m.direction[0], -m.direction[1]):
+            continue
+        nxt = (head[0] + direction[0] * cell, head[1] + direction[1] * cell)
+        if not (0 <= nxt[0] < SCREEN_WIDTH and 0 <= nxt[1] < SCREEN_HEIGHT) or nxt in body:
+            continue
+        # Prefer room to keep going over being close to the food
+        room = min(free_cells(nxt, body, cell, len(m.snake) + 2), len(m.snake) + 2)
+        dist = abs(nxt[0] - m.food[0]) + abs(nxt[1] - m.food[1])
+        score = (room, -dist)
+        if best is None or score > best[0]:
+            best = (score, key)
+    return {best[1]} if best else set()
+
+def free_cells(start, body, cell, limit):
+    # Flood fill from start, stops counting at limit
+    seen = {start}
+    queue = deque([start])
+    while queue and len(seen) < limit:
+        x, y = queue.popleft()
+        for dx, dy in DIRECTION_KEYS:
+            nxt = (x + dx * cell, y + dy * cell)
+            if nxt in seen or nxt in body or not (0 <= nxt[0] < SCREEN_WIDTH and 0 <= nxt[1] < SCREEN_HEIGHT):
+                continue
+            seen.add(nxt)
+            queue.append(nxt)
+    return len(seen)
+
+def space_shooter_policy(m, rng):
+    p = m.player_rect
+    # Line up under the lowest enemy, fire whenever the cooldown allows
+    target = max(m.enemies, key=lambda e: e.y, default=None)
+    pressed = steer(target.centerx - p.centerx, 0) if target else set()
+    pressed.add(pygame.K_SPACE)
+    return pressed
+
+def pacman_policy(m, rng):
+    cell = m.cell_size
+    p = m.player_rect
+    # Turns only work lined up with a corridor, replanning between cells just jitters
+    centred = abs(p.centerx % cell - cell // 2) < m.speed and abs(p.centery % cell - cell // 2) < m.speed
+    if not centred and m.direction in DIRECTION_KEYS and m.can_move(p, m.direction):
+        return {DIRECTION_KEYS[m.direction]}
+    # Keep well clear of ghosts if possible, brush past them if not, last dots may sit in their pen
+    step = plan_pacman(m, p, cell, margin=1) or plan_pacman(m, p, cell, margin=0) or plan_pacman(m, p, cell, margin=None)
+    if step and (m.can_move(p, step) or m.can_move(p, m.direction)):
+        return {DIRECTION_KEYS[step]}
+    # Boxed in by ghosts, or stuck off the grid against a wall: any way that moves
+    movable = [d for d in DIRECTION_KEYS if m.can_move(p, d)]
+    return {DIRECTION_KEYS[rng.choice(movable)]} if movable else set()
+
+def plan_pacman(m, p, cell, margin):
+    # First step of the shortest path to a dot, avoiding cells within margin of a ghost (None: ignore them)
+    start = (p.centerx // cell, p.centery // cell)
+    ghosts = set()
+    for ghost in m.ghosts if margin is not None else ():
+        gx, gy = ghost['rect'].centerx // cell, ghost['rect'].centery // cell
+        ghosts.add((gx, gy))
+        if margin:
+            ghosts.update({(gx + 1, gy), (gx - 1, gy), (gx, gy + 1), (gx, gy - 1)})
+    dots = {(d.x // cell, d.y // cell) for d in m.dots}
+
+    # Breadth-first to the closest dot, around walls and ghosts
+    first_step = {start: None}
+    queue = deque([start])
+    while queue:
+        x, y = queue.popleft()
+        if (x, y) in dots and (x, y) != start:
+            return first_step[(x, y)]
+        for direction in DIRECTION_KEYS:
+            nxt = (x + direction[0], y + direction[1])
+            if nxt in first_step or nxt in ghosts:
+                continue
+            if not (0 <= nxt[1] < len(m.map) and 0 <= nxt[0] < len(m.map[0])) or m.map[nxt[1]][nxt[0]] == 'W':
+                continue
+            first_step[nxt] = first_step[(x, y)] or direction
+            queue.append(nxt)
+    return None
+
+def block_breaker_policy(m, rng):
+    ball = m.ball_rect
+    # Meet the ball off-centre so it bounces towards the nearest brick,
+    # dead centre sends it straight up and down forever once a column is clear
+    half = m.paddle_w / 2
+    block = nearest(m.blocks, ball.centerx, ball.centery)
+    towards = block.centerx - ball.centerx if block else SCREEN_WIDTH // 2 - ball.centerx
+    aim = max(0.3, min(0.7, abs(towards) / 300)) * (1 if towards >= 0 else -1)
+    target = ball.centerx - aim * half
+    if not half <= target <= SCREEN_WIDTH - half:
+        # Paddle can't get there against the wall, send it into the wall instead
+        target = ball.centerx + aim * half
+    return steer(target - m.player_rect.centerx, 0, deadzone=4)
+
+def road_crosser_policy(m, rng):
+    p = m.player_rect
+
+    def danger(rect, ticks):
+        for lane in m.lanes:
+            for car in lane['cars']:
+                swept = car.union(car.move(lane['speed'] * ticks, 0))
+                if swept.colliderect(rect):
+                    return True
+        return False
+
+    # Step up only if the whole next lane stays clear while we cross it
+    ahead = pygame.Rect(p.x - 10, p.y - 85, p.width + 20, p.height + 85)
+    if not danger(ahead, 18):
+        return {pygame.K_UP}
+    if danger(p.inflate(20, 0), 8):
+        return {pygame.K_DOWN}
+    return set()
+
+def flappy_policy(m, rng):
+    p = m.player_rect
+    pipe = next((pipe for pipe in m.pipes if pipe['top'].right >= p.left), None)
+    floor = pipe['bottom'].top - 30 if pipe else SCREEN_HEIGHT // 2 + 60
+    # Jump when about to fall below the gap
+    if m.velocity >= 0 and p.bottom + m.velocity > floor:
+        return {pygame.K_SPACE}
+    return set()
+
+def boss_policy(m, rng):
+    p, boss = m.player_rect, m.boss_rect
+    target_y = boss.centery
+
+    # Get out of the boss's row when it charges or gets close
+    if m.boss_state == "FIST" or boss.left - p.right < 100:
+        target_y = boss.bottom + 60 if boss.centery < SCREEN_HEIGHT // 2 else boss.top - 60
+
+    # Sidestep projectiles on their way in
+    for projectile in m.projectiles:
+        r = projectile['rect']
+        if r.right > p.left - 10 and r.left - p.right < 160 and r.bottom > p.top - 15 and r.top < p.bottom + 15:
+            away = 70 if r.centery <= p.centery else -70
+            if not 40 < p.centery + away < SCREEN_HEIGHT - 40:
+                away = -away
+            target_y = p.centery + away
+            break
+
+    pressed = steer(130 - p.centerx, target_y - p.centery, deadzone=4)
+    pressed.add(pygame.K_SPACE) # The cooldown paces the shots
+    return pressed
+
+POLICIES = {
+    "BattleMinigame": battle_policy,
+    "RacingMinigame": racing_policy,
+    "PongMinigame": pong_policy,
+    "DodgeballMinigame": dodgeball_policy,
+    "TargetMinigame": target_policy,
+    "CoinMinigame": coin_policy,
+    "SnakeMinigame": snake_policy,
+    "SpaceShooterMinigame": space_shooter_policy,
+    "PacmanMinigame": pacman_policy,
+    "BlockBreakerMinigame": block_breaker_policy,
+    "RoadCrosserMinigame": road_crosser_policy,
+    "FlappyMinigame": flappy_policy,
+    "BossFightMinigame": boss_policy,
+}
+
+class Bot:
+    """ Plays whole boards unattended. Menus and the board get posted key (or button)
+    presses, minigames get their policy's keys - or a VirtualJoystick - in place of the
+    real input. A finished game goes back to the title and counts in games. """
+
+    def __init__(self, seed=None, players=1, joystick=False, stop_delay=(5, 40)):
+        self.rng = random.Random(seed)
+        self.players = players
+        self.joystick = VirtualJoystick() if joystick else None
+        self.stop_delay = stop_delay # Ticks the dice spins before the bot stops it
+        self.cooldown = 0
+        self.games = 0
+
+    def press(self, key):
+        if self.joystick:
+            event = pygame.event.Event(pygame.JOYBUTTONDOWN, button=0, instance_id=self.joystick.instance_id, joy=0)
+        else:
+            event = pygame.event.Event(pygame.KEYDOWN, key=key, mod=0, unicode="", scancode=0)
+        pygame.event.post(event)
+
+    def step(self, game):
+        # Called every tick before the game reads its input
+        if game.state == "GAME_OVER":
+            self.games += 1
+            game.enter_state("TITLE")
+            return
+        if self.cooldown > 0:
+            self.cooldown -= 1
+            return
+        if game.state == "TITLE":
+            if self.joystick:
+                self.press(None) # Button 0 is one player
+            else:
+                self.press(TITLE_KEYS.get(self.players, pygame.K_SPACE))
+            self.cooldown = 5
+        elif game.state == "BOARD":
+            if game.stars[game.turn] >= 14 or not game.rolling_dice:
+                self.press(pygame.K_SPACE) # Boss fight or roll
+                self.cooldown = self.rng.randint(*self.stop_delay)
+            elif not game.dice_stopped:
+                self.press(pygame.K_SPACE) # Stop the dice
+                self.cooldown = 5
+
+    def minigame_input(self, minigame):
+        # (keys, joystick) for minigame.handle_input
+        policy = POLICIES.get(type(minigame).__name__)
+        pressed = policy(minigame, self.rng) if policy else set()
+        if self.joystick:
+            self.joystick.set_from_keys(pressed)
+            return BotKeys(), self.joystick
+        return BotKeys(pressed), None
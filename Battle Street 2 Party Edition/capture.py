@@ -0,0 +1,226 @@
+import json
+import os
+import queue
+import sys
+import time
+from collections import deque
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1") # The encoder process imports pygame too
+import pygame
+from options import option, number_option
+
+# Slot layouts by the screen's red mask. Scaling into a slot is a straight copy with
+# no conversion, so the slots have to match the screen byte for byte.
+PIXEL_LAYOUTS = {
+    0xff0000: ((0xff0000, 0xff00, 0xff, 0), "bgr0"), # Masks, ffmpeg -pix_fmt for raw clips
+    0xff: ((0xff, 0xff00, 0xff0000, 0), "rgb0"),
+}
+
+def encode_loop(memory_name, size, masks, frames, freed):
+    # Encoder process: turns slots into files, hands each slot back once it is on disk
+    from multiprocessing import shared_memory
+    memory = shared_memory.SharedMemory(name=memory_name)
+    frame_bytes = size[0] * size[1] * 4
+    image = pygame.Surface(size, 0, 32, masks) # PNG frames are copied in here to be saved
+    clip = None
+    raw = None
+    written = 0
+    try:
+        while True:
+            message = frames.get()
+            if message is None:
+                break
+            if message[0] == "clip":
+                # ("clip", folder, format, fps)
+                if raw:
+                    raw.close()
+                    raw = None
+                clip, clip_format, fps = message[1:]
+                os.makedirs(clip, exist_ok=True)
+                with open(os.path.join(clip, "clip.json"), "w") as f:
+                    json.dump({"size": size, "pix_fmt": PIXEL_LAYOUTS[masks[0]][1], "fps": fps, "format": clip_format}, f)
+                if clip_format == "raw":
+                    raw = open(os.path.join(clip, "clip.raw"), "wb")
+                continue
+            _, slot, number = message
+            data = memory.buf[slot * frame_bytes:(slot + 1) * frame_bytes]
+            try:
+                if raw:
+                    raw.write(data)
+                elif clip:
+                    image.get_buffer().write(bytes(data))
+                    pygame.image.save(image, os.path.join(clip, f"{number:06d}.png"))
+                written += 1
+            except Exception as e:
+                print(f"Capture encoder: {e}")
+            del data
+            freed.put(slot)
+    finally:
+        if raw:
+            raw.close()
+        memory.close()
+        freed.put(("written", written))
+
+class FrameCapture:
+    """ Records gameplay clips to captures/ next to the game without holding up frames.
+    Each captured frame is scaled straight into one slot of a preallocated shared memory
+    ring (one C blit, no per-frame allocation), and only the slot number goes through a
+    bounded queue to an encoder process that writes PNG sequences or raw video. When the
+    encoder falls behind and no slot is free, the frame is dropped, never waited for.
+    Enabled by --capture or BS2_CAPTURE=1; F10 stops and starts clips.
+    --capture-format png|raw, --capture-scale (0.5), --capture-every (2: every other frame). """
+
+    def __init__(self, output_dir, fps, enabled=None, slots=8):
+        if enabled is None:
+            enabled = "--capture" in sys.argv or os.environ.get("BS2_CAPTURE") == "1"
+        self.enabled = enabled
+        self.output_dir = output_dir
+        self.format = option("--capture-format", "BS2_CAPTURE_FORMAT", "png")
+        self.scale = number_option("--capture-scale", "BS2_CAPTURE_SCALE", 0.5, float, minimum=0.01)
+        self.every = number_option("--capture-every", "BS2_CAPTURE_EVERY", 2, minimum=1)
+        self.fps = fps / self.every
+        self.slots = slots
+        self.recording = False
+        self.process = None
+        self.memory = None
+        self.pending_clip = None # Clip change still waiting for room in the queue
+
+        self.frame_number = 0 # Frames offered
+        self.clip_frames = 0
+        self.clips = 0 # Clips started this session, keeps folder names unique
+        self.captured = 0
+        self.dropped = 0
+        self.written = None
+        self.costs = deque(maxlen=600) # ms spent in frame() on captured frames
+        self.max_ms = 0.0
+
+    def start(self, screen):
+        # Allocates the ring for this screen size and starts the encoder and the first clip
+        if not self.enabled:
+            return
+        layout = PIXEL_LAYOUTS.get(screen.get_masks()[0]) if screen.get_bitsize() == 32 else None
+        if layout is None:
+            print("Capture disabled: needs a 32-bit screen")
+            self.enabled = False
+            return
+        import multiprocessing # Only with capture on: shared memory and a process are startup cost otherwise
+        from multiprocessing import shared_memory
+        self.masks = layout[0]
+        width, height = screen.get_size()
+        self.size = (max(1, int(width * self.scale)), max(1, int(height * self.scale)))
+        frame_bytes = self.size[0] * self.size[1] * 4
+        self.memory = shared_memory.SharedMemory(create=True, size=frame_bytes * self.slots)
+        # Surfaces over the shared memory, scaling into one writes the slot in place
+        layout = "BGRA" if self.masks[0] == 0xff0000 else "RGBA"
+        self.slot_surfaces = [pygame.image.frombuffer(self.memory.buf[i * frame_bytes:(i + 1) * frame_bytes], self.size, layout)
+                              for i in range(self.slots)]
+        self.free = deque(range(self.slots))
+        context = multiprocessing.get_context("spawn") # Not a fork of a process with SDL threads
+        self.frames = context.Queue(self.slots + 2)
+        self.freed = context.Queue()
+        self.process = context.Process(target=encode_loop, args=(self.memory.name, self.size, self.masks, self.frames, self.freed),
+                                       name="capture-encoder", daemon=True)
+        self.process.start()
+        print(f"Capture: {self.size[0]}x{self.size[1]} at {self.fps:.0f} fps, {self.format}")
+        self.start_clip()
+
+    def start_clip(self):
+        # F10 twice within a second must not reuse a folder: frames and clip.raw would be overwritten
+        stamp = time.strftime('%Y%m%d_%H%M%S')
+        while True:
+            self.clips += 1
+            clip = os.path.join(self.output_dir, f"clip_{stamp}_{self.clips}")
+            if not os.path.exists(clip):
+                break
+        # Never waits on a full queue: a stalled encoder must not stall the game loop. Until the
+        # clip change goes through, frames are dropped so none land in the previous clip.
+        self.pending_clip = ("clip", clip, self.format, self.fps)
+        self.send_clip()
+        self.clip_frames = 0
+        self.recording = True
+        print(f"Capturing to {clip}")
+
+    def send_clip(self):
+        try:
+            self.frames.put_nowait(self.pending_clip)
+        except queue.Full:
+            return False
+        self.pending_clip = None
+        return True
+
+    def toggle(self):
+        if not self.process:
+            return
+        if self.recording:
+            self.recording = False
+            print(f"Capture paused after {self.clip_frames} frames")
+        else:
+            self.start_clip()
+
+    def frame(self, screen):
+        # Called after each frame is drawn, before it is presented
+        if not self.recording:
+            return
+        self.frame_number += 1
+        if self.frame_number % self.every:
+            return
+        start = time.perf_counter()
+        while True:
+            try:
+                slot = self.freed.get_nowait()
+            except queue.Empty:
+                break
+            self.free.append(slot)
+        if not self.free or (self.pending_clip and not self.send_clip()):
+            self.dropped += 1
+            return
+        slot = self.free.popleft()
+        pygame.transform.scale(screen, self.size, self.slot_surfaces[slot])
+        try:
+            self.frames.put_nowait(("frame", slot, self.clip_frames + 1))
+        except queue.Full: # Only with the encoder stuck on a clip change
+            self.free.append(slot)
+            self.dropped += 1
+            return
+        self.clip_frames += 1
+        self.captured += 1
+        ms = (time.perf_counter() - start) * 1000
+        self.costs.append(ms)
+        self.max_ms = max(self.max_ms, ms)
+
+    def stop(self):
+        if not self.process:
+            return
+        try:
+            self.frames.put(None, timeout=2) # Quitting can wait a little, not forever on a dead encoder
+        except queue.Full:
+            self.process.terminate()
+        # Whatever is queued still gets written
+        deadline = time.perf_counter() + 10
+        while self.written is None and time.perf_counter() < deadline:
+            try:
+                message = self.freed.get(timeout=0.1)
+            except queue.Empty:
+                if not self.process.is_alive():
+                    break
+                continue
+            if isinstance(message, tuple):
+                self.written = message[1]
+        self.process.join(1)
+        self.process = None
+        self.recording = False
+        del self.slot_surfaces # They point into the shared memory
+        self.memory.close()
+        self.memory.unlink()
+        self.memory = None
+
+    def report(self):
+        if not self.enabled:
+            return
+        offered = self.captured + self.dropped
+        print(f"Capture: {self.captured} frames captured, {self.dropped} dropped"
+              f" ({self.dropped / offered * 100 if offered else 0:.1f}%), {self.written} written")
+        if self.costs:
+            costs = sorted(self.costs)
+            print(f"  overhead per captured frame: mean {sum(costs) / len(costs):.3f} ms, "
+                  f"p95 {costs[int(len(costs) * 0.95)]:.3f} ms, max {self.max_ms:.3f} ms")
@@ -0,0 +1,71 @@
+import os
+import time
+
+import pygame
+
+class FrameScheduler:
+    """ Replaces a fixed clock.tick(FPS). While nothing animates the loop blocks on
+    pygame.event.wait with a timeout, so any input wakes it straight back to full rate.
+    The event that woke it is kept for handle_input (take_events), ahead of anything
+    that arrived after it. """
+
+    ACTIVE = "ACTIVE" # Full FPS
+    LOW = "LOW" # Slow animation only (blinking prompts)
+    SLEEP = "SLEEP" # Static screen, redraw only on input or timeout
+
+    def __init__(self, clock, fps, low_fps=15, sleep_timeout_ms=1000, input_grace_frames=30, enabled=None):
+        if enabled is None:
+            enabled = os.environ.get("BS2_IDLE", "1") != "0"
+        self.enabled = enabled
+        self.clock = clock
+        self.fps = fps
+        self.low_timeout_ms = 1000 // low_fps
+        self.sleep_timeout_ms = sleep_timeout_ms
+        # Stay at full rate for a moment after input so menus feel snappy
+        self.input_grace_frames = input_grace_frames
+        self.grace = input_grace_frames
+
+        self.mode = self.ACTIVE
+        self.mode_time = {self.ACTIVE: 0.0, self.LOW: 0.0, self.SLEEP: 0.0}
+        self.last = time.perf_counter()
+        self.woken = [] # Event that ended a wait, not yet handled
+
+    def wake(self):
+        self.grace = self.input_grace_frames
+
+    def wait(self, mode):
+        if not self.enabled or self.grace > 0:
+            mode = self.ACTIVE
+        if self.grace > 0:
+            self.grace -= 1
+
+        if mode == self.ACTIVE:
+            self.clock.tick(self.fps)
+        else:
+            timeout = self.low_timeout_ms if mode == self.LOW else self.sleep_timeout_ms
+            event = pygame.event.wait(timeout)
+            if event.type != pygame.NOEVENT:
+                # Handed to handle_input first: posting it back would queue it behind
+                # newer events (a KEYUP could then come before its KEYDOWN)
+                self.woken.append(event)
+                self.wake()
+            self.clock.tick() # Keep the clock's frame time meaningful
+
+        self.mode = mode
+
+        # The whole frame (work + wait) is attributed to the mode it ended in
+        now = time.perf_counter()
+        self.mode_time[mode] += now - self.last
+        self.last = now
+
+    def take_events(self):
+        # Everything queued, in the order it happened
+        events = self.woken + pygame.event.get()
+        self.woken = []
+        return events
+
+    def report(self):
+        total = sum(self.mode_time.values()) or 1.0
+        print("Frame scheduler time per mode:")
+        for mode, seconds in self.mode_time.items():
+            print(f"  {mode:<7} {seconds:9.1f} s  ({seconds / total * 100:5.1f}%)")
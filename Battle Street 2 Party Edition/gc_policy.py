@@ -0,0 +1,75 @@
+import gc
+import os
+import time
+from collections import deque
+
+class GCPolicy:
+    """ Keeps the cyclic garbage collector out of minigames. Everything alive after startup is
+    frozen (never scanned again), full collections are held off while a minigame runs, and
+    the backlog is collected when play returns to the board, under the crossfade.
+    Pauses are timed through gc.callbacks. BS2_GC=0 leaves the collector alone (still timed). """
+
+    def __init__(self, enabled=None, minigame_threshold2=1000):
+        if enabled is None:
+            enabled = os.environ.get("BS2_GC", "1") != "0"
+        self.enabled = enabled
+        self.minigame_threshold2 = minigame_threshold2 # Gen 2 runs after this many gen 1 runs
+        self.saved_threshold = None
+        self.state = None
+
+        self.started = None
+        self.frame_pause = 0.0 # Seconds spent collecting since the last take_frame_pause()
+        self.pauses = deque(maxlen=600) # (generation, ms, state)
+        self.collections = [0, 0, 0]
+        self.max_ms = [0.0, 0.0, 0.0]
+        gc.callbacks.append(self.on_gc)
+
+    def on_gc(self, phase, info):
+        if phase == "start":
+            self.started = time.perf_counter()
+        elif self.started is not None:
+            seconds = time.perf_counter() - self.started
+            self.started = None
+            generation = info["generation"]
+            self.frame_pause += seconds
+            self.collections[generation] += 1
+            self.max_ms[generation] = max(self.max_ms[generation], seconds * 1000)
+            self.pauses.append((generation, seconds * 1000, self.state))
+
+    def startup_done(self):
+        # Fonts, sprites, tables and modules live for the whole session
+        if not self.enabled:
+            return
+        gc.collect()
+        gc.freeze()
+        print(f"GC: froze {gc.get_freeze_count()} startup objects")
+
+    def frame(self, state):
+        # Called once per frame with the game state, acts on changes
+        if state == self.state:
+            return
+        previous = self.state
+        self.state = state
+        if not self.enabled:
+            return
+        if state == "MINIGAME":
+            self.saved_threshold = gc.get_threshold()
+            gc.set_threshold(self.saved_threshold[0], self.saved_threshold[1], self.minigame_threshold2)
+        elif previous == "MINIGAME" and self.saved_threshold:
+            gc.set_threshold(*self.saved_threshold)
+            self.saved_threshold = None
+        if state == "BOARD":
+            gc.collect()
+
+    def take_frame_pause(self):
+        seconds = self.frame_pause
+        self.frame_pause = 0.0
+        return seconds
+
+    def report(self):
+        print("GC pauses:")
+        for generation in range(3):
+            print(f"  gen {generation}: {self.collections[generation]:6d} collections, max {self.max_ms[generation]:6.2f} ms")
+        in_minigame = [ms for generation, ms, state in self.pauses if state == "MINIGAME"]
+        if in_minigame:
+            print(f"  in minigames (recent): {len(in_minigame)} pauses, max {max(in_minigame):.2f} ms")
@@ -0,0 +1,94 @@
+import pygame
+
+# Rasterized up front; anything else is added the first time it shows up
+CHARSET = "".join(chr(c) for c in range(32, 127))
+
+class GlyphAtlas:
+    """ One font's glyphs rasterized once, in white; each color gets tinted copies. A string
+    is drawn as one blits() call of its glyphs, so HUD values that change every frame or
+    second never go through font.render. Glyph positions come from font.size on the
+    string's prefixes, which only runs the layout (kerning included) and matches
+    font.render exactly; they are cached per string, and HUD values keep repeating.
+    Glyphs are RLE encoded: they are mostly fully clear or fully opaque, so a composed
+    string blits faster than a rendered one. """
+
+    def __init__(self, font, antialias=True, charset=CHARSET):
+        self.font = font
+        self.antialias = antialias
+        self.height = font.get_height()
+        self.glyphs = {} # char -> white glyph
+        self.colors = {} # color -> {char: tinted glyph}
+        self.layouts = {} # text -> (glyph x positions, width)
+        self.draws = {} # (text, color, pos) -> (blits() sequence, rect), HUD values sit in fixed places
+        for ch in charset:
+            self.add(ch)
+
+    def add(self, ch):
+        rendered = self.font.render(ch, self.antialias, (255, 255, 255))
+        glyph = pygame.Surface(rendered.get_size(), pygame.SRCALPHA)
+        # Antialiased glyphs carry coverage in alpha and are copied as is; the others are colorkeyed
+        glyph.blit(rendered, (0, 0), special_flags=pygame.BLEND_RGBA_MAX if self.antialias else 0)
+        if pygame.display.get_surface() is not None:
+            glyph = glyph.convert_alpha()
+        self.glyphs[ch] = glyph
+        return glyph
+
+    def colored(self, color):
+        # Glyphs are tinted as a color first uses them (or by warm())
+        glyphs = self.colors.get(color)
+        if glyphs is None:
+            glyphs = self.colors[color] = {}
+        return glyphs
+
+    def warm(self, color, chars):
+        # Tint ahead of time, e.g. during the splash, so the first frames don't
+        glyphs = self.colored(color)
+        for ch in chars:
+            if ch not in glyphs:
+                self.tint(glyphs, ch, color)
+
+    def tint(self, glyphs, ch, color):
+        white = self.glyphs.get(ch) or self.add(ch)
+        glyph = glyphs[ch] = white.copy()
+        glyph.fill(color, special_flags=pygame.BLEND_RGBA_MULT) # Same pixels as rendering in color
+        glyph.set_alpha(255, pygame.RLEACCEL)
+        return glyph
+
+    def layout(self, text):
+        layout = self.layouts.get(text)
+        if layout is None:
+            if len(self.layouts) > 256: # Bounded, like Game.render_text
+                self.layouts.clear()
+            size = self.font.size
+            # A prefix ends where its last glyph does
+            positions = [size(text[:i + 1])[0] - size(ch)[0] for i, ch in enumerate(text)]
+            layout = self.layouts[text] = (positions, size(text)[0] if text else 0)
+        return layout
+
+    def size(self, text):
+        return (self.layout(text)[1], self.height)
+
+    def draw(self, surface, text, color, pos):
+        # Returns the rect drawn, like a blit
+        key = (text, color, pos)
+        entry = self.draws.get(key)
+        if entry is None:
+            if len(self.draws) > 256:
+                self.draws.clear()
+            positions, width = self.layout(text)
+            glyphs = self.colored(color)
+            x, y = pos
+            entry = self.draws[key] = ([(glyphs.get(ch) or self.tint(glyphs, ch, color), (x + offset, y))
+                                        for ch, offset in zip(text, positions)], pygame.Rect(x, y, width, self.height))
+        surface.blits(entry[0], doreturn=False)
+        return entry[1].copy()
+
+_glyphs = {}
+
+def get_glyphs(font, antialias=True):
+    # Shared by everything drawing with the same font, built on first use
+    key = (font, antialias)
+    glyphs = _glyphs.get(key)
+    if glyphs is None:
+        glyphs = _glyphs[key] = GlyphAtlas(font, antialias)
+    return glyphs
@@ -0,0 +1,171 @@
+import os
+import random
+import sys
+import threading
+import time
+from collections import deque
+
+import pygame
+from options import option
+
+# Events that count as player input
+INPUT_EVENTS = (pygame.KEYDOWN, pygame.JOYBUTTONDOWN, pygame.JOYHATMOTION, pygame.MOUSEBUTTONDOWN)
+
+# Histogram bucket upper edges in ms, the last bucket is everything above
+LATENCY_BUCKETS_MS = (4, 8, 12, 17, 25, 33, 50, 67, 100, 150)
+
+class LatencyHistogram:
+    def __init__(self, buckets=LATENCY_BUCKETS_MS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.samples = deque(maxlen=2000) # Recent samples for percentiles
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, ms):
+        i = 0
+        while i < len(self.buckets) and ms > self.buckets[i]:
+            i += 1
+        self.counts[i] += 1
+        self.samples.append(ms)
+        self.count += 1
+        self.total += ms
+
+    def percentile(self, p):
+        samples = sorted(self.samples)
+        return samples[min(len(samples) - 1, int(len(samples) * p))]
+
+    def summary(self):
+        return (f"n={self.count:<5} avg {self.total / self.count:6.1f}  p50 {self.percentile(0.5):6.1f}  "
+                f"p95 {self.percentile(0.95):6.1f}  max {max(self.samples):6.1f}")
+
+    def bars(self, width=30):
+        peak = max(self.counts)
+        lines = []
+        for i, count in enumerate(self.counts):
+            if not count:
+                continue
+            edge = f"<={self.buckets[i]}" if i < len(self.buckets) else f">{self.buckets[-1]}"
+            lines.append(f"{edge:>6} {'#' * max(1, count * width // peak):<{width}} {count}")
+        return lines
+
+class LatencyTracker:
+    """ Follows input events from Game.handle_input through the update that consumes them
+    to the flip that shows the result, with histograms per state or minigame.
+    Enabled with --latency or BS2_LATENCY=1 (and by --latency-test). """
+
+    def __init__(self, enabled=None):
+        if enabled is None:
+            enabled = ("--latency" in sys.argv or "--latency-test" in sys.argv
+                       or os.environ.get("BS2_LATENCY") == "1")
+        self.enabled = enabled
+        self.pending = [] # (stamp, label) read this frame, waiting for update
+        self.consumed = [] # (stamp, label) updated, waiting for a flip
+        self.update_histograms = {} # label -> input to end of update
+        self.flip_histograms = {} # label -> input to flip
+        self.lock = threading.Lock() # flips may be reported from the render thread
+
+    def track(self, events, label):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        for event in events:
+            if event.type in INPUT_EVENTS:
+                # Synthetic events carry the time they "happened", real ones are stamped when read
+                self.pending.append((getattr(event, "latency_stamp", now), label))
+
+    def updated(self):
+        # The update after handle_input has consumed everything pending
+        if not self.pending:
+            return
+        now = time.perf_counter()
+        with self.lock:
+            for stamp, label in self.pending:
+                self.histogram(self.update_histograms, label).add((now - stamp) * 1000)
+        self.consumed.extend(self.pending)
+        self.pending = []
+
+    def take_presentable(self):
+        # Inputs the frame being drawn now responds to
+        consumed = self.consumed
+        self.consumed = []
+        return consumed
+
+    def presented(self, inputs):
+        if not inputs:
+            return
+        now = time.perf_counter()
+        with self.lock:
+            for stamp, label in inputs:
+                self.histogram(self.flip_histograms, label).add((now - stamp) * 1000)
+
+    def histogram(self, histograms, label):
+        histogram = histograms.get(label)
+        if histogram is None:
+            histogram = histograms[label] = LatencyHistogram()
+        return histogram
+
+    def report(self, mode):
+        if not self.enabled or not self.flip_histograms:
+            return
+        print(f"Input latency ({mode}), ms:")
+        with self.lock:
+            for label in sorted(self.flip_histograms):
+                print(f"  {label}")
+                updated = self.update_histograms.get(label)
+                if updated:
+                    print(f"    to update {updated.summary()}")
+                flipped = self.flip_histograms[label]
+                print(f"    to flip   {flipped.summary()}")
+                for line in flipped.bars():
+                    print(f"      {line}")
+
+class LatencyProbe:
+    """ --latency-test: drives the game through a fixed scenario and injects synthetic key
+    presses with known timestamps, then quits. Runs headless with the dummy video driver. """
+
+    def __init__(self, minigames=None, seconds=3.0, interval_ms=(30, 120), key=pygame.K_LSHIFT, seed=1234):
+        # Default covers the board plus the games players complain about
+        self.phases = [("TITLE", None), ("BOARD", None)]
+        for name in minigames or ["RacingMinigame", "FlappyMinigame"]:
+            self.phases.append(("MINIGAME", name))
+        self.seconds = seconds
+        self.interval_ms = interval_ms
+        self.key = key # Harmless key, the measurement is about the pipeline not the response
+        self.rng = random.Random(seed)
+        self.phase = -1
+        self.phase_end = 0.0
+        self.next_event = None
+
+    @staticmethod
+    def requested():
+        return "--latency-test" in sys.argv
+
+    @staticmethod
+    def minigames_from_argv():
+        # --latency-test RacingMinigame,PongMinigame
+        names = option("--latency-test")
+        return names.split(",") if names else None
+
+    def step(self, game):
+        # Called once per loop iteration before input is read
+        if game.state == "SPLASH":
+            return # Measured too, it ends on its own
+        now = time.perf_counter()
+        if now >= self.phase_end:
+            self.phase += 1
+            if self.phase >= len(self.phases):
+                game.running = False
+                return
+            state, minigame = self.phases[self.phase]
+            game.enter_state(state, minigame)
+            self.phase_end = now + self.seconds
+            self.next_event = now
+        if now >= self.next_event:
+            # Stamped with when it was due: it "arrived" while the loop was waiting,
+            # like a real press between frames
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=self.key, mod=0, unicode="", scancode=0,
+                                                 latency_stamp=self.next_event))
+            self.next_event += self.rng.uniform(*self.interval_ms) / 1000
+            if self.next_event < now:
+                self.next_event = now
@@ -1,9 +1,36 @@
+from startup_trace import StartupTrace
+STARTUP = StartupTrace() # Created first so the pygame import is part of the trace
+
 import pygame
 import sys
 import random
 import os
 import json
-from minigames import BattleMinigame, RacingMinigame, PongMinigame, DodgeballMinigame, TargetMinigame, CoinMinigame, BossFightMinigame, SnakeMinigame, SpaceShooterMinigame, PacmanMinigame, BlockBreakerMinigame, RoadCrosserMinigame, FlappyMinigame
+import importlib
+import time
+# minigames is imported on demand (warm-up or first roll), see minigame_class()
+from sprites import get_atlas
+from transitions import Transitions
+from assets import AssetManager
+from starfield import warm_starfield
+from glyphs import get_glyphs
+from warmup import WarmupScheduler
+from frame_scheduler import FrameScheduler
+from render_thread import RenderThread
+from latency import LatencyTracker, LatencyProbe
+from profiling import SceneProfiler
+from gc_policy import GCPolicy
+from telemetry import TelemetrySink
+import snapshot
+from scoreboard import Scoreboard
+import audio
+from capture import FrameCapture
+from replay import InstantReplay
+from spectator import SpectatorFeed
+from quality import QualityGovernor, QUALITY_TIERS
+from options import option, number_option
+
+STARTUP.mark("imports")
 
 # Constants
 SCREEN_WIDTH = 800
@@ -22,6 +49,44 @@ ORANGE = (255, 165, 0)
 GREY = (100, 100, 100)
 GOLD = (255, 215, 0)
 
+PLAYER_COLORS = [BLUE, RED, GREEN, YELLOW]
+
+HIGH_SCORE_PAGE = 10 # Rows per page on the high score screen
+
+# Dice value -> minigame shown on the board
+MINIGAME_NAMES = {
+    1: "BATTLE ARENA",
+    2: "RACING",
+    3: "PONG",
+    4: "DODGEBALL",
+    5: "TARGET PRACTICE",
+    6: "COIN COLLECTOR",
+    # Expansion Games
+    7: "SNAKE",
+    8: "SPACE SHOOTER",
+    9: "PAC-MAN",
+    10: "BLOCK BREAKER",
+    11: "ROAD CROSSER",
+    12: "FLAPPY BIRD",
+}
+
+# Dice value -> class in minigames.py
+MINIGAME_CLASSES = {
+    1: "BattleMinigame",
+    2: "RacingMinigame",
+    3: "PongMinigame",
+    4: "DodgeballMinigame",
+    5: "TargetMinigame",
+    6: "CoinMinigame",
+    # Expansion Games
+    7: "SnakeMinigame",
+    8: "SpaceShooterMinigame",
+    9: "PacmanMinigame",
+    10: "BlockBreakerMinigame",
+    11: "RoadCrosserMinigame",
+    12: "FlappyMinigame",
+}
+
 class GameState:
     SPLASH = "SPLASH"
     TITLE = "TITLE"
@@ -29,34 +94,87 @@ class GameState:
     MINIGAME = "MINIGAME"
     GAME_OVER = "GAME_OVER"
     EXPANSION_MENU = "EXPANSION_MENU"
+    HIGH_SCORES = "HIGH_SCORES"
 
 class Game:
     def __init__(self):
-        pygame.init()
-        pygame.joystick.init()
+        # Only what the splash needs; joysticks, clipboard and most fonts start later
+        with STARTUP.phase("display init"):
+            pygame.display.init()
+            pygame.font.init()
         
         # Update dimensions to actual fullscreen size
         global SCREEN_WIDTH, SCREEN_HEIGHT
-        self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-        SCREEN_WIDTH, SCREEN_HEIGHT = self.screen.get_size()
+        with STARTUP.phase("set_mode"):
+            self.screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+            SCREEN_WIDTH, SCREEN_HEIGHT = self.screen.get_size()
         
-        pygame.scrap.init() # Initialize clipboard support
+        # Optional pipelined presentation: everything draws to an offscreen canvas
+        # and the render thread does the display blit and flip
+        self.latency = LatencyTracker()
+        self.latency_probe = LatencyProbe(LatencyProbe.minigames_from_argv()) if LatencyProbe.requested() else None
+        self.display = self.screen
+        self.render_thread = None
+        if RenderThread.requested():
+            self.render_thread = RenderThread(self.display, on_present=self.latency.presented)
+            self.screen = self.render_thread.canvas
+            self.render_thread.start()
+        
+        self.clipboard_ready = False # Initialized on first copy/paste in the expansion menu
         
         pygame.display.set_caption("Battle Street 2: Party Edition")
+        
+        # Start decoding the studio logo, the splash shows it once it is ready
+        with STARTUP.phase("asset requests"):
+            self.assets = AssetManager(self.resource_path, self.get_external_path)
+            self.logo_files = self.assets.list_images("studio_logo")
+            if self.logo_files:
+                self.assets.request_image(self.logo_files[0], max_width=400)
+            self.audio = audio.AudioManager(self.assets) # Opens the device during the warm-up
+        
         self.clock = pygame.time.Clock()
+        self.load_render_fps()
+        self.scheduler = FrameScheduler(self.clock, self.render_fps)
+        self.load_quality_config()
+        self.show_debug = "--debug" in sys.argv # F3 toggles
+        self.profiler = SceneProfiler(self.get_external_path("profiles")) # F9 toggles
+        self.gc_policy = GCPolicy()
+        self.capture = FrameCapture(self.get_external_path("captures"), self.render_fps) # F10 pauses/resumes
+        self.capture.start(self.screen)
+        self.replay = InstantReplay()
+        self.spectator = SpectatorFeed()
+        self.spectator.start(self.screen)
+        self.telemetry = TelemetrySink(self.get_external_path("telemetry"))
+        self.telemetry.session_start(self)
+        self.resume = snapshot.ResumeStore(self.get_external_path("resume.snapshot"))
+        self.quicksave = None # F5 takes a snapshot, F8 rolls back to it
+        self.bot = None # bots.Bot plays instead of the keyboard, see --bot
         self.running = True
         self.state = GameState.SPLASH
         
-        self.font = pygame.font.Font(None, 74)
-        self.small_font = pygame.font.Font(None, 36)
-        self.tiny_font = pygame.font.Font(None, 24)
+        # Fonts load on first use
+        self.fonts = {}
+        
+        # Pre-rendered sprites (players, dice faces, minigame shapes)
+        self.atlas = get_atlas()
+        
+        # Rendered text that never changes (menus, splash)
+        self.text_cache = {}
+        self.boss_banner = None # (antialias, surface): the board's own copy, faded every frame
+        
+        # Fades and crossfades between states
+        self.transitions = Transitions(self.screen)
+        self.transitions.set_crossfade(GameState.TITLE, GameState.BOARD, 20)
+        self.transitions.set_crossfade(GameState.BOARD, GameState.MINIGAME, 20)
+        self.transitions.set_crossfade(GameState.MINIGAME, GameState.BOARD, 20)
+        self.transitions.set_crossfade(GameState.TITLE, GameState.EXPANSION_MENU, 10)
+        self.transitions.set_crossfade(GameState.EXPANSION_MENU, GameState.TITLE, 10)
+        self.transitions.set_crossfade(GameState.TITLE, GameState.HIGH_SCORES, 10)
+        self.transitions.set_crossfade(GameState.HIGH_SCORES, GameState.TITLE, 10)
+        self.drawn_state = self.state
         
-        # Controllers
+        # Controllers (opened during the splash warm-up)
         self.joysticks = {}
-        for x in range(pygame.joystick.get_count()):
-            joy = pygame.joystick.Joystick(x)
-            joy.init()
-            self.joysticks[joy.get_instance_id()] = joy
             
         # Game Data
         self.dice_value = 0
@@ -85,11 +203,112 @@ class Game:
         self.turn = 0 # 0 = P1, 1 = P2, 2 = P3, 3 = P4
         self.stars = [0, 0, 0, 0] # Up to 4 players
         
+        # High Scores Data
+        self.scores = Scoreboard(self.get_external_path("scores.db"))
+        self.high_score_index = 0 # Minigame shown, dice value - 1
+        self.high_score_cursors = [None] # (score, id) each shown page starts after
+        self.high_score_rows = []
+        
         # Splash Data
         self.splash_timer = 0
         self.splash_duration = 180 # 3 seconds
         self.splash_alpha = 255
-        self.splash_image = self.load_studio_logo()
+        self.splash_image = None # Filled in by draw_splash when the decode finishes
+        
+        # Warm caches while the splash screen is up
+        self.warmup = WarmupScheduler()
+        self.warmup.add("fonts", self.load_fonts)
+        self.warmup.add("joysticks", self.init_joysticks)
+        self.warmup.add("minigame modules", lambda: importlib.import_module("minigames"))
+        self.warmup.add("sprite atlas", lambda: self.atlas.build_all(PLAYER_COLORS, self.expansion_enabled))
+        self.warmup.add("starfields", self.warm_starfields)
+        self.warmup.add("menu text", self.prerender_menu_text)
+        self.warmup.add("board text", self.prerender_board_text)
+        self.warmup.add("hud glyphs", self.warm_glyphs)
+        self.warmup.add("audio", self.audio.preload)
+
+        STARTUP.mark("game data")
+
+    def get_font(self, size):
+        font = self.fonts.get(size)
+        if font is None:
+            font = self.fonts[size] = pygame.font.Font(None, size)
+        return font
+
+    @property
+    def font(self):
+        return self.get_font(74)
+
+    @property
+    def small_font(self):
+        return self.get_font(36)
+
+    @property
+    def tiny_font(self):
+        return self.get_font(24)
+
+    def load_fonts(self):
+        self.font
+        self.small_font
+        self.tiny_font
+        self.atlas.font = self.font # Dice faces 7-12
+
+    def ensure_clipboard(self):
+        if not self.clipboard_ready:
+            pygame.scrap.init() # Initialize clipboard support
+            self.clipboard_ready = True
+
+    def minigame_class(self, name):
+        # First call imports minigames.py (normally already done by the warm-up)
+        return getattr(importlib.import_module("minigames"), name)
+
+    def create_minigame(self, dice_value):
+        return self.minigame_class(MINIGAME_CLASSES[dice_value])(self.screen, self.font, self.turn + 1)
+
+    def init_joysticks(self):
+        pygame.joystick.init()
+        for x in range(pygame.joystick.get_count()):
+            joy = pygame.joystick.Joystick(x)
+            joy.init()
+            self.joysticks[joy.get_instance_id()] = joy
+
+    def prerender_menu_text(self):
+        # Drawn into the back buffer only, the splash frame overwrites it before the flip
+        self.draw_title()
+        yield
+        self.draw_expansion_menu()
+        yield
+        self.render_text(self.small_font, "EXPANSION PACK ACTIVATED!", GREEN)
+        self.render_text(self.small_font, "INVALID CODE", RED)
+
+    def prerender_board_text(self):
+        for i, color in enumerate(PLAYER_COLORS):
+            self.render_text(self.font, f"Player {i + 1}'s Turn", color)
+            self.render_text(self.tiny_font, f"Current Mode: {i + 1} Player(s)", WHITE)
+            yield
+        for text, font, color in [("Roll the Dice!", self.small_font, GREEN), ("Press Space/A to Fight!", self.small_font, WHITE)]:
+            self.render_text(font, text, color)
+        self.boss_banner_text()
+        yield
+        for name in MINIGAME_NAMES.values():
+            self.render_text(self.small_font, name, YELLOW)
+
+    def warm_starfields(self):
+        # Every tier's, so a quality change in Space Shooter or the Boss fight only switches
+        for tier in self.quality.tiers:
+            yield from warm_starfield(self.screen.get_size(), tier["star_density"], tier["star_layers"], like=self.screen)
+
+    def warm_glyphs(self):
+        # Changing HUD values: minigame scores, timers and lives, the board star counters
+        antialias = self.quality.tier["antialias"]
+        for font, colors, chars in [(self.font, (WHITE, RED, BLACK), "Score: Time: Lives: HP: 0123456789/"),
+                                    (self.small_font, PLAYER_COLORS, "P Stars: 0123456789/"),
+                                    (self.tiny_font, PLAYER_COLORS, "P: 0123456789")]:
+            glyphs = get_glyphs(font, antialias)
+            yield
+            for color in colors:
+                glyphs.warm(color, chars)
+                yield
 
     def get_external_path(self, filename):
         if getattr(sys, 'frozen', False):
@@ -118,6 +337,40 @@ class Game:
         
         self.current_minigame = None
         
+    def load_render_fps(self):
+        # --render-fps 144 or BS2_RENDER_FPS=144. The simulation always steps at FPS;
+        # above that, frames in between ticks draw minigames at interpolated positions
+        self.render_fps = max(FPS, number_option("--render-fps", "BS2_RENDER_FPS", FPS))
+        self.interpolate = self.render_fps > FPS
+        self.render_alpha = 1.0
+        if self.interpolate:
+            print(f"Rendering at {self.render_fps} fps, simulating at {FPS}")
+
+    def load_quality_config(self):
+        # Optional quality.json next to the game, e.g.
+        # {"adaptive": true, "start_tier": "HIGH", "window": 60, "tiers": [...]}
+        config = {}
+        config_path = self.get_external_path("quality.json")
+        if os.path.exists(config_path):
+            try:
+                with open(config_path, "r") as f:
+                    config = json.load(f)
+                    print(f"Quality config loaded from {config_path}")
+            except Exception as e:
+                print(f"Error loading quality config: {e}")
+                config = {}
+        
+        tiers = config.get("tiers", QUALITY_TIERS)
+        names = [tier["name"] for tier in tiers]
+        start_tier = config.get("start_tier", names[0])
+        self.quality = QualityGovernor(
+            self.render_fps,
+            tiers,
+            window=config.get("window", 60),
+            enabled=config.get("adaptive", True),
+            start_tier=names.index(start_tier) if start_tier in names else 0,
+        )
+
     def save_expansion_config(self):
         config_path = self.get_external_path("expansion.json")
         try:
@@ -137,21 +390,32 @@ class Game:
 
         return os.path.join(base_path, relative_path)
 
+    def render_text(self, font, text, color, antialias=None):
+        if antialias is None:
+            antialias = self.quality.tier["antialias"]
+        key = (font, text, color, antialias)
+        surf = self.text_cache.get(key)
+        if surf is None:
+            if len(self.text_cache) > 256: # Keep it bounded if callers pass changing text
+                self.text_cache.clear()
+            surf = self.text_cache[key] = font.render(text, antialias, color)
+        return surf
+
+    def boss_banner_text(self):
+        # Not from render_text: the board fades it every frame, and cached surfaces are
+        # shared, so they must keep their alpha
+        antialias = self.quality.tier["antialias"]
+        if self.boss_banner is None or self.boss_banner[0] != antialias:
+            self.boss_banner = (antialias, self.font.render("BOSS UNLOCKED!", antialias, RED))
+        return self.boss_banner[1]
+
     def load_studio_logo(self):
-        logo_dir = self.resource_path("studio_logo")
-        if os.path.exists(logo_dir):
-            files = os.listdir(logo_dir)
-            images = [f for f in files if f.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp'))]
-            if images:
-                try:
-                    img = pygame.image.load(os.path.join(logo_dir, images[0]))
-                    # Scale to fit reasonably if too big
-                    if img.get_width() > 400:
-                        scale = 400 / img.get_width()
-                        img = pygame.transform.scale(img, (int(img.get_width()*scale), int(img.get_height()*scale)))
-                    return img
-                except:
-                    pass
+        if self.logo_files and self.assets.image_ready(self.logo_files[0], max_width=400):
+            try:
+                # Decoded on the asset pool, scaled copy comes from the disk cache after the first launch
+                return self.assets.get_image(self.logo_files[0], max_width=400)
+            except Exception as e:
+                print(f"Error loading studio logo: {e}")
         return None
         
         # Continuous input for minigame
@@ -170,16 +434,31 @@ class Game:
         active_joystick = next(iter(self.joysticks.values())) if self.joysticks else None
         
         try:
-            events = pygame.event.get()
+            events = self.scheduler.take_events()
         except Exception as e:
             print(f"Warning: Event error ignored: {e}")
             return
+        
+        if events:
+            self.scheduler.wake()
+            self.latency.track(events, self.scene_label())
 
         for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
             elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                  self.running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                 self.show_debug = not self.show_debug
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F9:
+                 self.profiler.toggle(self.scene_label())
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F10:
+                 self.capture.toggle()
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F5 and self.state in snapshot.RESUMABLE_STATES:
+                 self.quicksave = snapshot.take(self)
+                 print(f"Snapshot taken ({len(self.quicksave)} bytes)")
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_F8 and self.quicksave:
+                 snapshot.restore(self, self.quicksave)
 
             # Handle Controller Hotplugging
             if event.type == pygame.JOYDEVICEADDED:
@@ -215,6 +494,8 @@ class Game:
                         self.state = GameState.EXPANSION_MENU
                         self.expansion_code = ""
                         self.expansion_message = ""
+                    elif event.key == pygame.K_h:
+                        self.open_high_scores()
                         
                 elif event.type == pygame.JOYBUTTONDOWN:
                     if event.button == 0: # A / Cross (1P)
@@ -238,12 +519,40 @@ class Game:
                          self.state = GameState.EXPANSION_MENU
                          self.expansion_code = ""
                          self.expansion_message = ""
+                    elif event.button == 8 or event.button == 6: # Back/Select/Share
+                         self.open_high_scores()
 
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     self.state = GameState.BOARD
                     self.num_players = 1
                     self.reset_game_data()
             
+            elif self.state == GameState.HIGH_SCORES:
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_b or event.key == pygame.K_BACKSPACE:
+                        self.state = GameState.TITLE
+                    elif event.key == pygame.K_LEFT:
+                        self.change_high_score_game(-1)
+                    elif event.key == pygame.K_RIGHT:
+                        self.change_high_score_game(1)
+                    elif event.key == pygame.K_DOWN:
+                        self.next_high_score_page()
+                    elif event.key == pygame.K_UP:
+                        self.previous_high_score_page()
+                elif event.type == pygame.JOYBUTTONDOWN:
+                    if event.button == 1: # B / Circle - Back
+                         self.state = GameState.TITLE
+                elif event.type == pygame.JOYHATMOTION:
+                    hat = event.value
+                    if hat[0] == -1:
+                         self.change_high_score_game(-1)
+                    elif hat[0] == 1:
+                         self.change_high_score_game(1)
+                    elif hat[1] == -1:
+                         self.next_high_score_page()
+                    elif hat[1] == 1:
+                         self.previous_high_score_page()
+            
             elif self.state == GameState.EXPANSION_MENU:
                 if event.type == pygame.KEYDOWN:
                     if event.key == pygame.K_ESCAPE or event.key == pygame.K_b:
@@ -273,6 +582,7 @@ class Game:
                     # Copy Support (Ctrl+C / Cmd+C)
                     elif event.key == pygame.K_c and (event.mod & pygame.KMOD_CTRL or event.mod & pygame.KMOD_META):
                         try:
+                            self.ensure_clipboard()
                             text_to_copy = self.expansion_code
                             if text_to_copy:
                                 pygame.scrap.put(pygame.SCRAP_TEXT, text_to_copy.encode('utf-8'))
@@ -283,6 +593,7 @@ class Game:
                     # Paste Support (Ctrl+V / Cmd+V)
                     elif event.key == pygame.K_v and (event.mod & pygame.KMOD_CTRL or event.mod & pygame.KMOD_META):
                         try:
+                            self.ensure_clipboard()
                             # Try multiple formats for better compatibility
                             content = None
                             # Standard text
@@ -387,8 +698,11 @@ class Game:
         # Continuous input for minigame
         if self.state == GameState.MINIGAME and self.current_minigame:
             # Re-fetch input for minigame loop
-            keys = pygame.key.get_pressed()
-            active_joystick = next(iter(self.joysticks.values())) if self.joysticks else None
+            if self.bot:
+                keys, active_joystick = self.bot.minigame_input(self.current_minigame)
+            else:
+                keys = pygame.key.get_pressed()
+                active_joystick = next(iter(self.joysticks.values())) if self.joysticks else None
             self.current_minigame.handle_input(keys, active_joystick)
 
     def handle_keypad_press(self):
@@ -428,9 +742,38 @@ class Game:
         self.dice_stopped = False
         self.dice_jump_timer = 0
 
+    def open_high_scores(self):
+        self.state = GameState.HIGH_SCORES
+        self.scores.flush() # So the game that just ended is listed
+        self.high_score_cursors = [None]
+        self.load_high_score_page()
+
+    def change_high_score_game(self, step):
+        self.high_score_index = (self.high_score_index + step) % len(MINIGAME_CLASSES)
+        self.high_score_cursors = [None]
+        self.load_high_score_page()
+
+    def load_high_score_page(self):
+        minigame = MINIGAME_CLASSES[self.high_score_index + 1]
+        self.high_score_rows = self.scores.top(minigame, HIGH_SCORE_PAGE, self.high_score_cursors[-1])
+
+    def next_high_score_page(self):
+        if len(self.high_score_rows) < HIGH_SCORE_PAGE:
+            return # Already the last page
+        row_id, score = self.high_score_rows[-1][:2]
+        rows = self.scores.top(MINIGAME_CLASSES[self.high_score_index + 1], HIGH_SCORE_PAGE, (score, row_id))
+        if rows:
+            self.high_score_cursors.append((score, row_id))
+            self.high_score_rows = rows
+
+    def previous_high_score_page(self):
+        if len(self.high_score_cursors) > 1:
+            self.high_score_cursors.pop()
+            self.load_high_score_page()
+
     def start_boss_fight(self):
         self.state = GameState.MINIGAME
-        self.current_minigame = BossFightMinigame(self.screen, self.font, self.turn + 1)
+        self.current_minigame = self.minigame_class("BossFightMinigame")(self.screen, self.font, self.turn + 1)
 
     def start_dice_roll(self):
         self.rolling_dice = True
@@ -445,8 +788,16 @@ class Game:
             
         if self.state == GameState.SPLASH:
             self.splash_timer += 1
+            self.warmup.step()
             if self.splash_timer > self.splash_duration:
+                 # Anything that did not fit runs now so TITLE starts warm
+                 self.warmup.finish()
+                 self.warmup.report()
+                 self.gc_policy.startup_done()
                  self.state = GameState.TITLE
+                 data = self.resume.load()
+                 if data and snapshot.restore(self, data):
+                     print(f"Resumed {self.scene_label()} for player {self.turn + 1}")
         
         elif self.state == GameState.EXPANSION_MENU:
             if self.expansion_message_timer > 0:
@@ -462,6 +813,7 @@ class Game:
                     if self.dice_timer % 5 == 0: # Change face every 5 frames
                         max_val = 12 if self.expansion_enabled else 6
                         self.dice_value = random.randint(1, max_val)
+                        audio.play("dice")
                         
                     # Check for stop input
                     keys = pygame.key.get_pressed()
@@ -488,60 +840,32 @@ class Game:
                         # Start Minigame
                         self.state = GameState.MINIGAME
                         
-                        if self.dice_value == 1:
-                            self.current_minigame = BattleMinigame(self.screen, self.font, self.turn + 1)
-                        elif self.dice_value == 2:
-                            self.current_minigame = RacingMinigame(self.screen, self.font, self.turn + 1)
-                        elif self.dice_value == 3:
-                            self.current_minigame = PongMinigame(self.screen, self.font, self.turn + 1)
-                        elif self.dice_value == 4:
-                            self.current_minigame = DodgeballMinigame(self.screen, self.font, self.turn + 1)
-                        elif self.dice_value == 5:
-                            self.current_minigame = TargetMinigame(self.screen, self.font, self.turn + 1)
-                        elif self.dice_value == 6:
-                            self.current_minigame = CoinMinigame(self.screen, self.font, self.turn + 1)
-                        # Expansion Games
-                        elif self.dice_value == 7:
-                            self.current_minigame = SnakeMinigame(self.screen, self.font, self.turn + 1)
-                        elif self.dice_value == 8:
-                            self.current_minigame = SpaceShooterMinigame(self.screen, self.font, self.turn + 1)
-                        elif self.dice_value == 9:
-                            self.current_minigame = PacmanMinigame(self.screen, self.font, self.turn + 1)
-                        elif self.dice_value == 10:
-                            self.current_minigame = BlockBreakerMinigame(self.screen, self.font, self.turn + 1)
-                        elif self.dice_value == 11:
-                            self.current_minigame = RoadCrosserMinigame(self.screen, self.font, self.turn + 1)
-                        elif self.dice_value == 12:
-                            self.current_minigame = FlappyMinigame(self.screen, self.font, self.turn + 1)
+                        if self.dice_value in MINIGAME_CLASSES:
+                            self.current_minigame = self.create_minigame(self.dice_value)
 
         
         elif self.state == GameState.MINIGAME:
             if self.current_minigame:
-                result = self.current_minigame.update()
-                if result:
-                    # Boss Win (Game Over)
-                    if "DEFEATED THE BOSS" in result:
-                        self.winner = f"PLAYER {self.turn + 1} WINS THE GAME!"
-                        self.state = GameState.GAME_OVER
-                        return
+                if self.current_minigame.update():
+                    result = self.current_minigame.result
+                    self.telemetry.minigame(result, self, self.dice_value)
+                    if not self.bot: # Bot runs don't set high scores
+                        self.scores.record(result, self.turn + 1)
                     
-                    # Boss Loss
-                    if "BOSS WINS" in result:
-                        # Switch turn but don't reset stars, next player gets a chance if they have 14+ stars
-                        if self.num_players > 1:
-                            self.turn = (self.turn + 1) % self.num_players
-                        
-                        self.state = GameState.BOARD
-                        self.current_minigame = None
-                        self.dice_value = 0
-                        return
-
-                    # Mini-game Win logic
-                    if "Player 1 Wins!" in result or "You Survived!" in result or "Time's Up!" in result or "Win" in result:
-                        # Check specific win conditions per game if needed, but simplified:
-                        # Assume standard win text implies player victory
-                        if "Computer" not in result and "LOSE" not in result:
-                             self.stars[self.turn] += 1
+                    if result.minigame == "BossFightMinigame":
+                        if result.player_won:
+                            # Boss Win (Game Over)
+                            self.winner = f"PLAYER {self.turn + 1} WINS THE GAME!"
+                            self.state = GameState.GAME_OVER
+                            self.telemetry.game_over(self)
+                            if not self.bot:
+                                self.scores.game_over(self.turn + 1, self.num_players, self.stars)
+                            return
+                        # Boss Loss: switch turn but don't reset stars, next player gets a chance if they have 14+ stars
+                    elif result.player_won:
+                        # Mini-game Win
+                        self.stars[self.turn] += 1
+                        audio.play("star")
 
                     # Mini-game end
                     if self.num_players > 1:
@@ -551,7 +875,30 @@ class Game:
                     self.current_minigame = None
                     self.dice_value = 0
 
+    def frame_mode(self):
+        # How fast the next frame needs to come, see FrameScheduler
+        if self.transitions.active:
+            return FrameScheduler.ACTIVE
+        if self.state in (GameState.TITLE, GameState.HIGH_SCORES):
+            return FrameScheduler.SLEEP
+        if self.state == GameState.EXPANSION_MENU:
+            if self.expansion_message_timer > 0 or self.nav_cooldown > 0:
+                return FrameScheduler.ACTIVE
+            return FrameScheduler.SLEEP
+        if self.state == GameState.BOARD:
+            if self.rolling_dice:
+                return FrameScheduler.ACTIVE
+            if self.stars[self.turn] >= 14:
+                return FrameScheduler.LOW # Blinking BOSS UNLOCKED
+            return FrameScheduler.SLEEP
+        return FrameScheduler.ACTIVE
+
     def draw(self):
+        if self.state != self.drawn_state:
+            # Screen still shows the previous state's last frame here
+            self.transitions.state_changed(self.screen, self.drawn_state, self.state)
+            self.drawn_state = self.state
+            
         self.screen.fill(BLACK)
         
         if self.state == GameState.SPLASH:
@@ -560,21 +907,62 @@ class Game:
             self.draw_title()
         elif self.state == GameState.EXPANSION_MENU:
             self.draw_expansion_menu()
+        elif self.state == GameState.HIGH_SCORES:
+            self.draw_high_scores()
         elif self.state == GameState.BOARD:
             self.draw_board()
         elif self.state == GameState.MINIGAME:
             if self.current_minigame:
-                self.current_minigame.draw()
+                minigame = self.current_minigame
+                self.replay.track(minigame)
+                if self.replay.showing(minigame):
+                    self.replay.draw(self.screen, minigame, self.small_font)
+                else:
+                    minigame.render_alpha = self.render_alpha
+                    minigame.draw()
+                    if minigame.result is None:
+                        self.replay.record(self.screen)
         elif self.state == GameState.GAME_OVER:
             self.draw_game_over()
             
-        pygame.display.flip()
+        self.transitions.draw(self.screen)
+        if self.show_debug:
+            self.draw_debug_overlay()
+        self.capture.frame(self.screen)
+        self.spectator.publish(self.screen, self)
+        frame_inputs = self.latency.take_presentable()
+        if self.render_thread:
+            self.render_thread.publish(frame_inputs)
+        else:
+            pygame.display.flip()
+            self.latency.presented(frame_inputs)
+        STARTUP.first_frame()
+
+    def draw_debug_overlay(self):
+        quality = self.quality
+        lines = [
+            f"FPS: {self.clock.get_fps():.0f}",
+            f"Frame: {quality.average_ms:.1f} / {quality.budget * 1000:.1f} ms",
+            f"GC: {quality.gc_ms:.2f} ms/frame, {self.gc_policy.collections[2]} full",
+            f"Quality: {quality.tier['name']}" + ("" if quality.enabled else " (fixed)"),
+            f"Scheduler: {self.scheduler.mode}",
+        ]
+        if self.interpolate:
+            lines.append(f"Render: {self.render_fps} fps, alpha {self.render_alpha:.2f}")
+        if self.replay.frames:
+            lines.append(f"Replay: {self.replay.bytes // 1024} KB, {self.replay.record_ms:.2f} ms")
+        x, y = 10, SCREEN_HEIGHT - 60 - len(lines) * 20
+        pygame.draw.rect(self.screen, BLACK, (x - 5, y - 5, 220, len(lines) * 20 + 10))
+        for i, line in enumerate(lines):
+            # Changes every frame, so not worth caching
+            text = self.tiny_font.render(line, True, WHITE)
+            self.screen.blit(text, (x, y + i * 20))
 
     def draw_expansion_menu(self):
         self.screen.fill(BLACK)
         
         # Title
-        title = self.font.render("ENTER EXPANSION CODE", True, YELLOW)
+        title = self.render_text(self.font, "ENTER EXPANSION CODE", YELLOW)
         self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 50))
         
         # Code Display (Masked or Clear - user said "type in expansion code", usually visible)
@@ -605,17 +993,47 @@ class Game:
                 pygame.draw.rect(self.screen, BLUE, rect, 2)
                 text_color = WHITE
                 
-            text = self.small_font.render(char, True, text_color)
+            text = self.render_text(self.small_font, char, text_color)
             self.screen.blit(text, (x + cell_size//2 - text.get_width()//2, y + cell_size//2 - text.get_height()//2))
             
         # Message
         if self.expansion_message:
             color = GREEN if "ACTIVATED" in self.expansion_message else RED
-            msg = self.small_font.render(self.expansion_message, True, color)
+            msg = self.render_text(self.small_font, self.expansion_message, color)
             self.screen.blit(msg, (SCREEN_WIDTH//2 - msg.get_width()//2, 500))
             
         # Instructions
-        instr = self.tiny_font.render("Use D-Pad/Arrows to Move, A/Space to Select, B/Esc to Back", True, GREY if 'GREY' in globals() else (100,100,100))
+        instr = self.render_text(self.tiny_font, "Use D-Pad/Arrows to Move, A/Space to Select, B/Esc to Back", GREY)
+        self.screen.blit(instr, (SCREEN_WIDTH//2 - instr.get_width()//2, SCREEN_HEIGHT - 30))
+
+    def draw_high_scores(self):
+        self.screen.fill((20, 20, 40))
+        
+        title = self.render_text(self.font, "HIGH SCORES", GOLD)
+        self.screen.blit(title, (SCREEN_WIDTH//2 - title.get_width()//2, 40))
+        
+        name = MINIGAME_NAMES[self.high_score_index + 1]
+        name_text = self.render_text(self.small_font, f"<  {name}  >", YELLOW)
+        self.screen.blit(name_text, (SCREEN_WIDTH//2 - name_text.get_width()//2, 120))
+        
+        if not self.high_score_rows:
+            empty = self.render_text(self.small_font, "No scores yet", GREY)
+            self.screen.blit(empty, (SCREEN_WIDTH//2 - empty.get_width()//2, SCREEN_HEIGHT//2))
+        
+        first_rank = (len(self.high_score_cursors) - 1) * HIGH_SCORE_PAGE + 1
+        for i, (row_id, score, player, played_at) in enumerate(self.high_score_rows):
+            y = 180 + i * 36
+            color = PLAYER_COLORS[(player - 1) % 4]
+            rank = self.render_text(self.small_font, f"{first_rank + i}.", WHITE)
+            self.screen.blit(rank, (SCREEN_WIDTH//2 - 220 - rank.get_width(), y))
+            who = self.render_text(self.small_font, f"P{player}", color)
+            self.screen.blit(who, (SCREEN_WIDTH//2 - 180, y))
+            points = self.render_text(self.small_font, str(score), WHITE)
+            self.screen.blit(points, (SCREEN_WIDTH//2 + 40 - points.get_width(), y))
+            date = self.render_text(self.tiny_font, time.strftime("%Y-%m-%d", time.localtime(played_at)), GREY)
+            self.screen.blit(date, (SCREEN_WIDTH//2 + 80, y + 6))
+        
+        instr = self.render_text(self.tiny_font, "Left/Right: Minigame, Up/Down: Page, B/Backspace to Back", GREY)
         self.screen.blit(instr, (SCREEN_WIDTH//2 - instr.get_width()//2, SCREEN_HEIGHT - 30))
 
     def draw_game_over(self):
@@ -623,7 +1041,7 @@ class Game:
         text = self.font.render(getattr(self, 'winner', "GAME OVER"), True, WHITE)
         self.screen.blit(text, (SCREEN_WIDTH//2 - text.get_width()//2, SCREEN_HEIGHT//2))
         
-        sub = self.small_font.render("Press ESC to Exit", True, WHITE)
+        sub = self.render_text(self.small_font, "Press ESC to Exit", WHITE)
         self.screen.blit(sub, (SCREEN_WIDTH//2 - sub.get_width()//2, SCREEN_HEIGHT//2 + 100))
         
         # Handle input to exit
@@ -640,20 +1058,16 @@ class Game:
         if self.splash_timer > self.splash_duration - 60:
             alpha = int(255 * ((self.splash_duration - self.splash_timer) / 60))
         
+        if self.splash_image is None:
+            self.splash_image = self.load_studio_logo()
         if self.splash_image:
-             self.splash_image.set_alpha(alpha)
              self.screen.blit(self.splash_image, (SCREEN_WIDTH//2 - self.splash_image.get_width()//2, SCREEN_HEIGHT//2 - 180))
         
-        text_surf = self.font.render("Team Banana Labs Studios", True, BLACK)
-        text_surf.set_alpha(alpha)
+        text_surf = self.render_text(self.font, "Team Banana Labs Studios", BLACK)
         self.screen.blit(text_surf, (SCREEN_WIDTH//2 - text_surf.get_width()//2, SCREEN_HEIGHT//2 + 150))
         
-        # Overlay for fade effect
-        if alpha < 255:
-             s = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-             s.set_alpha(255 - alpha)
-             s.fill(BLACK) # Fade to whatever color title starts with (Purple/Black)
-             self.screen.blit(s, (0,0))
+        # Fade to black (what the title starts from) in place, no overlay surface
+        self.transitions.fade(self.screen, alpha)
 
     def draw_title(self):
         self.screen.fill(PURPLE)
@@ -662,20 +1076,20 @@ class Game:
         pygame.draw.circle(self.screen, YELLOW, (100, 100), 50)
         pygame.draw.circle(self.screen, RED, (SCREEN_WIDTH-100, SCREEN_HEIGHT-100), 80)
         
-        title_text = self.font.render("Battle Street 2", True, WHITE)
-        subtitle_text = self.font.render("Party Edition", True, GREEN)
+        title_text = self.render_text(self.font, "Battle Street 2", WHITE)
+        subtitle_text = self.render_text(self.font, "Party Edition", GREEN)
         
         # Shadow effect
-        title_shadow = self.font.render("Battle Street 2", True, BLACK)
+        title_shadow = self.render_text(self.font, "Battle Street 2", BLACK)
         self.screen.blit(title_shadow, (SCREEN_WIDTH//2 - title_text.get_width()//2 + 4, 154))
         
         self.screen.blit(title_text, (SCREEN_WIDTH//2 - title_text.get_width()//2, 150))
         self.screen.blit(subtitle_text, (SCREEN_WIDTH//2 - subtitle_text.get_width()//2, 230))
         
-        start_text = self.small_font.render("Press A / Space for 1 Player", True, WHITE)
-        p2_text = self.small_font.render("Press B for 2 Players", True, YELLOW)
-        p3_text = self.small_font.render("Press X for 3 Players", True, GREEN)
-        p4_text = self.small_font.render("Press Y for 4 Players", True, PURPLE)
+        start_text = self.render_text(self.small_font, "Press A / Space for 1 Player", WHITE)
+        p2_text = self.render_text(self.small_font, "Press B for 2 Players", YELLOW)
+        p3_text = self.render_text(self.small_font, "Press X for 3 Players", GREEN)
+        p4_text = self.render_text(self.small_font, "Press Y for 4 Players", PURPLE)
         
         self.screen.blit(start_text, (SCREEN_WIDTH//2 - start_text.get_width()//2, 380))
         self.screen.blit(p2_text, (SCREEN_WIDTH//2 - p2_text.get_width()//2, 420))
@@ -683,52 +1097,54 @@ class Game:
         self.screen.blit(p4_text, (SCREEN_WIDTH//2 - p4_text.get_width()//2, 500))
         
         if self.expansion_enabled:
-            exp_text = self.tiny_font.render("EXPANSION PACK ENABLED", True, GOLD)
+            exp_text = self.render_text(self.tiny_font, "EXPANSION PACK ENABLED", GOLD)
             self.screen.blit(exp_text, (SCREEN_WIDTH - exp_text.get_width() - 10, 10))
             
-            games_text = self.tiny_font.render("+ 6 New Games & Golden Dice!", True, GOLD)
+            games_text = self.render_text(self.tiny_font, "+ 6 New Games & Golden Dice!", GOLD)
             self.screen.blit(games_text, (SCREEN_WIDTH - games_text.get_width() - 10, 35))
         
         if self.joysticks:
             joy_name = next(iter(self.joysticks.values())).get_name()
-            joy_text = self.tiny_font.render(f"Controller: {joy_name}", True, BLUE)
+            joy_text = self.render_text(self.tiny_font, f"Controller: {joy_name}", BLUE)
             self.screen.blit(joy_text, (10, SCREEN_HEIGHT - 30))
         else:
-            kb_text = self.tiny_font.render("No Controller Detected (Use Keyboard)", True, RED)
+            kb_text = self.render_text(self.tiny_font, "No Controller Detected (Use Keyboard)", RED)
             self.screen.blit(kb_text, (10, SCREEN_HEIGHT - 30))
             
-        controls_text = self.tiny_font.render("Controls: Arrows/WASD to Move, Space/Btn 0 to Action", True, WHITE)
+        controls_text = self.render_text(self.tiny_font, "Controls: Arrows/WASD to Move, Space/Btn 0 to Action", WHITE)
         self.screen.blit(controls_text, (SCREEN_WIDTH - controls_text.get_width() - 10, SCREEN_HEIGHT - 30))
         
-        expansion_hint = self.tiny_font.render("Press + / Start for Expansion Menu", True, WHITE)
+        expansion_hint = self.render_text(self.tiny_font, "Press + / Start for Expansion Menu", WHITE)
         self.screen.blit(expansion_hint, (SCREEN_WIDTH//2 - expansion_hint.get_width()//2, SCREEN_HEIGHT - 30))
+        
+        scores_hint = self.render_text(self.tiny_font, "Press H / Back for High Scores", WHITE)
+        self.screen.blit(scores_hint, (SCREEN_WIDTH//2 - scores_hint.get_width()//2, SCREEN_HEIGHT - 55))
 
     def draw_board(self):
         self.screen.fill((20, 20, 40))
         
         # Header
-        colors = [BLUE, RED, GREEN, YELLOW]
-        turn_text = self.font.render(f"Player {self.turn + 1}'s Turn", True, colors[self.turn])
+        colors = PLAYER_COLORS
+        turn_text = self.render_text(self.font, f"Player {self.turn + 1}'s Turn", colors[self.turn])
         self.screen.blit(turn_text, (SCREEN_WIDTH//2 - turn_text.get_width()//2, 30))
         
-        mode_text = self.tiny_font.render(f"Current Mode: {self.num_players} Player(s)", True, WHITE)
+        mode_text = self.render_text(self.tiny_font, f"Current Mode: {self.num_players} Player(s)", WHITE)
         self.screen.blit(mode_text, (10, 10))
         
-        # Stars
-        colors = [BLUE, RED, GREEN, YELLOW]
-        p_star_text = self.small_font.render(f"P{self.turn+1} Stars: {self.stars[self.turn]}/14", True, colors[self.turn])
-        self.screen.blit(p_star_text, (50, 50))
+        # Stars, composed from glyphs: no font render when a count changes
+        antialias = self.quality.tier["antialias"]
+        get_glyphs(self.small_font, antialias).draw(self.screen, f"P{self.turn+1} Stars: {self.stars[self.turn]}/14", colors[self.turn], (50, 50))
         
         # Show all players stars small in corners or list
         if self.num_players > 1:
+            tiny_glyphs = get_glyphs(self.tiny_font, antialias)
             for i in range(self.num_players):
-                t = self.tiny_font.render(f"P{i+1}: {self.stars[i]}", True, colors[i])
-                self.screen.blit(t, (SCREEN_WIDTH - 100, 30 + i*20))
+                tiny_glyphs.draw(self.screen, f"P{i+1}: {self.stars[i]}", colors[i], (SCREEN_WIDTH - 100, 30 + i*20))
         
         # Boss Ready?
         if self.stars[self.turn] >= 14:
-            boss_text = self.font.render("BOSS UNLOCKED!", True, RED)
-            sub_text = self.small_font.render("Press Space/A to Fight!", True, WHITE)
+            boss_text = self.boss_banner_text()
+            sub_text = self.render_text(self.small_font, "Press Space/A to Fight!", WHITE)
             
             blink_alpha = abs(pygame.time.get_ticks() % 1000 - 500) // 2
             boss_text.set_alpha(blink_alpha)
@@ -738,7 +1154,7 @@ class Game:
             return
 
         if not self.rolling_dice and self.dice_value == 0:
-            instruction = self.small_font.render("Roll the Dice!", True, GREEN)
+            instruction = self.render_text(self.small_font, "Roll the Dice!", GREEN)
             self.screen.blit(instruction, (SCREEN_WIDTH//2 - instruction.get_width()//2, 500))
         
         # Draw Dice
@@ -754,52 +1170,12 @@ class Game:
         draw_rect = self.dice_rect.copy()
         draw_rect.y += dice_y_offset
         
-        pygame.draw.rect(self.screen, WHITE, draw_rect, border_radius=10)
-        pygame.draw.rect(self.screen, BLACK, draw_rect, 4, border_radius=10)
-        
-        # Golden Dice Skin if expansion enabled
-        if self.expansion_enabled:
-             pygame.draw.rect(self.screen, GOLD, draw_rect, 4, border_radius=10)
+        # Baked dice face (Golden Dice Skin if expansion enabled)
+        self.screen.blit(self.atlas.dice(self.dice_value, self.expansion_enabled), draw_rect)
         
         if self.dice_value > 0:
-            # Draw dots based on number
-            color = BLACK
-            cx, cy = draw_rect.centerx, draw_rect.centery
-            
-            # Dice logic for 1-6 is standard
-            if self.dice_value <= 6:
-                if self.dice_value in [1, 3, 5]:
-                    pygame.draw.circle(self.screen, color, (cx, cy), 10)
-                if self.dice_value in [2, 3, 4, 5, 6]:
-                    pygame.draw.circle(self.screen, color, (cx - 25, cy - 25), 10)
-                    pygame.draw.circle(self.screen, color, (cx + 25, cy + 25), 10)
-                if self.dice_value in [4, 5, 6]:
-                    pygame.draw.circle(self.screen, color, (cx + 25, cy - 25), 10)
-                    pygame.draw.circle(self.screen, color, (cx - 25, cy + 25), 10)
-                if self.dice_value == 6:
-                    pygame.draw.circle(self.screen, color, (cx - 25, cy), 10)
-                    pygame.draw.circle(self.screen, color, (cx + 25, cy), 10)
-            else:
-                # Custom numbers for 7, 8 etc
-                text_surf = self.font.render(str(self.dice_value), True, BLACK)
-                self.screen.blit(text_surf, (cx - text_surf.get_width()//2, cy - text_surf.get_height()//2))
-            
             # Show which game
-            game_name = ""
-            if self.dice_value == 1: game_name = "BATTLE ARENA"
-            elif self.dice_value == 2: game_name = "RACING"
-            elif self.dice_value == 3: game_name = "PONG"
-            elif self.dice_value == 4: game_name = "DODGEBALL"
-            elif self.dice_value == 5: game_name = "TARGET PRACTICE"
-            elif self.dice_value == 6: game_name = "COIN COLLECTOR"
-            elif self.dice_value == 7: game_name = "SNAKE"
-            elif self.dice_value == 8: game_name = "SPACE SHOOTER"
-            elif self.dice_value == 9: game_name = "PAC-MAN"
-            elif self.dice_value == 10: game_name = "BLOCK BREAKER"
-            elif self.dice_value == 11: game_name = "ROAD CROSSER"
-            elif self.dice_value == 12: game_name = "FLAPPY BIRD"
-            
-            name_text = self.small_font.render(game_name, True, YELLOW)
+            name_text = self.render_text(self.small_font, MINIGAME_NAMES.get(self.dice_value, ""), YELLOW)
             self.screen.blit(name_text, (SCREEN_WIDTH//2 - name_text.get_width()//2, SCREEN_HEIGHT//2 + 80))
 
         # Draw Player Characters at bottom
@@ -819,25 +1195,133 @@ class Game:
                 p_y = SCREEN_HEIGHT - 100
                 p_x = 100 + i * 150
                 
-            pygame.draw.rect(self.screen, p_color, (p_x, p_y, 40, 60))
-            # Eyes
-            pygame.draw.rect(self.screen, WHITE, (p_x + 5, p_y + 10, 10, 10))
-            pygame.draw.rect(self.screen, WHITE, (p_x + 25, p_y + 10, 10, 10))
+            self.screen.blit(self.atlas.player(p_color), (p_x, p_y))
             
             # Indicator for current turn if not jumping
             if i == self.turn and not (self.dice_stopped and self.rolling_dice):
-                pygame.draw.polygon(self.screen, WHITE, [(p_x + 20, p_y - 20), (p_x + 10, p_y - 40), (p_x + 30, p_y - 40)])
+                self.screen.blit(self.atlas.turn_indicator(), (p_x + 10, p_y - 40))
+
+    def scene_label(self):
+        # Latency and profiles are per minigame, per state everywhere else
+        if self.state == GameState.MINIGAME and self.current_minigame:
+            return type(self.current_minigame).__name__
+        return self.state
+
+    def enter_state(self, state, minigame=None):
+        # Jump straight to a state, for scripted runs (latency test)
+        if state != GameState.TITLE and self.state in (GameState.SPLASH, GameState.TITLE):
+            self.num_players = 1
+            self.reset_game_data()
+        self.state = state
+        if state == GameState.MINIGAME:
+            self.current_minigame = self.minigame_class(minigame)(self.screen, self.font, self.turn + 1)
+        else:
+            self.current_minigame = None
+
+    def tick(self):
+        # One fixed simulation step
+        if self.interpolate and self.state == GameState.MINIGAME and self.current_minigame:
+            self.current_minigame.capture_positions()
+        if self.bot:
+            self.bot.step(self)
+        self.handle_input()
+        self.update()
+        self.latency.updated()
+
+    def run_fast(self, games=1, max_ticks=None, draw_every=0):
+        # Bot soak runs: no frame pacing, draw only every draw_every ticks (0 = never)
+        start = time.perf_counter()
+        ticks = 0
+        while self.running and self.bot.games < games and (max_ticks is None or ticks < max_ticks):
+            self.tick()
+            ticks += 1
+            if draw_every and ticks % draw_every == 0:
+                self.draw()
+        elapsed = time.perf_counter() - start
+        print(f"Bot run: {self.bot.games} games, {ticks} ticks in {elapsed:.1f} s ({ticks / elapsed:.0f} ticks/s)")
+        self.gc_policy.report()
+        self.telemetry.close()
+        self.scores.close()
+        self.audio.report()
+        self.assets.shutdown()
 
     def run(self):
+        tick_seconds = 1.0 / FPS
+        accumulator = tick_seconds
+        previous = time.perf_counter()
         while self.running:
-            self.handle_input()
-            self.update()
+            if self.latency_probe:
+                self.latency_probe.step(self)
+            self.profiler.frame(self.scene_label())
+            self.gc_policy.frame(self.state)
+            self.resume.frame(self)
+            self.audio.frame(self.scene_label())
+            frame_start = time.perf_counter()
+            # Collections before this point (the BOARD entry collect, the last scheduler
+            # wait) are not part of the frame time measured from here
+            self.gc_policy.take_frame_pause()
+            if self.interpolate:
+                # Fixed timestep: as many ticks as real time allows, capped so a stall
+                # (window drag, breakpoint) doesn't turn into a burst of catch-up ticks
+                accumulator += min(frame_start - previous, 0.25)
+                previous = frame_start
+                while accumulator >= tick_seconds and self.running:
+                    self.tick()
+                    accumulator -= tick_seconds
+                self.render_alpha = accumulator / tick_seconds
+            else:
+                self.tick()
             self.draw()
-            self.clock.tick(FPS)
+            
+            gc_seconds = self.gc_policy.take_frame_pause()
+            mode = self.frame_mode()
+            if mode == FrameScheduler.ACTIVE:
+                # Idle frames would only make the average look better than it is
+                self.quality.record(time.perf_counter() - frame_start, gc_seconds)
+            self.scheduler.wait(mode)
+            if self.scheduler.mode != FrameScheduler.ACTIVE:
+                # Idle waits are not lag to catch up on, just run one tick next frame
+                accumulator = tick_seconds
+                previous = time.perf_counter()
         
+        self.profiler.stop()
+        self.scheduler.report()
+        self.gc_policy.report()
+        if self.render_thread:
+            self.render_thread.stop()
+            self.render_thread.report()
+        self.latency.report("render thread" if self.render_thread else "sequential")
+        self.telemetry.close()
+        self.scores.close()
+        self.audio.report()
+        self.capture.stop()
+        self.capture.report()
+        self.spectator.stop()
+        self.spectator.report()
+        self.assets.shutdown()
         pygame.quit()
         sys.exit()
 
 if __name__ == "__main__":
+    if getattr(sys, 'frozen', False):
+        # Capture encoder and spectator viewer in frozen builds (a no-op otherwise, and
+        # importing multiprocessing is startup time)
+        import multiprocessing
+        multiprocessing.freeze_support()
+    bot_fast = "--bot-fast" in sys.argv # --bot-fast [games]: headless, as fast as it simulates
+    if LatencyProbe.requested() or bot_fast:
+        # Scripted and headless unless a display driver was chosen explicitly
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
     game = Game()
-    game.run()
+    if bot_fast or "--bot" in sys.argv:
+        from bots import Bot
+        seed = option("--seed")
+        if seed is not None:
+            random.seed(int(seed))
+        game.bot = Bot(seed, players=number_option("--players", default=1, minimum=1), joystick="--bot-joystick" in sys.argv)
+    if bot_fast:
+        game.run_fast(games=number_option("--bot-fast", default=1, minimum=1))
+        pygame.quit()
+    else:
+        game.run()
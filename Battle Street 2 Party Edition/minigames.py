@@ -1,5 +1,12 @@
 import pygame
 import random
+import audio
+from sprites import get_atlas
+from glyphs import get_glyphs
+from render_batch import RenderBatch
+from starfield import get_starfield, tier_starfield
+from quality import current_tier, current_frame
+from results import MinigameResult, PLAYER, OPPONENT, NOBODY
 
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
@@ -13,7 +20,108 @@ PURPLE = (128, 0, 128)
 ORANGE = (255, 165, 0)
 GREY = (100, 100, 100)
 
-class BossFightMinigame:
+class Minigame:
+    """ Helpers shared by every minigame """
+    hud_cache = None
+    result = None # MinigameResult once decided
+    ticks = 0 # Updates played until then
+    
+    def finish(self, winner, cause, text, score=None):
+        # Decides the game: text is the banner update() hands back after the delay,
+        # the result is what the Game scores
+        self.winner = text
+        self.result = MinigameResult(type(self).__name__, winner, score, self.ticks, cause, text)
+    
+    # Snapshots (see snapshot.py) pickle the instance without the display, the font and
+    # anything drawn from the state; attach() puts those back after loading
+    unsaved = ("screen", "font", "hud_cache", "batch", "starfield", "brick_layer", "prev_rects", "prev_values")
+    
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name in self.unsaved:
+            state.pop(name, None)
+        return state
+    
+    def attach(self, screen, font, previous=None):
+        # previous: the instance this one replaces (a rollback), its caches can be reused
+        self.screen = screen
+        self.font = font
+        self.rebuild(previous)
+    
+    def rebuild(self, previous=None):
+        # Derived state a loaded snapshot doesn't carry
+        pass
+    
+    # Render interpolation: the Game calls capture_positions() before every simulation
+    # tick and sets render_alpha (how far the frame is between that tick and the next)
+    # before draw(). At 1.0 everything draws at its current position, as before.
+    render_alpha = 1.0
+    prev_rects = None
+    prev_values = None
+    max_blend_step = 100 # Bigger moves are teleports (respawn, ball reset), not blended
+
+    def interpolated_rects(self):
+        # Rects that move every update
+        return ()
+
+    def interpolated_values(self):
+        # Names of numeric attributes that move every update
+        return ()
+
+    def capture_positions(self):
+        # Keep the rect itself so its id cannot be reused by a new rect meanwhile
+        self.prev_rects = {id(rect): (rect, rect.x, rect.y) for rect in self.interpolated_rects()}
+        self.prev_values = {name: getattr(self, name) for name in self.interpolated_values()}
+
+    def lerp_pos(self, rect):
+        # Position to draw rect at; the rect itself when there is nothing to blend
+        if self.render_alpha >= 1 or not self.prev_rects:
+            return rect
+        prev = self.prev_rects.get(id(rect))
+        if prev is None or prev[0] is not rect:
+            return rect
+        dx = rect.x - prev[1]
+        dy = rect.y - prev[2]
+        if abs(dx) > self.max_blend_step or abs(dy) > self.max_blend_step:
+            return rect
+        return (round(prev[1] + dx * self.render_alpha), round(prev[2] + dy * self.render_alpha))
+
+    def lerp_rect(self, rect):
+        pos = self.lerp_pos(rect)
+        if pos is rect:
+            return rect
+        return pygame.Rect(pos, rect.size)
+
+    def lerp_value(self, name):
+        value = getattr(self, name)
+        if self.render_alpha >= 1 or not self.prev_values or name not in self.prev_values:
+            return value
+        prev = self.prev_values[name]
+        if abs(value - prev) > self.max_blend_step:
+            return value
+        return prev + (value - prev) * self.render_alpha
+
+    def render_hud(self, slot, text, color):
+        # HUD text follows the quality tier: antialiasing and how often a changing value is re-rendered
+        tier = current_tier()
+        if self.hud_cache is None:
+            self.hud_cache = {}
+        key = (text, color, tier['antialias'])
+        entry = self.hud_cache.get(slot)
+        frame = current_frame()
+        if entry is None or (entry[0] != key and (tier['hud_interval'] <= 1 or frame - entry[2] >= tier['hud_interval'])):
+            entry = self.hud_cache[slot] = (key, self.font.render(text, tier['antialias'], color), frame)
+        return entry[1]
+
+    def draw_hud(self, text, color, pos, center=False):
+        # Scores, timers and lives: composed from the font's glyph atlas, so a changing
+        # value costs a few blits and never a font render. center: pos[0] is the middle
+        glyphs = get_glyphs(self.font, current_tier()['antialias'])
+        if center:
+            pos = (pos[0] - glyphs.size(text)[0] // 2, pos[1])
+        return glyphs.draw(self.screen, text, color, pos)
+
+class BossFightMinigame(Minigame):
     def __init__(self, screen, font, player_num=1):
         self.screen = screen
         self.font = font
@@ -38,6 +146,21 @@ class BossFightMinigame:
         self.player_attack_cooldown = 0
         self.winner = None
         self.game_over_timer = 0
+        self.result = None
+        self.ticks = 0
+        
+        # Shared with the Space Shooter, rendered once
+        self.starfield = get_starfield(self.screen.get_size(), like=self.screen)
+        
+    def rebuild(self, previous=None):
+        self.starfield = get_starfield(self.screen.get_size(), like=self.screen)
+        
+    def interpolated_rects(self):
+        yield self.player_rect
+        yield self.boss_rect
+        for p in self.projectiles:
+            yield p["rect"]
+        yield from self.player_projectiles
         
     def handle_input(self, keys, joystick=None):
         if self.winner: return
@@ -77,9 +200,13 @@ class BossFightMinigame:
                 self.player_attack_cooldown = 30
 
     def update(self):
+        self.starfield = tier_starfield(self.screen.get_size(), self.starfield, like=self.screen) # Follows the quality tier
+        self.starfield.update()
+        
         if self.winner:
             self.game_over_timer += 1
             return self.winner if self.game_over_timer > 180 else None
+        self.ticks += 1
             
         if self.player_attack_cooldown > 0:
             self.player_attack_cooldown -= 1
@@ -165,31 +292,33 @@ class BossFightMinigame:
             
         # Win/Loss
         if self.player_hp <= 0:
-            self.winner = "BOSS WINS! YOU LOSE!"
+            self.finish(OPPONENT, "player_defeated", "BOSS WINS! YOU LOSE!", self.player_hp)
         elif self.boss_hp <= 0:
-            self.winner = "YOU DEFEATED THE BOSS!"
+            self.finish(PLAYER, "boss_defeated", "YOU DEFEATED THE BOSS!", self.player_hp)
             
         return None
 
     def draw(self):
-        self.screen.fill(BLACK)
+        # Starfield background (replaces the black fill)
+        self.starfield.draw(self.screen)
         
         # Draw Boss
-        pygame.draw.rect(self.screen, self.boss_color, self.boss_rect)
+        boss_rect = self.lerp_rect(self.boss_rect)
+        pygame.draw.rect(self.screen, self.boss_color, boss_rect)
         # Draw Boss Eyes
-        pygame.draw.rect(self.screen, YELLOW, (self.boss_rect.x + 20, self.boss_rect.y + 30, 30, 30))
+        pygame.draw.rect(self.screen, YELLOW, (boss_rect.x + 20, boss_rect.y + 30, 30, 30))
         
         # Draw Player
-        pygame.draw.rect(self.screen, self.player_color, self.player_rect)
+        pygame.draw.rect(self.screen, self.player_color, self.lerp_rect(self.player_rect))
         
         # Draw Projectiles
         for p in self.projectiles:
             color = ORANGE if p["type"] == "FIREBALL" else GREEN
-            pygame.draw.rect(self.screen, color, p["rect"])
+            pygame.draw.rect(self.screen, color, self.lerp_rect(p["rect"]))
             
         # Draw Player Projectiles
         for pp in self.player_projectiles:
-            pygame.draw.circle(self.screen, (0, 255, 255), pp.center, 10)
+            pygame.draw.circle(self.screen, (0, 255, 255), self.lerp_rect(pp).center, 10)
             
         # Health Bars
         # Player
@@ -201,10 +330,10 @@ class BossFightMinigame:
         pygame.draw.rect(self.screen, YELLOW, (SCREEN_WIDTH - 450, 50, 400 * (max(0, self.boss_hp)/500), 30))
         
         if self.winner:
-            win_text = self.font.render(self.winner, True, WHITE)
+            win_text = self.render_hud("winner", self.winner, WHITE)
             self.screen.blit(win_text, (SCREEN_WIDTH//2 - win_text.get_width()//2, SCREEN_HEIGHT//2))
 
-class BattleMinigame:
+class BattleMinigame(Minigame):
     def __init__(self, screen, font, player_num=1):
         self.screen = screen
         self.font = font
@@ -227,11 +356,16 @@ class BattleMinigame:
         
         self.winner = None
         self.game_over_timer = 0
+        self.result = None
+        self.ticks = 0
         
         # Attack cooldowns
         self.p1_attack_cooldown = 0
         self.p2_attack_cooldown = 0
         
+    def interpolated_rects(self):
+        return (self.p1_rect, self.p2_rect)
+        
     def handle_input(self, keys, joystick=None):
         if self.winner:
             return
@@ -289,6 +423,7 @@ class BattleMinigame:
         # Check range
         dist = ((attacker_rect.centerx - target_rect.centerx)**2 + (attacker_rect.centery - target_rect.centery)**2)**0.5
         if dist < 70: # Hit range
+            audio.play("hit")
             if is_p1:
                 self.p2_health -= 10
                 self.p1_attack_cooldown = 30
@@ -300,6 +435,7 @@ class BattleMinigame:
         if self.winner:
             self.game_over_timer += 1
             return self.winner if self.game_over_timer > 180 else None
+        self.ticks += 1
 
         self.ai_logic()
         
@@ -309,9 +445,9 @@ class BattleMinigame:
         
         # Check Win
         if self.p2_health <= 0:
-            self.winner = "Player 1 Wins!"
+            self.finish(PLAYER, "knockout", "Player 1 Wins!", self.p1_health)
         elif self.p1_health <= 0:
-            self.winner = "Computer Wins!"
+            self.finish(OPPONENT, "knockout", "Computer Wins!", self.p1_health)
             
         return None
 
@@ -319,8 +455,9 @@ class BattleMinigame:
         self.screen.fill((50, 50, 50)) # Grey background arena
         
         # Draw Players
-        pygame.draw.rect(self.screen, self.p1_color, self.p1_rect)
-        pygame.draw.rect(self.screen, self.p2_color, self.p2_rect)
+        p1_rect = self.lerp_rect(self.p1_rect)
+        pygame.draw.rect(self.screen, self.p1_color, p1_rect)
+        pygame.draw.rect(self.screen, self.p2_color, self.lerp_rect(self.p2_rect))
         
         # Draw Health Bars
         pygame.draw.rect(self.screen, RED, (50, 50, 200, 20))
@@ -331,14 +468,14 @@ class BattleMinigame:
         
         # Attack indicator
         if self.p1_attack_cooldown > 15:
-            pygame.draw.circle(self.screen, WHITE, self.p1_rect.center, 40, 2)
+            pygame.draw.circle(self.screen, WHITE, p1_rect.center, 40, 2)
             
         if self.winner:
-            win_text = self.font.render(self.winner, True, WHITE)
+            win_text = self.render_hud("winner", self.winner, WHITE)
             self.screen.blit(win_text, (SCREEN_WIDTH//2 - win_text.get_width()//2, SCREEN_HEIGHT//2))
 
 
-class RacingMinigame:
+class RacingMinigame(Minigame):
     def __init__(self, screen, font, player_num=1):
         self.screen = screen
         self.font = font
@@ -358,6 +495,8 @@ class RacingMinigame:
         
         self.winner = None
         self.game_over_timer = 0
+        self.result = None
+        self.ticks = 0
         
         self.state = "COUNTDOWN"
         self.countdown_timer = 180 # 3 seconds
@@ -366,6 +505,9 @@ class RacingMinigame:
         self.p1_boost_cooldown = 0
         self.player_color = self.colors[(self.player_num - 1) % 4]
         
+    def interpolated_values(self):
+        return ("p1_distance", "p2_distance")
+        
     def handle_input(self, keys, joystick=None):
         if self.winner or self.state == "COUNTDOWN": return
         
@@ -383,6 +525,7 @@ class RacingMinigame:
         if self.winner:
             self.game_over_timer += 1
             return self.winner if self.game_over_timer > 180 else None
+        self.ticks += 1
             
         if self.state == "COUNTDOWN":
             self.countdown_timer -= 1
@@ -397,18 +540,21 @@ class RacingMinigame:
         self.p2_distance += random.randint(3, 6)
         
         if self.p1_distance >= self.track_length:
-            self.winner = "Player 1 Wins!"
+            self.finish(PLAYER, "finish_line", "Player 1 Wins!", self.p1_distance)
         elif self.p2_distance >= self.track_length:
-            self.winner = "Computer Wins!"
+            self.finish(OPPONENT, "finish_line", "Computer Wins!", self.p1_distance)
             
         return None
 
     def draw(self):
         self.screen.fill((30, 100, 30)) # Grass
         
+        p1_distance = self.lerp_value("p1_distance")
+        p2_distance = self.lerp_value("p2_distance")
+        
         # Scrolling Track Effect
         # We use modulo to scroll lines
-        offset = (self.p1_distance % 100)
+        offset = (p1_distance % 100)
         
         # Track
         pygame.draw.rect(self.screen, (100, 100, 100), (150, 0, 500, SCREEN_HEIGHT))
@@ -419,13 +565,13 @@ class RacingMinigame:
             pygame.draw.rect(self.screen, WHITE, (400, y_pos, 10, 30))
             
         # Finish Line (only if close)
-        if self.track_length - self.p1_distance < SCREEN_HEIGHT:
-            finish_y = self.track_length - self.p1_distance
+        if self.track_length - p1_distance < SCREEN_HEIGHT:
+            finish_y = self.track_length - p1_distance
             pygame.draw.rect(self.screen, WHITE, (150, finish_y, 500, 20)) # Finish line relative to P1
         
         # Cars/Runners (Static vertical position)
         # P2 relative position based on distance difference
-        p2_rel_y = self.p2_y + (self.p1_distance - self.p2_distance)
+        p2_rel_y = self.p2_y + (p1_distance - p2_distance)
         
         pygame.draw.rect(self.screen, self.player_color, (self.p1_x, self.p1_y, 40, 60))
         
@@ -439,7 +585,7 @@ class RacingMinigame:
              pygame.draw.polygon(self.screen, RED if self.player_num != 2 else BLUE, [(self.p2_x, 10), (self.p2_x+40, 10), (self.p2_x+20, 0)])
 
         if self.state == "COUNTDOWN":
-            count_surf = self.font.render(self.countdown_text, True, YELLOW)
+            count_surf = self.render_hud("countdown", self.countdown_text, YELLOW)
             self.screen.blit(count_surf, (SCREEN_WIDTH//2 - count_surf.get_width()//2, SCREEN_HEIGHT//2))
         
         # Distance bar
@@ -448,11 +594,11 @@ class RacingMinigame:
         pygame.draw.rect(self.screen, self.player_color, (SCREEN_WIDTH - 30, SCREEN_HEIGHT - 50 - (progress * (SCREEN_HEIGHT - 100)), 20, 10))
 
         if self.winner:
-            win_text = self.font.render(self.winner, True, WHITE)
+            win_text = self.render_hud("winner", self.winner, WHITE)
             self.screen.blit(win_text, (SCREEN_WIDTH//2 - win_text.get_width()//2, SCREEN_HEIGHT//2))
 
 
-class PongMinigame:
+class PongMinigame(Minigame):
     def __init__(self, screen, font, player_num=1):
         self.screen = screen
         self.font = font
@@ -476,9 +622,14 @@ class PongMinigame:
         
         self.winner = None
         self.game_over_timer = 0
+        self.result = None
+        self.ticks = 0
         self.score_p1 = 0
         self.score_p2 = 0
         
+    def interpolated_values(self):
+        return ("p1_y", "p2_y", "ball_x", "ball_y")
+        
     def handle_input(self, keys, joystick=None):
         if self.winner: return
         
@@ -498,6 +649,7 @@ class PongMinigame:
         if self.winner:
             self.game_over_timer += 1
             return self.winner if self.game_over_timer > 180 else None
+        self.ticks += 1
             
         # AI
         if self.ball_y < self.p2_y + self.paddle_h//2:
@@ -535,9 +687,9 @@ class PongMinigame:
             self.reset_ball()
             
         if self.score_p1 >= 3:
-            self.winner = "Player 1 Wins!"
+            self.finish(PLAYER, "points", "Player 1 Wins!", self.score_p1)
         elif self.score_p2 >= 3:
-            self.winner = "Computer Wins!"
+            self.finish(OPPONENT, "points", "Computer Wins!", self.score_p1)
             
         return None
 
@@ -552,26 +704,25 @@ class PongMinigame:
         pygame.draw.line(self.screen, WHITE, (SCREEN_WIDTH//2, 0), (SCREEN_WIDTH//2, SCREEN_HEIGHT), 2)
         
         # Paddles
-        pygame.draw.rect(self.screen, self.player_color, (50, self.p1_y, self.paddle_w, self.paddle_h))
-        pygame.draw.rect(self.screen, RED if self.player_num != 2 else BLUE, (SCREEN_WIDTH - 50 - self.paddle_w, self.p2_y, self.paddle_w, self.paddle_h))
+        pygame.draw.rect(self.screen, self.player_color, (50, self.lerp_value("p1_y"), self.paddle_w, self.paddle_h))
+        pygame.draw.rect(self.screen, RED if self.player_num != 2 else BLUE, (SCREEN_WIDTH - 50 - self.paddle_w, self.lerp_value("p2_y"), self.paddle_w, self.paddle_h))
         
         # Ball
-        pygame.draw.circle(self.screen, YELLOW, (int(self.ball_x), int(self.ball_y)), 10)
+        pygame.draw.circle(self.screen, YELLOW, (int(self.lerp_value("ball_x")), int(self.lerp_value("ball_y"))), 10)
         
         # Scores
-        s1 = self.font.render(str(self.score_p1), True, WHITE)
-        s2 = self.font.render(str(self.score_p2), True, WHITE)
-        self.screen.blit(s1, (SCREEN_WIDTH//4, 50))
-        self.screen.blit(s2, (3*SCREEN_WIDTH//4, 50))
+        self.draw_hud(str(self.score_p1), WHITE, (SCREEN_WIDTH//4, 50))
+        self.draw_hud(str(self.score_p2), WHITE, (3*SCREEN_WIDTH//4, 50))
         
         if self.winner:
-            win_text = self.font.render(self.winner, True, WHITE)
+            win_text = self.render_hud("winner", self.winner, WHITE)
             self.screen.blit(win_text, (SCREEN_WIDTH//2 - win_text.get_width()//2, SCREEN_HEIGHT//2))
 
-class DodgeballMinigame:
+class DodgeballMinigame(Minigame):
     def __init__(self, screen, font, player_num=1):
         self.screen = screen
         self.font = font
+        self.batch = RenderBatch()
         self.player_num = player_num
         self.colors = [BLUE, RED, GREEN, YELLOW]
         self.reset()
@@ -586,6 +737,16 @@ class DodgeballMinigame:
         self.health = 3
         self.winner = None
         self.game_over_timer = 0
+        self.result = None
+        self.ticks = 0
+        
+    def rebuild(self, previous=None):
+        self.batch = RenderBatch()
+        
+    def interpolated_rects(self):
+        yield self.player_rect
+        for obj_data in self.falling_objects:
+            yield obj_data['rect']
         
     def handle_input(self, keys, joystick=None):
         if self.winner: return
@@ -610,6 +771,7 @@ class DodgeballMinigame:
         if self.winner:
             self.game_over_timer += 1
             return self.winner if self.game_over_timer > 180 else None
+        self.ticks += 1
             
         self.spawn_timer += 1
         if self.spawn_timer > 20: # Spawn faster
@@ -650,10 +812,10 @@ class DodgeballMinigame:
                 self.score += 1
                 
         if self.health <= 0:
-            self.winner = "Game Over! Score: " + str(self.score)
+            self.finish(NOBODY, "hit", "Game Over! Score: " + str(self.score), self.score)
         
         if self.score >= 30: # Increased win condition slightly due to more spawning
-             self.winner = "You Survived! Win!"
+             self.finish(PLAYER, "survived", "You Survived! Win!", self.score)
             
         return None
 
@@ -661,26 +823,26 @@ class DodgeballMinigame:
         self.screen.fill((20, 0, 20))
         
         # Player
-        pygame.draw.rect(self.screen, self.player_color, self.player_rect)
+        pygame.draw.rect(self.screen, self.player_color, self.lerp_rect(self.player_rect))
         
         # Objects
-        for obj_data in self.falling_objects:
-            pygame.draw.circle(self.screen, RED, obj_data['rect'].center, 10)
+        ball_sprite = get_atlas().circle(RED, 10)
+        self.batch.add_many(ball_sprite, [self.lerp_pos(obj_data['rect']) for obj_data in self.falling_objects])
+        self.batch.flush(self.screen)
             
         # HUD
-        score_text = self.font.render(f"Score: {self.score}/20", True, WHITE)
-        health_text = self.font.render(f"HP: {self.health}", True, RED)
-        self.screen.blit(score_text, (20, 20))
-        self.screen.blit(health_text, (SCREEN_WIDTH - 150, 20))
+        self.draw_hud(f"Score: {self.score}/20", WHITE, (20, 20))
+        self.draw_hud(f"HP: {self.health}", RED, (SCREEN_WIDTH - 150, 20))
         
         if self.winner:
-            win_text = self.font.render(self.winner, True, WHITE)
+            win_text = self.render_hud("winner", self.winner, WHITE)
             self.screen.blit(win_text, (SCREEN_WIDTH//2 - win_text.get_width()//2, SCREEN_HEIGHT//2))
 
-class TargetMinigame:
+class TargetMinigame(Minigame):
     def __init__(self, screen, font, player_num=1):
         self.screen = screen
         self.font = font
+        self.batch = RenderBatch()
         self.player_num = player_num
         # Crosshair color doesn't need to change much, maybe border?
         self.colors = [BLUE, RED, GREEN, YELLOW]
@@ -694,6 +856,14 @@ class TargetMinigame:
         self.spawn_timer = 0
         self.winner = None
         self.game_over_timer = 0
+        self.result = None
+        self.ticks = 0
+        
+    def rebuild(self, previous=None):
+        self.batch = RenderBatch()
+        
+    def interpolated_rects(self):
+        return (self.crosshair_rect,)
         
     def handle_input(self, keys, joystick=None):
         if self.winner: return
@@ -732,10 +902,11 @@ class TargetMinigame:
         if self.winner:
             self.game_over_timer += 1
             return self.winner if self.game_over_timer > 180 else None
+        self.ticks += 1
             
         self.timer -= 1
         if self.timer <= 0:
-            self.winner = f"Time's Up! Score: {self.score}"
+            self.finish(PLAYER, "time_up", f"Time's Up! Score: {self.score}", self.score)
             
         self.spawn_timer += 1
         if self.spawn_timer > 40:
@@ -749,29 +920,27 @@ class TargetMinigame:
     def draw(self):
         self.screen.fill(WHITE)
         
-        for t in self.targets:
-            pygame.draw.circle(self.screen, RED, t.center, 20)
-            pygame.draw.circle(self.screen, WHITE, t.center, 15)
-            pygame.draw.circle(self.screen, RED, t.center, 10)
+        self.batch.add_many(get_atlas().target(), self.targets)
+        self.batch.flush(self.screen)
             
         # Crosshair
-        pygame.draw.line(self.screen, BLACK, (self.crosshair_rect.centerx - 10, self.crosshair_rect.centery), (self.crosshair_rect.centerx + 10, self.crosshair_rect.centery), 2)
-        pygame.draw.line(self.screen, BLACK, (self.crosshair_rect.centerx, self.crosshair_rect.centery - 10), (self.crosshair_rect.centerx, self.crosshair_rect.centery + 10), 2)
+        crosshair_rect = self.lerp_rect(self.crosshair_rect)
+        pygame.draw.line(self.screen, BLACK, (crosshair_rect.centerx - 10, crosshair_rect.centery), (crosshair_rect.centerx + 10, crosshair_rect.centery), 2)
+        pygame.draw.line(self.screen, BLACK, (crosshair_rect.centerx, crosshair_rect.centery - 10), (crosshair_rect.centerx, crosshair_rect.centery + 10), 2)
         
         # HUD
-        score_text = self.font.render(f"Score: {self.score}", True, BLACK)
-        time_text = self.font.render(f"Time: {self.timer // 60}", True, BLACK)
-        self.screen.blit(score_text, (20, 20))
-        self.screen.blit(time_text, (SCREEN_WIDTH - 200, 20))
+        self.draw_hud(f"Score: {self.score}", BLACK, (20, 20))
+        self.draw_hud(f"Time: {self.timer // 60}", BLACK, (SCREEN_WIDTH - 200, 20))
         
         if self.winner:
-            win_text = self.font.render(self.winner, True, BLACK)
+            win_text = self.render_hud("winner", self.winner, BLACK)
             self.screen.blit(win_text, (SCREEN_WIDTH//2 - win_text.get_width()//2, SCREEN_HEIGHT//2))
 
-class CoinMinigame:
+class CoinMinigame(Minigame):
     def __init__(self, screen, font, player_num=1):
         self.screen = screen
         self.font = font
+        self.batch = RenderBatch()
         self.player_num = player_num
         self.colors = [BLUE, RED, GREEN, YELLOW]
         self.reset()
@@ -784,11 +953,19 @@ class CoinMinigame:
         self.timer = 600 # 10 seconds
         self.winner = None
         self.game_over_timer = 0
+        self.result = None
+        self.ticks = 0
         
         # Spawn initial coins
         for _ in range(10):
             self.spawn_coin()
             
+    def rebuild(self, previous=None):
+        self.batch = RenderBatch()
+        
+    def interpolated_rects(self):
+        return (self.player_rect,)
+        
     def spawn_coin(self):
         x = random.randint(50, SCREEN_WIDTH - 50)
         y = random.randint(50, SCREEN_HEIGHT - 50)
@@ -820,16 +997,18 @@ class CoinMinigame:
             if self.player_rect.colliderect(c):
                 self.coins.remove(c)
                 self.score += 1
+                audio.play("coin")
                 self.spawn_coin() # Keep spawning
                 
     def update(self):
         if self.winner:
             self.game_over_timer += 1
             return self.winner if self.game_over_timer > 180 else None
+        self.ticks += 1
             
         self.timer -= 1
         if self.timer <= 0:
-            self.winner = f"Time's Up! Coins: {self.score}"
+            self.finish(PLAYER, "time_up", f"Time's Up! Coins: {self.score}", self.score)
             
         return None
 
@@ -837,17 +1016,17 @@ class CoinMinigame:
         self.screen.fill((0, 100, 100))
         
         # Player
-        pygame.draw.rect(self.screen, self.player_color, self.player_rect)
+        pygame.draw.rect(self.screen, self.player_color, self.lerp_rect(self.player_rect))
         
         # Coins
-        for c in self.coins:
-            pygame.draw.circle(self.screen, YELLOW, c.center, 10)
+        self.batch.add_many(get_atlas().coin(), self.coins)
+        self.batch.flush(self.screen)
             
         if self.winner:
-            win_text = self.font.render(self.winner, True, WHITE)
+            win_text = self.render_hud("winner", self.winner, WHITE)
             self.screen.blit(win_text, (SCREEN_WIDTH//2 - win_text.get_width()//2, SCREEN_HEIGHT//2))
 
-class SnakeMinigame:
+class SnakeMinigame(Minigame):
     def __init__(self, screen, font, player_num=1):
         self.screen = screen
         self.font = font
@@ -866,6 +1045,8 @@ class SnakeMinigame:
         self.speed_delay = 5 # Lower is faster
         self.winner = None
         self.game_over_timer = 0
+        self.result = None
+        self.ticks = 0
         self.player_color = self.colors[(self.player_num - 1) % 4]
         
     def spawn_food(self):
@@ -898,6 +1079,7 @@ class SnakeMinigame:
         if self.winner:
             self.game_over_timer += 1
             return self.winner if self.game_over_timer > 180 else None
+        self.ticks += 1
             
         self.move_timer += 1
         if self.move_timer > self.speed_delay:
@@ -909,12 +1091,12 @@ class SnakeMinigame:
             
             # Wall Collision
             if new_head[0] < 0 or new_head[0] >= SCREEN_WIDTH or new_head[1] < 0 or new_head[1] >= SCREEN_HEIGHT:
-                self.winner = f"Game Over! Score: {self.score}"
+                self.finish(NOBODY, "wall", f"Game Over! Score: {self.score}", self.score)
                 return None
                 
             # Self Collision
             if new_head in self.snake:
-                self.winner = f"Game Over! Score: {self.score}"
+                self.finish(NOBODY, "self_collision", f"Game Over! Score: {self.score}", self.score)
                 return None
                 
             self.snake.insert(0, new_head)
@@ -923,7 +1105,7 @@ class SnakeMinigame:
                 self.score += 1
                 self.food = self.spawn_food()
                 if self.score >= 10:
-                    self.winner = "You Win!"
+                    self.finish(PLAYER, "length", "You Win!", self.score)
             else:
                 self.snake.pop()
                 
@@ -941,17 +1123,17 @@ class SnakeMinigame:
             pygame.draw.rect(self.screen, BLACK, (segment[0], segment[1], self.cell_size, self.cell_size), 1)
             
         # HUD
-        score_text = self.font.render(f"Score: {self.score}/10", True, WHITE)
-        self.screen.blit(score_text, (20, 20))
+        self.draw_hud(f"Score: {self.score}/10", WHITE, (20, 20))
         
         if self.winner:
-            win_text = self.font.render(self.winner, True, WHITE)
+            win_text = self.render_hud("winner", self.winner, WHITE)
             self.screen.blit(win_text, (SCREEN_WIDTH//2 - win_text.get_width()//2, SCREEN_HEIGHT//2))
 
-class SpaceShooterMinigame:
+class SpaceShooterMinigame(Minigame):
     def __init__(self, screen, font, player_num=1):
         self.screen = screen
         self.font = font
+        self.batch = RenderBatch()
         self.player_num = player_num
         self.colors = [BLUE, RED, GREEN, YELLOW]
         self.reset()
@@ -966,7 +1148,19 @@ class SpaceShooterMinigame:
         self.lives = 3
         self.winner = None
         self.game_over_timer = 0
+        self.result = None
+        self.ticks = 0
         self.shoot_cooldown = 0
+        self.starfield = get_starfield(self.screen.get_size(), like=self.screen)
+        
+    def rebuild(self, previous=None):
+        self.batch = RenderBatch()
+        self.starfield = get_starfield(self.screen.get_size(), like=self.screen)
+        
+    def interpolated_rects(self):
+        yield self.player_rect
+        yield from self.bullets
+        yield from self.enemies
         
     def handle_input(self, keys, joystick=None):
         if self.winner: return
@@ -991,9 +1185,13 @@ class SpaceShooterMinigame:
             self.shoot_cooldown = 15
             
     def update(self):
+        self.starfield = tier_starfield(self.screen.get_size(), self.starfield, like=self.screen) # Follows the quality tier
+        self.starfield.update()
+        
         if self.winner:
             self.game_over_timer += 1
             return self.winner if self.game_over_timer > 180 else None
+        self.ticks += 1
             
         if self.shoot_cooldown > 0: self.shoot_cooldown -= 1
         
@@ -1026,52 +1224,46 @@ class SpaceShooterMinigame:
                     self.score += 1
                     
         if self.lives <= 0:
-            self.winner = f"Game Over! Score: {self.score}"
+            self.finish(NOBODY, "lives", f"Game Over! Score: {self.score}", self.score)
             
         if self.score >= 15:
-            self.winner = "Galaxy Saved! Win!"
+            self.finish(PLAYER, "score", "Galaxy Saved! Win!", self.score)
             
         return None
 
     def draw(self):
-        self.screen.fill(BLACK)
-        
-        # Stars background
-        for _ in range(5):
-            pygame.draw.circle(self.screen, WHITE, (random.randint(0, SCREEN_WIDTH), random.randint(0, SCREEN_HEIGHT)), 1)
+        # Stars background (parallax layers, one blit each)
+        self.starfield.draw(self.screen)
             
         # Player
+        player_rect = self.lerp_rect(self.player_rect)
         pygame.draw.polygon(self.screen, self.player_color, [
-            (self.player_rect.centerx, self.player_rect.top),
-            (self.player_rect.left, self.player_rect.bottom),
-            (self.player_rect.right, self.player_rect.bottom)
+            (player_rect.centerx, player_rect.top),
+            (player_rect.left, player_rect.bottom),
+            (player_rect.right, player_rect.bottom)
         ])
         
-        # Bullets
-        for b in self.bullets:
-            pygame.draw.rect(self.screen, YELLOW, b)
-            
-        # Enemies
-        for e in self.enemies:
-            pygame.draw.rect(self.screen, RED, e)
-            # Eyes
-            pygame.draw.rect(self.screen, GREEN, (e.x + 5, e.y + 10, 5, 5))
-            pygame.draw.rect(self.screen, GREEN, (e.right - 10, e.y + 10, 5, 5))
+        # Bullets and Enemies
+        atlas = get_atlas()
+        self.batch.add_many(atlas.block(YELLOW, 4, 10), [self.lerp_pos(b) for b in self.bullets])
+        self.batch.add_many(atlas.enemy(), [self.lerp_pos(e) for e in self.enemies])
+        self.batch.flush(self.screen)
             
         # HUD
-        score_text = self.font.render(f"Score: {self.score}/15", True, WHITE)
-        lives_text = self.font.render(f"Lives: {self.lives}", True, RED)
-        self.screen.blit(score_text, (20, 20))
-        self.screen.blit(lives_text, (SCREEN_WIDTH - 150, 20))
+        self.draw_hud(f"Score: {self.score}/15", WHITE, (20, 20))
+        self.draw_hud(f"Lives: {self.lives}", RED, (SCREEN_WIDTH - 150, 20))
         
         if self.winner:
-            win_text = self.font.render(self.winner, True, WHITE)
+            win_text = self.render_hud("winner", self.winner, WHITE)
             self.screen.blit(win_text, (SCREEN_WIDTH//2 - win_text.get_width()//2, SCREEN_HEIGHT//2))
 
-class PacmanMinigame:
+class PacmanMinigame(Minigame):
+    unsaved = Minigame.unsaved + ("walls",) # Rebuilt from the map
+    
     def __init__(self, screen, font, player_num=1):
         self.screen = screen
         self.font = font
+        self.batch = RenderBatch()
         self.player_num = player_num
         self.colors = [BLUE, RED, GREEN, YELLOW]
         self.reset()
@@ -1126,8 +1318,20 @@ class PacmanMinigame:
         self.score = 0
         self.winner = None
         self.game_over_timer = 0
+        self.result = None
+        self.ticks = 0
         self.lives = 3
         
+    def rebuild(self, previous=None):
+        self.batch = RenderBatch()
+        self.walls = [pygame.Rect(c * self.cell_size, r * self.cell_size, self.cell_size, self.cell_size)
+                      for r, row in enumerate(self.map) for c, char in enumerate(row) if char == 'W']
+        
+    def interpolated_rects(self):
+        yield self.player_rect
+        for ghost in self.ghosts:
+            yield ghost['rect']
+        
     def handle_input(self, keys, joystick=None):
         if self.winner: return
         
@@ -1159,6 +1363,7 @@ class PacmanMinigame:
         if self.winner:
             self.game_over_timer += 1
             return self.winner if self.game_over_timer > 180 else None
+        self.ticks += 1
             
         # Try to change direction if aligned to grid
         # Center point logic is tricky with smooth movement. 
@@ -1178,7 +1383,7 @@ class PacmanMinigame:
                 self.score += 10
                 
         if not self.dots:
-            self.winner = f"Level Clear! Score: {self.score}"
+            self.finish(PLAYER, "level_clear", f"Level Clear! Score: {self.score}", self.score)
             
         # Ghost AI (Simple)
         for ghost in self.ghosts:
@@ -1208,44 +1413,41 @@ class PacmanMinigame:
                 self.direction = (0, 0)
                 self.next_direction = (0, 0)
                 if self.lives <= 0:
-                    self.winner = f"Game Over! Score: {self.score}"
+                    self.finish(NOBODY, "caught", f"Game Over! Score: {self.score}", self.score)
                     
         return None
 
     def draw(self):
         self.screen.fill(BLACK)
         
-        # Walls
-        for wall in self.walls:
-            pygame.draw.rect(self.screen, BLUE, wall)
-            pygame.draw.rect(self.screen, BLACK, wall.inflate(-4, -4)) # Hollow look
+        atlas = get_atlas()
+        
+        # Walls (hollow look baked into the tile)
+        self.batch.add_many(atlas.wall_tile(self.cell_size, BLUE), self.walls, layer=0)
             
         # Dots
-        for dot in self.dots:
-            pygame.draw.circle(self.screen, (255, 184, 151), dot.center, 3)
+        self.batch.add_many(atlas.circle((255, 184, 151), 3), [(dot.centerx - 3, dot.centery - 3) for dot in self.dots], layer=1)
             
         # Player
-        pygame.draw.circle(self.screen, self.player_color, self.player_rect.center, 13)
+        player_rect = self.lerp_rect(self.player_rect)
+        self.batch.add(atlas.circle(self.player_color, 13), (player_rect.centerx - 13, player_rect.centery - 13), layer=2)
         # Mouth animation could be added here
         
         # Ghosts
         for ghost in self.ghosts:
-            pygame.draw.circle(self.screen, ghost['color'], ghost['rect'].center, 13)
-            # Eyes
-            pygame.draw.circle(self.screen, WHITE, (ghost['rect'].centerx - 4, ghost['rect'].centery - 4), 3)
-            pygame.draw.circle(self.screen, WHITE, (ghost['rect'].centerx + 4, ghost['rect'].centery - 4), 3)
+            self.batch.add(atlas.ghost(ghost['color']), self.lerp_pos(ghost['rect']), layer=3)
+            
+        self.batch.flush(self.screen)
 
         # HUD
-        score_text = self.font.render(f"Score: {self.score}", True, WHITE)
-        lives_text = self.font.render(f"Lives: {self.lives}", True, RED)
-        self.screen.blit(score_text, (20, SCREEN_HEIGHT - 30))
-        self.screen.blit(lives_text, (SCREEN_WIDTH - 150, SCREEN_HEIGHT - 30))
+        self.draw_hud(f"Score: {self.score}", WHITE, (20, SCREEN_HEIGHT - 30))
+        self.draw_hud(f"Lives: {self.lives}", RED, (SCREEN_WIDTH - 150, SCREEN_HEIGHT - 30))
         
         if self.winner:
-            win_text = self.font.render(self.winner, True, WHITE)
+            win_text = self.render_hud("winner", self.winner, WHITE)
             self.screen.blit(win_text, (SCREEN_WIDTH//2 - win_text.get_width()//2, SCREEN_HEIGHT//2))
 
-class BlockBreakerMinigame:
+class BlockBreakerMinigame(Minigame):
     def __init__(self, screen, font, player_num=1):
         self.screen = screen
         self.font = font
@@ -1265,6 +1467,7 @@ class BlockBreakerMinigame:
         self.ball_dy = -5
         
         self.blocks = []
+        self.block_colors = [] # Picked once here instead of every frame
         rows = 5
         cols = 8
         block_w = SCREEN_WIDTH // cols
@@ -1272,10 +1475,49 @@ class BlockBreakerMinigame:
         for r in range(rows):
             for c in range(cols):
                 self.blocks.append(pygame.Rect(c * block_w + 5, r * block_h + 50, block_w - 10, block_h - 10))
+                self.block_colors.append((random.randint(50, 255), random.randint(50, 255), 255))
+                
+        self.build_brick_layer()
                 
         self.score = 0
         self.winner = None
         self.game_over_timer = 0
+        self.result = None
+        self.ticks = 0
+        
+    def rebuild(self, previous=None):
+        if isinstance(previous, BlockBreakerMinigame) and previous.brick_offset == self.brick_offset:
+            # Rollback within the same wall: only repaint the bricks that differ
+            area = pygame.Rect(self.brick_offset, previous.brick_layer.get_size())
+            if not self.blocks or area.contains(self.blocks[0].unionall(self.blocks)):
+                self.brick_layer = previous.brick_layer
+                before = set(zip(map(tuple, previous.blocks), previous.block_colors))
+                after = set(zip(map(tuple, self.blocks), self.block_colors))
+                for block, color in before - after:
+                    self.erase_brick(pygame.Rect(block))
+                for block, color in after - before:
+                    self.brick_layer.fill(color, pygame.Rect(block).move(-self.brick_offset[0], -self.brick_offset[1]))
+                return
+        if self.blocks:
+            self.build_brick_layer()
+        else:
+            self.brick_layer = pygame.Surface((0, 0))
+        
+    def build_brick_layer(self):
+        # Paint the whole wall once; destroyed bricks are erased from it in update
+        area = self.blocks[0].unionall(self.blocks)
+        self.brick_offset = area.topleft
+        self.brick_layer = pygame.Surface(area.size, 0, self.screen)
+        self.brick_layer.fill(BLACK)
+        self.brick_layer.set_colorkey(BLACK) # Brick colors never go below 50, so black is free
+        for block, color in zip(self.blocks, self.block_colors):
+            self.brick_layer.fill(color, block.move(-area.x, -area.y))
+            
+    def erase_brick(self, block):
+        self.brick_layer.fill(BLACK, block.move(-self.brick_offset[0], -self.brick_offset[1]))
+        
+    def interpolated_rects(self):
+        return (self.player_rect, self.ball_rect)
         
     def handle_input(self, keys, joystick=None):
         if self.winner: return
@@ -1296,6 +1538,7 @@ class BlockBreakerMinigame:
         if self.winner:
             self.game_over_timer += 1
             return self.winner if self.game_over_timer > 180 else None
+        self.ticks += 1
             
         self.ball_rect.x += self.ball_dx
         self.ball_rect.y += self.ball_dy
@@ -1317,36 +1560,38 @@ class BlockBreakerMinigame:
         hit_index = self.ball_rect.collidelist(self.blocks)
         if hit_index != -1:
             block = self.blocks.pop(hit_index)
+            self.block_colors.pop(hit_index)
+            self.erase_brick(block)
+            audio.play("brick")
             self.ball_dy *= -1
             self.score += 10
             
         # Lose condition
         if self.ball_rect.top > SCREEN_HEIGHT:
-            self.winner = f"Game Over! Score: {self.score}"
+            self.finish(NOBODY, "ball_lost", f"Game Over! Score: {self.score}", self.score)
             
         # Win condition
         if not self.blocks:
-            self.winner = f"You Win! Score: {self.score}"
+            self.finish(PLAYER, "bricks_cleared", f"You Win! Score: {self.score}", self.score)
             
         return None
         
     def draw(self):
         self.screen.fill(BLACK)
         
-        pygame.draw.rect(self.screen, self.player_color, self.player_rect)
-        pygame.draw.circle(self.screen, WHITE, self.ball_rect.center, self.ball_radius)
+        pygame.draw.rect(self.screen, self.player_color, self.lerp_rect(self.player_rect))
+        pygame.draw.circle(self.screen, WHITE, self.lerp_rect(self.ball_rect).center, self.ball_radius)
         
-        for block in self.blocks:
-            pygame.draw.rect(self.screen, (random.randint(50, 255), random.randint(50, 255), 255), block)
+        # Whole wall in one blit, however many bricks are left
+        self.screen.blit(self.brick_layer, self.brick_offset)
             
-        score_text = self.font.render(f"Score: {self.score}", True, WHITE)
-        self.screen.blit(score_text, (20, 20))
+        self.draw_hud(f"Score: {self.score}", WHITE, (20, 20))
         
         if self.winner:
-            win_text = self.font.render(self.winner, True, WHITE)
+            win_text = self.render_hud("winner", self.winner, WHITE)
             self.screen.blit(win_text, (SCREEN_WIDTH//2 - win_text.get_width()//2, SCREEN_HEIGHT//2))
 
-class RoadCrosserMinigame:
+class RoadCrosserMinigame(Minigame):
     def __init__(self, screen, font, player_num=1):
         self.screen = screen
         self.font = font
@@ -1368,8 +1613,15 @@ class RoadCrosserMinigame:
         self.spawn_timer = 0
         self.winner = None
         self.game_over_timer = 0
+        self.result = None
+        self.ticks = 0
         self.level = 1
         
+    def interpolated_rects(self):
+        yield self.player_rect
+        for lane in self.lanes:
+            yield from lane['cars']
+        
     def handle_input(self, keys, joystick=None):
         if self.winner: return
         
@@ -1391,6 +1643,7 @@ class RoadCrosserMinigame:
         if self.winner:
             self.game_over_timer += 1
             return self.winner if self.game_over_timer > 180 else None
+        self.ticks += 1
             
         # Spawn cars
         self.spawn_timer += 1
@@ -1408,14 +1661,14 @@ class RoadCrosserMinigame:
                 car.x += lane['speed']
                 # Collision
                 if car.colliderect(self.player_rect):
-                    self.winner = "Splat! Game Over!"
+                    self.finish(NOBODY, "car", "Splat! Game Over!", self.level)
                 # Cleanup
                 if (lane['speed'] > 0 and car.x > SCREEN_WIDTH + 50) or (lane['speed'] < 0 and car.x < -100):
                     lane['cars'].remove(car)
                     
         # Win condition (Reach top)
         if self.player_rect.top < 50:
-            self.winner = f"Level {self.level} Complete!"
+            self.finish(PLAYER, "crossed", f"Level {self.level} Complete!", self.level)
             # Could reset for endless, but simple win for now
             
         return None
@@ -1431,6 +1684,7 @@ class RoadCrosserMinigame:
         for lane in self.lanes:
             pygame.draw.line(self.screen, YELLOW, (0, lane['y'] + 40), (SCREEN_WIDTH, lane['y'] + 40), 2) # Lane divider
             for car in lane['cars']:
+                car = self.lerp_rect(car)
                 pygame.draw.rect(self.screen, RED, car)
                 # Wheels
                 pygame.draw.rect(self.screen, BLACK, (car.x + 5, car.y - 2, 10, 4))
@@ -1438,13 +1692,13 @@ class RoadCrosserMinigame:
                 pygame.draw.rect(self.screen, BLACK, (car.x + 5, car.bottom - 2, 10, 4))
                 pygame.draw.rect(self.screen, BLACK, (car.x + car.width - 15, car.bottom - 2, 10, 4))
                 
-        pygame.draw.rect(self.screen, self.player_color, self.player_rect)
+        pygame.draw.rect(self.screen, self.player_color, self.lerp_rect(self.player_rect))
         
         if self.winner:
-            win_text = self.font.render(self.winner, True, WHITE)
+            win_text = self.render_hud("winner", self.winner, WHITE)
             self.screen.blit(win_text, (SCREEN_WIDTH//2 - win_text.get_width()//2, SCREEN_HEIGHT//2))
 
-class FlappyMinigame:
+class FlappyMinigame(Minigame):
     def __init__(self, screen, font, player_num=1):
         self.screen = screen
         self.font = font
@@ -1469,6 +1723,14 @@ class FlappyMinigame:
         self.score = 0
         self.winner = None
         self.game_over_timer = 0
+        self.result = None
+        self.ticks = 0
+        
+    def interpolated_rects(self):
+        yield self.player_rect
+        for pipe in self.pipes:
+            yield pipe['top']
+            yield pipe['bottom']
         
     def handle_input(self, keys, joystick=None):
         if self.winner: return
@@ -1486,6 +1748,7 @@ class FlappyMinigame:
         if self.winner:
             self.game_over_timer += 1
             return self.winner if self.game_over_timer > 180 else None
+        self.ticks += 1
             
         # Physics
         self.velocity += self.gravity
@@ -1493,7 +1756,7 @@ class FlappyMinigame:
         
         # Floor/Ceiling
         if self.player_rect.top < 0 or self.player_rect.bottom > SCREEN_HEIGHT:
-            self.winner = f"Game Over! Score: {self.score}"
+            self.finish(NOBODY, "out_of_bounds", f"Game Over! Score: {self.score}", self.score)
             
         # Pipes
         self.pipe_timer += 1
@@ -1512,7 +1775,7 @@ class FlappyMinigame:
             
             # Collision
             if self.player_rect.colliderect(pipe['top']) or self.player_rect.colliderect(pipe['bottom']):
-                self.winner = f"Game Over! Score: {self.score}"
+                self.finish(NOBODY, "pipe", f"Game Over! Score: {self.score}", self.score)
                 
             # Score
             if not pipe['passed'] and pipe['top'].right < self.player_rect.left:
@@ -1524,7 +1787,7 @@ class FlappyMinigame:
                 self.pipes.remove(pipe)
                 
         if self.score >= 10:
-            self.winner = "You Flew High! Win!"
+            self.finish(PLAYER, "score", "You Flew High! Win!", self.score)
             
         return None
         
@@ -1532,19 +1795,21 @@ class FlappyMinigame:
         self.screen.fill((135, 206, 235)) # Sky blue
         
         for pipe in self.pipes:
-            pygame.draw.rect(self.screen, GREEN, pipe['top'])
-            pygame.draw.rect(self.screen, GREEN, pipe['bottom'])
+            top = self.lerp_rect(pipe['top'])
+            bottom = self.lerp_rect(pipe['bottom'])
+            pygame.draw.rect(self.screen, GREEN, top)
+            pygame.draw.rect(self.screen, GREEN, bottom)
             # Pipe caps
-            pygame.draw.rect(self.screen, (0, 200, 0), (pipe['top'].x - 2, pipe['top'].bottom - 20, self.pipe_width + 4, 20))
-            pygame.draw.rect(self.screen, (0, 200, 0), (pipe['bottom'].x - 2, pipe['bottom'].top, self.pipe_width + 4, 20))
+            pygame.draw.rect(self.screen, (0, 200, 0), (top.x - 2, top.bottom - 20, self.pipe_width + 4, 20))
+            pygame.draw.rect(self.screen, (0, 200, 0), (bottom.x - 2, bottom.top, self.pipe_width + 4, 20))
             
-        pygame.draw.rect(self.screen, self.player_color, self.player_rect)
+        player_rect = self.lerp_rect(self.player_rect)
+        pygame.draw.rect(self.screen, self.player_color, player_rect)
         # Eye
-        pygame.draw.rect(self.screen, WHITE, (self.player_rect.right - 10, self.player_rect.y + 5, 8, 8))
+        pygame.draw.rect(self.screen, WHITE, (player_rect.right - 10, player_rect.y + 5, 8, 8))
         
-        score_text = self.font.render(str(self.score), True, WHITE)
-        self.screen.blit(score_text, (SCREEN_WIDTH//2 - score_text.get_width()//2, 50))
+        self.draw_hud(str(self.score), WHITE, (SCREEN_WIDTH//2, 50), center=True)
         
         if self.winner:
-            win_text = self.font.render(self.winner, True, WHITE)
+            win_text = self.render_hud("winner", self.winner, WHITE)
             self.screen.blit(win_text, (SCREEN_WIDTH//2 - win_text.get_width()//2, SCREEN_HEIGHT//2))
@@ -0,0 +1,26 @@
+import os
+import sys
+
+def option(flag, env=None, default=None):
+    # "--flag value" on the command line, else the environment variable, else default.
+    # A following --other-flag is not taken as the value
+    if flag in sys.argv:
+        i = sys.argv.index(flag)
+        if i + 1 < len(sys.argv) and not sys.argv[i + 1].startswith("--"):
+            return sys.argv[i + 1]
+    if env:
+        return os.environ.get(env, default)
+    return default
+
+def number_option(flag, env=None, default=0, parse=int, minimum=None):
+    # option() as a number; anything unparsable or below minimum (nan included) falls back to
+    # default with a message instead of failing at startup
+    value = option(flag, env, default)
+    try:
+        number = parse(value)
+    except (TypeError, ValueError):
+        number = None
+    if number is None or not (minimum is None or number >= minimum):
+        print(f"Invalid {flag} {value}, using {default}")
+        return default
+    return number
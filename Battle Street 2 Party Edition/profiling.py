@@ -0,0 +1,175 @@
+import io
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from options import option
+
+def code_name(code):
+    # "minigames.py:PacmanMinigame.can_move"
+    return f"{os.path.basename(code.co_filename)}:{getattr(code, 'co_qualname', code.co_name)}"
+
+class StackSampler:
+    """ Low-overhead alternative to cProfile: a thread that records the main thread's
+    Python stack every interval. Counts are in collapsed-stack (flamegraph) format. """
+
+    def __init__(self, thread_id, interval=0.001):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.sample_loop, name="profiler", daemon=True)
+        self.switch_interval = sys.getswitchinterval()
+
+    def start(self):
+        # The default 5 ms GIL switch interval would only let us sample where the game
+        # releases the GIL (waits, flips), not inside the Python code we care about
+        sys.setswitchinterval(min(self.switch_interval, self.interval / 2))
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+        sys.setswitchinterval(self.switch_interval)
+
+    def sample_loop(self):
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(code_name(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+class SceneProfiler:
+    """ Profiles one scene - a minigame class or a GameState - only while it is on screen,
+    and writes the results when it exits. Armed with --profile TARGET or BS2_PROFILE=TARGET,
+    where TARGET is e.g. PacmanMinigame, BOARD or PacmanMinigame.can_move (reports focus on
+    that function). F9 profiles whatever scene is current until F9 again or the scene ends.
+    --profile-mode sample (or BS2_PROFILE_MODE=sample) uses the sampling thread instead of
+    cProfile. Output goes to profiles/ next to the game. """
+
+    CPROFILE = "cprofile"
+    SAMPLE = "sample"
+
+    def __init__(self, output_dir, target=None, mode=None):
+        if target is None:
+            target = option("--profile", "BS2_PROFILE")
+        if mode is None:
+            mode = option("--profile-mode", "BS2_PROFILE_MODE", self.CPROFILE)
+        self.output_dir = output_dir
+        self.mode = mode if mode in (self.CPROFILE, self.SAMPLE) else self.CPROFILE
+        self.scene = None # --profile target, kept for the whole session
+        self.function = None
+        self.arm(target)
+
+        self.active = None # Scene being profiled
+        self.focus = None # Function the active profile reports on
+        self.held = None # Scene F9 stopped the target in: not restarted until it is left
+        self.count = 0 # Profiles written, keeps file names unique
+        self.profile = None
+        self.sampler = None
+        self.started = 0.0
+
+    def arm(self, target):
+        # "PacmanMinigame.can_move" -> scene PacmanMinigame, focus on can_move
+        if not target:
+            self.scene = self.function = None
+            return
+        self.scene, _, function = target.partition(".")
+        self.function = function or None
+        print(f"Profiler armed for {target} ({self.mode})")
+
+    def frame(self, scene):
+        # Called once per frame with the current scene label
+        if self.active is not None and scene != self.active:
+            self.stop()
+        if scene != self.held:
+            self.held = None
+        if self.active is None and scene == self.scene and self.held is None:
+            self.start(scene, self.function)
+
+    def toggle(self, scene):
+        # Hotkey: profile the current scene now, or stop early. The --profile target
+        # stays armed and fires again the next time its scene comes up.
+        if self.active is not None:
+            self.held = self.active # Don't restart right away
+            self.stop()
+        else:
+            self.start(scene)
+
+    def start(self, scene, function=None):
+        self.active = scene
+        self.focus = function
+        self.started = time.perf_counter()
+        if self.mode == self.SAMPLE:
+            self.sampler = StackSampler(threading.get_ident())
+            self.sampler.start()
+        else:
+            import cProfile # Only when profiling, it costs startup time otherwise
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+        print(f"Profiling {scene}...")
+
+    def stop(self):
+        if self.active is None:
+            return
+        if self.profile:
+            self.profile.disable()
+        if self.sampler:
+            self.sampler.stop()
+        seconds = time.perf_counter() - self.started
+        try:
+            self.write(seconds)
+        except Exception as e:
+            print(f"Error writing profile: {e}")
+        self.active = None
+        self.profile = None
+        self.sampler = None
+
+    def write(self, seconds):
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.count += 1
+        base = os.path.join(self.output_dir, f"{self.active}_{time.strftime('%Y%m%d_%H%M%S')}_{self.count}")
+        if self.profile:
+            path = base + ".pstats"
+            self.profile.dump_stats(path)
+            import pstats
+            out = io.StringIO()
+            stats = pstats.Stats(self.profile, stream=out).sort_stats("cumulative")
+            if self.focus:
+                stats.print_stats(rf"\({self.focus}\)")
+                stats.print_callers(rf"\({self.focus}\)")
+            else:
+                stats.print_stats(15)
+            print(out.getvalue())
+        else:
+            path = base + ".folded"
+            stacks = self.sampler.stacks
+            if self.focus:
+                # Only stacks through the function, rooted at it
+                focused = Counter()
+                for stack, count in stacks.items():
+                    frames = stack.split(";")
+                    for i, name in enumerate(frames):
+                        if name.endswith("." + self.focus) or name.endswith(":" + self.focus):
+                            focused[";".join(frames[i:])] += count
+                            break
+                stacks = focused
+            with open(path, "w") as f:
+                for stack, count in stacks.most_common():
+                    f.write(f"{stack} {count}\n")
+            self.print_top(stacks)
+        print(f"Profile of {self.active} ({seconds:.1f} s) written to {path}")
+
+    def print_top(self, stacks, limit=15):
+        # Self time per function, from the leaf of each stack
+        own = Counter()
+        for stack, count in stacks.items():
+            own[stack.rsplit(";", 1)[-1]] += count
+        total = sum(own.values()) or 1
+        print(f"Top functions by samples ({total} samples):")
+        for name, count in own.most_common(limit):
+            print(f"  {count / total * 100:5.1f}%  {name}")
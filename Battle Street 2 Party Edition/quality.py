@@ -0,0 +1,84 @@
+from collections import deque
+
+# Best first. Each step down trades looks for frame time.
+# There is no render-scale step: minigames draw with pygame.draw and blits at fixed
+# coordinates, which pygame cannot draw scaled, so a lower internal resolution means an
+# extra upscale pass per frame. At 0.7 that pass alone (0.85 ms at 800x600) costs more
+# than most minigames' whole draw (0.2-0.45 ms, bench_draw.py); their draw time is per
+# call overhead, not fill rate. Full-screen layers (starfield) are the fill-rate knob.
+QUALITY_TIERS = [
+    {"name": "HIGH", "star_layers": 3, "star_density": 1.0, "antialias": True, "hud_interval": 1},
+    {"name": "MEDIUM", "star_layers": 2, "star_density": 0.6, "antialias": True, "hud_interval": 2},
+    {"name": "LOW", "star_layers": 1, "star_density": 0.3, "antialias": False, "hud_interval": 4},
+]
+
+_active_tier = QUALITY_TIERS[0]
+_frame = 0 # Frames recorded so far, HUD refresh intervals count against it
+
+def current_tier():
+    return _active_tier
+
+def current_frame():
+    return _frame
+
+class QualityGovernor:
+    """ Watches a rolling window of frame work times and steps quality tiers down when
+    frames go over budget, and back up when there is headroom """
+
+    def __init__(self, fps, tiers=None, window=60, down_ratio=1.0, up_ratio=0.6, cooldown=120, enabled=True, start_tier=0):
+        self.budget = 1.0 / fps
+        self.tiers = tiers or QUALITY_TIERS
+        self.window = deque(maxlen=window)
+        self.gc_window = deque(maxlen=window) # Collector pauses inside those frames
+        self.down_ratio = down_ratio # Step down when the average is above budget * this
+        self.up_ratio = up_ratio # Step up when the average is below budget * this
+        self.cooldown_frames = cooldown # Let a change settle before judging again
+        self.cooldown = 0
+        self.enabled = enabled
+        self.index = 0
+        self.set_tier(start_tier)
+
+    @property
+    def tier(self):
+        return self.tiers[self.index]
+
+    @property
+    def gc_ms(self):
+        if not self.gc_window:
+            return 0.0
+        return sum(self.gc_window) / len(self.gc_window) * 1000
+
+    @property
+    def average_ms(self):
+        if not self.window:
+            return 0.0
+        return sum(self.window) / len(self.window) * 1000
+
+    def set_tier(self, index):
+        global _active_tier
+        self.index = max(0, min(len(self.tiers) - 1, index))
+        _active_tier = self.tiers[self.index]
+        self.window.clear()
+        self.cooldown = self.cooldown_frames
+
+    def record(self, seconds, gc_seconds=0.0):
+        # Returns True when the tier changed. GC pauses are kept apart,
+        # dropping render quality would not make them any shorter.
+        global _frame
+        _frame += 1
+        self.window.append(max(0.0, seconds - gc_seconds))
+        self.gc_window.append(gc_seconds)
+        if self.cooldown > 0:
+            self.cooldown -= 1
+        if not self.enabled or self.cooldown > 0 or len(self.window) < self.window.maxlen:
+            return False
+
+        average = sum(self.window) / len(self.window)
+        if average > self.budget * self.down_ratio and self.index < len(self.tiers) - 1:
+            self.set_tier(self.index + 1)
+        elif average < self.budget * self.up_ratio and self.index > 0:
+            self.set_tier(self.index - 1)
+        else:
+            return False
+        print(f"Quality tier -> {self.tier['name']} (avg frame {average * 1000:.1f} ms, budget {self.budget * 1000:.1f} ms)")
+        return True
@@ -0,0 +1,30 @@
+class RenderBatch:
+    """ Collects (sprite, position) pairs during draw and submits them with one blits call per layer """
+
+    def __init__(self):
+        self.layers = {}
+
+    def add(self, sprite, pos, layer=0):
+        items = self.layers.get(layer)
+        if items is None:
+            items = self.layers[layer] = []
+        items.append((sprite, pos))
+
+    def add_many(self, sprite, positions, layer=0):
+        items = self.layers.get(layer)
+        if items is None:
+            items = self.layers[layer] = []
+        items.extend((sprite, pos) for pos in positions)
+
+    def flush(self, surface):
+        # Lower layers first, items keep their insertion order inside a layer
+        for layer in sorted(self.layers):
+            items = self.layers[layer]
+            if not items:
+                continue
+            # fblits (pygame-ce) skips building the list of dirty rects
+            if hasattr(surface, "fblits"):
+                surface.fblits(items)
+            else:
+                surface.blits(items, doreturn=False)
+            items.clear()
@@ -0,0 +1,95 @@
+import os
+import sys
+import threading
+
+import pygame
+
+class RenderThread:
+    """ Pipelined presentation. The game draws each frame into an offscreen canvas and
+    publish() copies it into one of two snapshot buffers; this thread blits the newest
+    snapshot to the display and flips, so flip time overlaps the next frame's input and
+    update. Enabled with --render-thread or BS2_RENDER_THREAD=1. """
+
+    def __init__(self, display, on_present=None):
+        self.display = display
+        self.on_present = on_present # Called on this thread after each flip with the frame's payload
+        size = display.get_size()
+        self.canvas = pygame.Surface(size, 0, display) # Everything draws here instead of the display
+        self.buffers = [pygame.Surface(size, 0, display) for _ in range(2)]
+        self.payloads = [None, None] # Whatever publish() was given with each snapshot
+        self.last_written = 1
+        self.ready = None # Buffer waiting to be presented
+        self.presenting = None # Buffer the thread is reading
+        self.condition = threading.Condition()
+        self.running = False
+        self.thread = None
+
+        self.published = 0
+        self.presented = 0
+        self.dropped = 0 # Replaced before the thread got to them
+
+    @staticmethod
+    def requested():
+        return "--render-thread" in sys.argv or os.environ.get("BS2_RENDER_THREAD") == "1"
+
+    def start(self):
+        self.running = True
+        self.thread = threading.Thread(target=self.present_loop, name="render", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        with self.condition:
+            self.running = False
+            self.condition.notify()
+        if self.thread:
+            self.thread.join(timeout=1.0)
+            self.thread = None
+
+    def publish(self, payload=None):
+        # Called by the game loop once the canvas holds a finished frame
+        with self.condition:
+            # Never the buffer being presented. A snapshot still waiting is stale now,
+            # overwrite it rather than queue frames behind the display.
+            if self.presenting is not None:
+                target = 1 - self.presenting
+            elif self.ready is not None:
+                target = 1 - self.ready
+            else:
+                target = 1 - self.last_written
+            if self.ready == target:
+                self.ready = None
+                self.dropped += 1
+                if self.payloads[target]:
+                    # The inputs it carried were never shown, this frame shows them
+                    payload = self.payloads[target] + (payload or [])
+        # The copy runs outside the lock, the thread can only pick up the other buffer meanwhile
+        self.buffers[target].blit(self.canvas, (0, 0))
+        with self.condition:
+            self.payloads[target] = payload
+            self.last_written = target
+            self.ready = target
+            self.published += 1
+            self.condition.notify()
+
+    def present_loop(self):
+        while True:
+            with self.condition:
+                while self.running and self.ready is None:
+                    self.condition.wait()
+                if not self.running:
+                    return
+                index = self.ready
+                self.ready = None
+                self.presenting = index
+            # pygame releases the GIL in blit and flip, the game loop keeps running
+            self.display.blit(self.buffers[index], (0, 0))
+            pygame.display.flip()
+            payload = self.payloads[index]
+            if payload and self.on_present:
+                self.on_present(payload)
+            with self.condition:
+                self.presenting = None
+                self.presented += 1
+
+    def report(self):
+        print(f"Render thread: {self.published} published, {self.presented} presented, {self.dropped} dropped")
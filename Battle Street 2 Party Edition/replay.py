@@ -0,0 +1,91 @@
+import os
+import time
+import zlib
+from collections import deque
+
+import pygame
+from glyphs import get_glyphs
+
+WHITE = (255, 255, 255)
+RED = (255, 0, 0)
+BLACK = (0, 0, 0)
+
+class InstantReplay:
+    """ Keeps the last few seconds of a minigame as small zlib-compressed frames in a ring
+    with a hard byte cap, and plays them back when the player wins, during the 180 frames
+    every minigame already waits before returning to the board. Playback starts fast and
+    slows down into the winning moment. BS2_REPLAY=0 turns it off. """
+
+    def __init__(self, seconds=4.0, fps=30, width=320, max_bytes=8 * 1024 * 1024, enabled=None):
+        if enabled is None:
+            enabled = os.environ.get("BS2_REPLAY", "1") != "0"
+        self.enabled = enabled
+        self.interval = 1.0 / fps
+        self.max_frames = int(seconds * fps)
+        self.width = width
+        self.max_bytes = max_bytes
+        self.frames = deque() # Compressed frames, oldest first
+        self.bytes = 0
+        self.scaled = None # Frames are scaled into this (screen format)...
+        self.small = None # ...and stored from this 16-bit copy: half the bytes to compress and keep
+        self.full = None # Playback frame scaled back up
+        self.minigame = None # Instance being recorded
+        self.last_record = 0.0
+        self.record_ms = 0.0 # Last recording cost, for the debug overlay
+        self.shown = None # Index of the frame in self.full
+
+    def track(self, minigame):
+        # New minigame, new recording
+        if minigame is not self.minigame:
+            self.minigame = minigame
+            self.frames.clear()
+            self.bytes = 0
+            self.shown = None
+
+    def record(self, screen):
+        # Called after the minigame has drawn a frame that is still being played
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if now - self.last_record < self.interval:
+            return
+        self.last_record = now
+        width, height = screen.get_size()
+        size = (self.width, self.width * height // width)
+        if self.small is None or self.small.get_size() != size:
+            self.scaled = pygame.Surface(size, 0, screen)
+            self.small = pygame.Surface(size, 0, 16)
+        pygame.transform.scale(screen, size, self.scaled)
+        self.small.blit(self.scaled, (0, 0))
+        data = zlib.compress(self.small.get_view("0"), 1) # Flat colors compress well even at level 1
+        self.frames.append(data)
+        self.bytes += len(data)
+        while len(self.frames) > self.max_frames or self.bytes > self.max_bytes:
+            self.bytes -= len(self.frames.popleft())
+        self.record_ms = (time.perf_counter() - now) * 1000
+
+    def showing(self, minigame):
+        # True while the winner's replay should replace the minigame's own drawing
+        result = minigame.result
+        return self.enabled and result is not None and result.player_won and len(self.frames) > 1
+
+    def draw(self, screen, minigame, font):
+        # game_over_timer runs 0..180; position = 1 - (1 - t)^2 plays fast first, slow at the end
+        t = min(minigame.game_over_timer / 180, 1.0)
+        index = round((1 - (1 - t) ** 2) * (len(self.frames) - 1))
+        if self.shown != index:
+            self.small.get_buffer().write(zlib.decompress(self.frames[index]))
+            if self.full is None or self.full.get_size() != screen.get_size():
+                self.full = pygame.Surface(screen.get_size(), 0, self.small)
+            pygame.transform.scale(self.small, screen.get_size(), self.full)
+            self.shown = index
+        screen.blit(self.full, (0, 0))
+
+        speed = 2 * (1 - t) # d(position)/dt, relative to real time over the whole recording
+        glyphs = get_glyphs(font) # The label changes every frame
+        label = f"REPLAY  x{speed * len(self.frames) * self.interval / 3:.1f}"
+        glyphs.draw(screen, label, RED, (screen.get_width() - glyphs.size(label)[0] - 20, 20)) # Minigame HUDs sit top left
+        width, height = glyphs.size(minigame.result.text)
+        x, y = screen.get_width() // 2 - width // 2, screen.get_height() - height - 40
+        pygame.draw.rect(screen, BLACK, (x - 10, y - 5, width + 20, height + 10))
+        glyphs.draw(screen, minigame.result.text, WHITE, (x, y))
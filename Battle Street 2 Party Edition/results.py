@@ -0,0 +1,31 @@
+# Who won a minigame
+PLAYER = "PLAYER" # The player whose turn it is, earns the star
+OPPONENT = "OPPONENT" # Computer player or the boss
+NOBODY = "NOBODY" # Solo game lost
+
+class MinigameResult:
+    """ How a minigame ended. The Game awards stars from this instead of reading the banner text. """
+
+    def __init__(self, minigame, winner, score, ticks, cause, text):
+        self.minigame = minigame # Class name
+        self.winner = winner
+        self.score = score # The game's own counter (points, coins, health left...), None if it has none
+        self.ticks = ticks # Simulation steps until it was decided
+        self.cause = cause # Short tag, e.g. "time_up", "caught", "boss_defeated"
+        self.text = text # Banner shown on screen
+
+    @property
+    def player_won(self):
+        return self.winner == PLAYER
+
+    def to_dict(self):
+        return {
+            "minigame": self.minigame,
+            "winner": self.winner,
+            "score": self.score,
+            "ticks": self.ticks,
+            "cause": self.cause,
+        }
+
+    def __repr__(self):
+        return f"MinigameResult({self.minigame}, {self.winner}, score={self.score}, ticks={self.ticks}, cause={self.cause})"
@@ -0,0 +1,139 @@
+import os
+import time
+from batch_writer import BatchWriter
+
+sqlite3 = None # Imported by Scoreboard.connect(), on the writer thread, not before the first frame
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    session TEXT NOT NULL,
+    played_at REAL NOT NULL,
+    minigame TEXT NOT NULL,
+    player INTEGER NOT NULL,
+    winner TEXT NOT NULL,
+    score INTEGER,
+    ticks INTEGER NOT NULL,
+    cause TEXT
+);
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    session TEXT NOT NULL,
+    finished_at REAL NOT NULL,
+    players INTEGER NOT NULL,
+    winner INTEGER NOT NULL,
+    stars TEXT NOT NULL
+);
+-- Top N per minigame and history per player, both read with keyset pagination
+CREATE INDEX IF NOT EXISTS results_top ON results (minigame, score DESC, id);
+CREATE INDEX IF NOT EXISTS results_player ON results (player, played_at DESC, id DESC);
+"""
+
+class Scoreboard:
+    """ Every minigame result and finished board, kept in scores.db next to the game
+    (SQLite in WAL mode, so the high score screen can read while results are written).
+    record() and game_over() only queue rows; a BatchWriter thread inserts them in
+    batches, one transaction per batch. Pages are read by key (the last row seen) rather than by
+    offset, so a page costs the same after a hundred results or a million.
+    BS2_SCORES=0 turns it off. """
+
+    def __init__(self, path, enabled=None):
+        if enabled is None:
+            enabled = os.environ.get("BS2_SCORES", "1") != "0"
+        self.enabled = enabled
+        self.path = path
+        self.session = os.urandom(6).hex()
+        self.reader = None
+        self.connection = None
+        self.written = 0
+        # The writer opens the database, so creating the schema doesn't hold up startup
+        self.writer = BatchWriter("scoreboard", self.write_batch, self.open_writer, self.close_writer)
+        if enabled:
+            self.writer.start()
+
+    def connect(self):
+        global sqlite3
+        import sqlite3
+        connection = sqlite3.connect(self.path, timeout=5.0)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL") # WAL stays consistent, a power cut may lose the last batch
+        return connection
+
+    def record(self, result, player):
+        # player: 1-4, whose turn the minigame was
+        if self.enabled:
+            self.writer.put(("result", (self.session, time.time(), result.minigame, player, result.winner,
+                                       result.score, result.ticks, result.cause)))
+
+    def game_over(self, winner, players, stars):
+        if self.enabled:
+            self.writer.put(("game", (self.session, time.time(), players, winner, ",".join(map(str, stars[:players])))))
+
+    def open_writer(self):
+        # On the writer thread
+        try:
+            self.connection = self.connect()
+            self.connection.executescript(SCHEMA)
+        except sqlite3.Error as e:
+            print(f"Scoreboard disabled: {e}")
+            self.enabled = False
+            return False
+
+    def write_batch(self, rows):
+        results = [row for kind, row in rows if kind == "result"]
+        games = [row for kind, row in rows if kind == "game"]
+        try:
+            with self.connection:
+                self.connection.executemany("INSERT INTO results (session, played_at, minigame, player, winner, score, ticks, cause) "
+                                            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", results)
+                self.connection.executemany("INSERT INTO games (session, finished_at, players, winner, stars) "
+                                            "VALUES (?, ?, ?, ?, ?)", games)
+            self.written += len(rows)
+        except sqlite3.Error as e:
+            print(f"Error writing scores: {e}")
+
+    def close_writer(self):
+        self.connection.close()
+        self.connection = None
+
+    def flush(self, timeout=1.0):
+        # Wait until everything queued so far is in the database (before showing scores)
+        self.writer.flush(timeout)
+
+    def query(self, sql, args):
+        if not self.enabled:
+            return []
+        try:
+            if self.reader is None:
+                self.reader = self.connect()
+            return self.reader.execute(sql, args).fetchall()
+        except sqlite3.Error as e:
+            print(f"Error reading scores: {e}")
+            return []
+
+    def top(self, minigame, limit=10, after=None):
+        # Best scores first, ties in the order they were set. after: (score, id) of the
+        # last row of the previous page
+        if after is None:
+            return self.query("SELECT id, score, player, played_at FROM results "
+                              "WHERE minigame = ? AND score IS NOT NULL "
+                              "ORDER BY score DESC, id LIMIT ?", (minigame, limit))
+        score, row_id = after
+        return self.query("SELECT id, score, player, played_at FROM results "
+                          "WHERE minigame = ? AND score IS NOT NULL AND score <= ? AND (score < ? OR id > ?) "
+                          "ORDER BY score DESC, id LIMIT ?", (minigame, score, score, row_id, limit))
+
+    def history(self, player, limit=10, before=None):
+        # A player's results, newest first. before: (played_at, id) of the last row seen
+        if before is None:
+            return self.query("SELECT id, played_at, minigame, winner, score FROM results "
+                              "WHERE player = ? ORDER BY played_at DESC, id DESC LIMIT ?", (player, limit))
+        return self.query("SELECT id, played_at, minigame, winner, score FROM results "
+                          "WHERE player = ? AND (played_at, id) < (?, ?) "
+                          "ORDER BY played_at DESC, id DESC LIMIT ?", (player, before[0], before[1], limit))
+
+    def close(self):
+        self.writer.stop()
+        if self.reader:
+            self.reader.close()
+            self.reader = None
@@ -0,0 +1,108 @@
+import os
+import random
+import sys
+import threading
+import time
+
+SNAPSHOT_VERSION = 1
+
+# Game attributes that make up a board in progress
+BOARD_FIELDS = (
+    "state", "num_players", "turn", "stars", "dice_value", "expansion_enabled",
+    "rolling_dice", "dice_stopped", "dice_timer", "dice_jump_timer",
+)
+
+# Only these states are worth coming back to
+RESUMABLE_STATES = ("BOARD", "MINIGAME")
+
+def take(game):
+    """ Board, running minigame and RNG state as bytes. Minigames pickle their own
+    __dict__ minus the display and caches, see Minigame.__getstate__. """
+    board = {name: getattr(game, name) for name in BOARD_FIELDS if hasattr(game, name)}
+    minigame = game.current_minigame if game.state == "MINIGAME" else None
+    import pickle # Only once a snapshot is taken
+    return pickle.dumps((SNAPSHOT_VERSION, board, minigame, random.getstate()), pickle.HIGHEST_PROTOCOL)
+
+def restore(game, data):
+    # Puts the game back exactly where take() was called; False if the data is unusable
+    try:
+        import pickle
+        version, board, minigame, rng = pickle.loads(data)
+    except Exception as e:
+        print(f"Error reading snapshot: {e}")
+        return False
+    if version != SNAPSHOT_VERSION:
+        print(f"Snapshot version {version} is not supported")
+        return False
+    for name, value in board.items():
+        setattr(game, name, value)
+    if minigame is not None:
+        minigame.attach(game.screen, game.font, game.current_minigame)
+    game.current_minigame = minigame
+    game.drawn_state = game.state # No crossfade from whatever was on screen
+    random.setstate(rng)
+    return True
+
+class ResumeStore:
+    """ Crash-resume for kiosks: with --resume (or BS2_RESUME=1) a board in progress is
+    saved every few seconds, and the next start continues it after the splash instead of
+    showing the title. The file is dropped when the board ends. """
+
+    def __init__(self, path, enabled=None, interval=2.0):
+        if enabled is None:
+            enabled = "--resume" in sys.argv or os.environ.get("BS2_RESUME") == "1"
+        self.enabled = enabled
+        self.path = path
+        self.interval = interval
+        self.last_save = 0.0
+        self.saves = 0
+        self.take_ms = 0.0 # Game thread time of the last save
+        self.writer = None
+
+    def load(self):
+        # Snapshot left by the previous run, None if there is nothing to resume
+        if not self.enabled or not os.path.exists(self.path):
+            return None
+        try:
+            with open(self.path, "rb") as f:
+                return f.read()
+        except OSError as e:
+            print(f"Error reading {self.path}: {e}")
+            return None
+
+    def frame(self, game):
+        # Called once per frame
+        if not self.enabled:
+            return
+        if game.state not in RESUMABLE_STATES:
+            if game.state in ("TITLE", "GAME_OVER") and self.last_save:
+                self.discard()
+            return
+        now = time.perf_counter()
+        if now - self.last_save < self.interval or (self.writer and self.writer.is_alive()):
+            return
+        self.last_save = now
+        # Only the pickling happens on the game thread, the disk write doesn't
+        self.writer = threading.Thread(target=self.write, args=(take(game),), name="resume", daemon=True)
+        self.writer.start()
+        self.take_ms = (time.perf_counter() - now) * 1000
+
+    def write(self, data):
+        try:
+            # Written aside and swapped in, so a crash mid-write keeps the previous save
+            temp = self.path + ".tmp"
+            with open(temp, "wb") as f:
+                f.write(data)
+            os.replace(temp, self.path)
+            self.saves += 1
+        except OSError as e:
+            print(f"Error writing {self.path}: {e}")
+
+    def discard(self):
+        self.last_save = 0.0
+        if self.writer:
+            self.writer.join()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
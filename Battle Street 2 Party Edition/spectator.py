@@ -0,0 +1,196 @@
+import os
+import struct
+import sys
+import time
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1") # The viewer process imports pygame too
+import pygame
+from options import number_option
+
+MEMORY_NAME = "bs2_spectator_{pid}" # Per game process, so two instances never share (or unlink) a feed
+# open, width, height, pitch, front slot, slot 0 seq, slot 1 seq, turn, players, 4 x stars, state
+HEADER = struct.Struct("<7I2I4I16s")
+HEADER_SIZE = 128 # Room to grow, frames start after it
+
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+PLAYER_COLORS = [(0, 0, 255), (255, 0, 0), (0, 255, 0), (255, 255, 0)]
+
+class SpectatorFeed:
+    """ Second-screen output for events: Game.draw publishes finished frames into a shared
+    memory double buffer, and a viewer process (its own window, on another monitor with
+    --spectator-display N) shows the latest one with a scoreboard overlay for stars and
+    turn. Publishing is one blit into the back slot and a header update, there is no
+    second render and no pickling. Each slot carries a sequence number that is odd while
+    it is written, so the viewer can tell a torn copy and take the next frame instead;
+    neither side ever waits for the other. --spectator or BS2_SPECTATOR=1 turns it on,
+    --spectator-fps (30) limits how often frames are published. """
+
+    def __init__(self, enabled=None):
+        if enabled is None:
+            enabled = "--spectator" in sys.argv or os.environ.get("BS2_SPECTATOR") == "1"
+        self.enabled = enabled
+        self.interval = 1.0 / number_option("--spectator-fps", "BS2_SPECTATOR_FPS", 30.0, float, minimum=1)
+        self.display = number_option("--spectator-display", "BS2_SPECTATOR_DISPLAY", 1, minimum=0)
+        self.memory = None
+        self.name = MEMORY_NAME.format(pid=os.getpid())
+        self.process = None
+        self.last_publish = 0.0
+        self.published = 0
+        self.publish_ms = 0.0
+
+    def start(self, screen):
+        if not self.enabled:
+            return
+        if screen.get_bitsize() != 32 or screen.get_pitch() != screen.get_width() * 4:
+            print("Spectator disabled: needs a 32-bit screen without row padding")
+            self.enabled = False
+            return
+        import multiprocessing # Only with the feed on, see capture
+        from multiprocessing import shared_memory
+        width, height = screen.get_size()
+        self.pitch = screen.get_pitch()
+        frame_bytes = self.pitch * height
+        try:
+            # A crashed session of this pid can leave its old block behind
+            stale = shared_memory.SharedMemory(name=self.name)
+            stale.close()
+            stale.unlink()
+        except FileNotFoundError:
+            pass
+        self.memory = shared_memory.SharedMemory(name=self.name, create=True, size=HEADER_SIZE + frame_bytes * 2)
+        self.size = (width, height)
+        self.views = [self.memory.buf[HEADER_SIZE + i * frame_bytes:HEADER_SIZE + (i + 1) * frame_bytes] for i in range(2)]
+        self.frame_bytes = frame_bytes
+        self.masks = screen.get_masks()
+        self.front = 0
+        self.seq = [0, 0]
+        self.write_header(1, None)
+        context = multiprocessing.get_context("spawn")
+        self.process = context.Process(target=viewer_main, args=(self.name, self.masks, self.display), name="spectator", daemon=True)
+        self.process.start()
+        print(f"Spectator feed: {width}x{height} in shared memory '{self.name}' (python spectator.py {os.getpid()} to attach another viewer)")
+
+    def write_header(self, is_open, game):
+        if game is not None:
+            stars = list(game.stars[:4]) + [0] * (4 - len(game.stars[:4]))
+            turn, players, state = game.turn, game.num_players, game.scene_label()
+        else:
+            stars, turn, players, state = [0, 0, 0, 0], 0, 1, ""
+        width, height = self.size
+        HEADER.pack_into(self.memory.buf, 0, is_open, width, height, self.pitch, self.front, self.seq[0], self.seq[1],
+                         turn, players, *stars, state.encode()[:16])
+
+    def publish(self, screen, game):
+        # Called with each finished frame, before it is presented
+        if not self.process:
+            return
+        now = time.perf_counter()
+        if now - self.last_publish < self.interval:
+            return
+        self.last_publish = now
+        back = 1 - self.front
+        self.seq[back] += 1 # Odd: being written
+        self.write_header(1, game)
+        self.views[back][:] = screen.get_view("0") # One memcpy of the pixels
+        self.seq[back] += 1
+        self.front = back
+        self.write_header(1, game)
+        self.published += 1
+        self.publish_ms = (time.perf_counter() - now) * 1000
+
+    def stop(self):
+        if not self.process:
+            return
+        self.write_header(0, None)
+        self.process.join(2)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process = None
+        del self.views
+        self.memory.close()
+        try:
+            self.memory.unlink()
+        except FileNotFoundError:
+            pass
+        self.memory = None
+
+    def report(self):
+        if self.enabled:
+            print(f"Spectator: {self.published} frames published, last took {self.publish_ms:.3f} ms")
+
+def viewer_main(memory_name, masks=None, display=0):
+    # Viewer process: maps the feed, shows the newest complete frame with its own overlay
+    from multiprocessing import shared_memory
+    memory = shared_memory.SharedMemory(name=memory_name)
+    is_open, width, height, pitch = HEADER.unpack_from(memory.buf, 0)[:4]
+    pygame.display.init()
+    pygame.font.init()
+    display = display if display < pygame.display.get_num_displays() else 0
+    window = pygame.display.set_mode((width // 2, height // 2), pygame.RESIZABLE, display=display)
+    pygame.display.set_caption("Battle Street 2: Spectator")
+    if masks is None:
+        masks = (0xff0000, 0xff00, 0xff, 0)
+    frame = pygame.Surface((width, height), 0, 32, masks)
+    frame_bytes = pitch * height
+    font = pygame.font.Font(None, 36)
+    clock = pygame.time.Clock()
+    shown_seq = None
+    scaled = None
+    torn = 0
+    running = True
+    while running:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                running = False
+        header = HEADER.unpack_from(memory.buf, 0)
+        if not header[0]:
+            break # The game has quit
+        front = header[4]
+        seq = header[5 + front]
+        if seq != shown_seq and seq % 2 == 0:
+            start = HEADER_SIZE + front * frame_bytes
+            frame.get_buffer().write(bytes(memory.buf[start:start + frame_bytes]))
+            # If the slot was rewritten while we copied, the copy may be torn: skip it
+            if HEADER.unpack_from(memory.buf, 0)[5 + front] == seq:
+                shown_seq = seq
+                scaled = pygame.transform.smoothscale(frame, window.get_size())
+            else:
+                torn += 1
+        if scaled is not None:
+            if scaled.get_size() != window.get_size():
+                scaled = pygame.transform.smoothscale(frame, window.get_size())
+            window.blit(scaled, (0, 0))
+            draw_overlay(window, font, header)
+        pygame.display.flip()
+        clock.tick(60)
+    memory.close()
+    pygame.quit()
+
+def draw_overlay(window, font, header):
+    # Scoreboard strip along the bottom: whose turn it is and everyone's stars
+    turn, players = header[7], header[8]
+    stars = header[9:13]
+    state = header[13].rstrip(b"\0").decode(errors="ignore")
+    strip = pygame.Rect(0, window.get_height() - 40, window.get_width(), 40)
+    window.fill(BLACK, strip)
+    x = 10
+    for i in range(max(1, min(players, 4))):
+        text = font.render(f"P{i + 1}: {stars[i]}/14", True, PLAYER_COLORS[i])
+        if i == turn:
+            pygame.draw.rect(window, WHITE, (x - 4, strip.y + 4, text.get_width() + 8, 32), 2)
+        window.blit(text, (x, strip.y + 8))
+        x += text.get_width() + 24
+    label = font.render(state, True, WHITE)
+    window.blit(label, (strip.right - label.get_width() - 10, strip.y + 8))
+
+if __name__ == "__main__":
+    # Attach another viewer to a running game: python spectator.py <game pid> [display]
+    from multiprocessing import resource_tracker
+    if len(sys.argv) < 2:
+        sys.exit("usage: python spectator.py <game pid> [display]")
+    name = MEMORY_NAME.format(pid=int(sys.argv[1]))
+    try:
+        viewer_main(name, display=int(sys.argv[2]) if len(sys.argv) > 2 else 0)
+    finally:
+        resource_tracker.unregister("/" + name, "shared_memory") # Or it would unlink the game's block on exit, even after an error
@@ -0,0 +1,157 @@
+import pygame
+
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+RED = (255, 0, 0)
+GREEN = (0, 255, 0)
+YELLOW = (255, 255, 0)
+GOLD = (255, 215, 0)
+
+# Dot layout for standard dice faces, as offsets from the dice center
+DICE_DOTS = {
+    1: [(0, 0)],
+    2: [(-25, -25), (25, 25)],
+    3: [(0, 0), (-25, -25), (25, 25)],
+    4: [(-25, -25), (25, 25), (25, -25), (-25, 25)],
+    5: [(0, 0), (-25, -25), (25, 25), (25, -25), (-25, 25)],
+    6: [(-25, -25), (25, 25), (25, -25), (-25, 25), (-25, 0), (25, 0)],
+}
+
+class SpriteAtlas:
+    """ Bakes frequently drawn shapes once per color/variant so frames are plain blits """
+
+    def __init__(self):
+        self.sprites = {}
+        self.font = None # Needed for dice faces 7-12, set by the Game
+
+    def cached(self, key, build, alpha=True):
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = build()
+            # Match the display pixel format once a display exists
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert_alpha() if alpha else sprite.convert()
+            self.sprites[key] = sprite
+        return sprite
+
+    def clear(self):
+        # Display format changed (new mode), sprites have to be converted again
+        self.sprites.clear()
+
+    def player(self, color):
+        def build():
+            surf = pygame.Surface((40, 60))
+            surf.fill(color)
+            # Eyes
+            pygame.draw.rect(surf, WHITE, (5, 10, 10, 10))
+            pygame.draw.rect(surf, WHITE, (25, 10, 10, 10))
+            return surf
+        return self.cached(("player", color), build, alpha=False)
+
+    def turn_indicator(self):
+        def build():
+            surf = pygame.Surface((21, 21), pygame.SRCALPHA)
+            pygame.draw.polygon(surf, WHITE, [(10, 20), (0, 0), (20, 0)])
+            return surf
+        return self.cached(("turn_indicator",), build)
+
+    def dice(self, value, golden=False):
+        def build():
+            surf = pygame.Surface((100, 100), pygame.SRCALPHA)
+            rect = surf.get_rect()
+            pygame.draw.rect(surf, WHITE, rect, border_radius=10)
+            pygame.draw.rect(surf, BLACK, rect, 4, border_radius=10)
+
+            # Golden Dice Skin if expansion enabled
+            if golden:
+                pygame.draw.rect(surf, GOLD, rect, 4, border_radius=10)
+
+            cx, cy = rect.center
+            if value in DICE_DOTS:
+                for ox, oy in DICE_DOTS[value]:
+                    pygame.draw.circle(surf, BLACK, (cx + ox, cy + oy), 10)
+            elif value > 6 and self.font:
+                # Custom numbers for 7, 8 etc
+                text_surf = self.font.render(str(value), True, BLACK)
+                surf.blit(text_surf, (cx - text_surf.get_width()//2, cy - text_surf.get_height()//2))
+            return surf
+        return self.cached(("dice", value, golden), build)
+
+    def circle(self, color, radius):
+        # Blit at (centerx - radius, centery - radius)
+        def build():
+            surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(surf, color, (radius, radius), radius)
+            return surf
+        return self.cached(("circle", color, radius), build)
+
+    def block(self, color, width, height):
+        def build():
+            surf = pygame.Surface((width, height))
+            surf.fill(color)
+            return surf
+        return self.cached(("block", color, width, height), build, alpha=False)
+
+    def wall_tile(self, size, color=(0, 0, 255)):
+        def build():
+            surf = pygame.Surface((size, size))
+            surf.fill(color)
+            # Hollow look
+            pygame.draw.rect(surf, BLACK, surf.get_rect().inflate(-4, -4))
+            return surf
+        return self.cached(("wall_tile", size, color), build, alpha=False)
+
+    def coin(self):
+        return self.circle(YELLOW, 10)
+
+    def target(self):
+        def build():
+            surf = pygame.Surface((40, 40), pygame.SRCALPHA)
+            pygame.draw.circle(surf, RED, (20, 20), 20)
+            pygame.draw.circle(surf, WHITE, (20, 20), 15)
+            pygame.draw.circle(surf, RED, (20, 20), 10)
+            return surf
+        return self.cached(("target",), build)
+
+    def ghost(self, color):
+        # Same footprint as the 30x30 ghost rect
+        def build():
+            surf = pygame.Surface((30, 30), pygame.SRCALPHA)
+            pygame.draw.circle(surf, color, (15, 15), 13)
+            # Eyes
+            pygame.draw.circle(surf, WHITE, (11, 11), 3)
+            pygame.draw.circle(surf, WHITE, (19, 11), 3)
+            return surf
+        return self.cached(("ghost", color), build)
+
+    def enemy(self, width=30, height=30):
+        def build():
+            surf = pygame.Surface((width, height))
+            surf.fill(RED)
+            # Eyes
+            pygame.draw.rect(surf, GREEN, (5, 10, 5, 5))
+            pygame.draw.rect(surf, GREEN, (width - 10, 10, 5, 5))
+            return surf
+        return self.cached(("enemy", width, height), build, alpha=False)
+
+    def build_all(self, colors, expansion=False):
+        # Bake everything up front, e.g. while the splash screen is showing
+        for color in colors:
+            self.player(color)
+        self.turn_indicator()
+        for value in range(0, (12 if expansion else 6) + 1):
+            self.dice(value, expansion)
+        self.coin()
+        self.target()
+        for color in (RED, (255, 184, 255), (0, 255, 255)):
+            self.ghost(color)
+        self.enemy()
+        self.wall_tile(40)
+
+_atlas = None
+
+def get_atlas():
+    global _atlas
+    if _atlas is None:
+        _atlas = SpriteAtlas()
+    return _atlas
@@ -0,0 +1,115 @@
+import random
+import pygame
+from quality import current_tier
+
+BLACK = (0, 0, 0)
+
+# Far to near: (scroll speed in px/frame, stars per 800x600 at full density, radius, brightness)
+STAR_LAYERS = [
+    (0.5, 70, 1, 110),
+    (1.0, 40, 1, 180),
+    (2.0, 15, 2, 255),
+]
+TILE_SIZE = 512 # Layers are repeating tiles (1 MB each at 32 bpp), not screen-sized textures
+REFERENCE_AREA = 800 * 600
+
+class Starfield:
+    """ Pre-rendered parallax star layers. Each layer is a small tile that wraps seamlessly
+    and is repeated across the screen with one blits() call per frame, however many stars
+    it has and whatever the resolution. The near layers are RLE colorkeyed, so their mostly
+    empty tiles cost little more than the stars themselves. """
+
+    def __init__(self, size, density=1.0, seed=7, layers=STAR_LAYERS, like=None, build=True, tile_size=TILE_SIZE):
+        self.width, self.height = size
+        self.density = density
+        self.seed = seed
+        self.layer_specs = layers
+        self.like = like
+        self.tile_size = tile_size
+        self.layers = [] # [tile, speed, offset, x shift]
+        if build:
+            for _ in self.build():
+                pass
+
+    def build(self):
+        # Generator so the splash warm-up can render one layer per step
+        rng = random.Random(self.seed) # Own RNG so the minigame's random sequence is untouched
+        like = self.like
+        size = self.tile_size
+        for i, (speed, count, radius, shade) in enumerate(self.layer_specs):
+            tile = pygame.Surface((size, size), 0, like) if like else pygame.Surface((size, size))
+            tile.fill(BLACK)
+            if i > 0:
+                # Only the far layer is opaque, it replaces the background fill
+                tile.set_colorkey(BLACK, pygame.RLEACCEL)
+            color = (shade, shade, shade)
+            for _ in range(max(1, round(count * self.density * size * size / REFERENCE_AREA))):
+                x = rng.randrange(size)
+                y = rng.randrange(size)
+                # Stars on an edge are drawn again on the opposite one so the tiles join up
+                for dx in (-size, 0, size):
+                    for dy in (-size, 0, size):
+                        pygame.draw.circle(tile, color, (x + dx, y + dy), radius)
+            # Layers start shifted against each other so the repeats don't line up
+            self.layers.append([tile, speed, 0.0, rng.randrange(size)])
+            yield
+
+    def update(self):
+        for layer in self.layers:
+            layer[2] = (layer[2] + layer[1]) % self.tile_size
+
+    def draw(self, surface, pos=(0, 0)):
+        size = self.tile_size
+        left, top = pos
+        clip = surface.get_clip()
+        surface.set_clip(clip.clip((left, top, self.width, self.height)))
+        for tile, speed, offset, shift in self.layers:
+            xs = range(left - shift, left + self.width, size)
+            surface.blits([(tile, (x, y)) for y in range(top + int(offset) - size, top + self.height, size) for x in xs], doreturn=False)
+        surface.set_clip(clip)
+
+_starfields = {}
+_builders = {} # key -> warm_starfield generator, for tier changes mid-game
+
+def starfield_key(size, density, layer_count):
+    tier = current_tier()
+    if density is None:
+        density = tier["star_density"]
+    if layer_count is None:
+        layer_count = tier["star_layers"]
+    return (tuple(size), density, layer_count)
+
+def get_starfield(size, density=None, layer_count=None, like=None):
+    # Shared between minigames so the layers are only rendered once per size.
+    # Density and layer count default to the current quality tier.
+    key = starfield_key(size, density, layer_count)
+    starfield = _starfields.get(key)
+    if starfield is None:
+        starfield = _starfields[key] = Starfield(size, key[1], layers=STAR_LAYERS[:key[2]], like=like)
+    return starfield
+
+def tier_starfield(size, current, like=None):
+    # For a running minigame: the current tier's starfield once it exists. Until then the
+    # minigame keeps the one it has and the new one is built a layer per call, so a tier
+    # change (made because frames ran long) does not build a whole starfield in one frame.
+    key = starfield_key(size, None, None)
+    starfield = _starfields.get(key)
+    if starfield is not None:
+        return starfield
+    builder = _builders.get(key)
+    if builder is None:
+        builder = _builders[key] = warm_starfield(size, like=like)
+    try:
+        next(builder)
+    except StopIteration:
+        del _builders[key]
+    return _starfields.get(key, current)
+
+def warm_starfield(size, density=None, layer_count=None, like=None):
+    # Same as get_starfield, one layer per step
+    key = starfield_key(size, density, layer_count)
+    if key in _starfields:
+        return
+    starfield = Starfield(size, key[1], layers=STAR_LAYERS[:key[2]], like=like, build=False)
+    yield from starfield.build()
+    _starfields[key] = starfield
@@ -0,0 +1,53 @@
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+FIRST_PIXEL_TARGET_MS = 300
+
+class StartupTrace:
+    """ Records how long each startup phase takes until the first frame is on screen.
+    Enabled with --trace-startup or BS2_TRACE_STARTUP=1. """
+
+    def __init__(self, enabled=None):
+        if enabled is None:
+            enabled = "--trace-startup" in sys.argv or os.environ.get("BS2_TRACE_STARTUP") == "1"
+        self.enabled = enabled
+        self.start = time.perf_counter()
+        self.last = self.start
+        self.phases = [] # (name, ms)
+        self.done = False
+
+    def mark(self, name):
+        # Everything since the previous mark is attributed to this phase
+        if self.done:
+            return
+        now = time.perf_counter()
+        self.phases.append((name, (now - self.last) * 1000))
+        self.last = now
+
+    @contextmanager
+    def phase(self, name):
+        self.mark("(between phases)") # Keep untraced gaps visible instead of folding them in
+        try:
+            yield
+        finally:
+            self.mark(name)
+
+    def first_frame(self):
+        if self.done:
+            return
+        self.mark("first frame")
+        self.done = True
+        if self.enabled:
+            self.report()
+
+    def report(self):
+        total = (self.last - self.start) * 1000
+        print("Startup trace (time to first frame):")
+        for name, ms in self.phases:
+            if name == "(between phases)" and ms < 0.5:
+                continue
+            print(f"  {name:<24} {ms:8.2f} ms")
+        status = "OK" if total <= FIRST_PIXEL_TARGET_MS else "OVER TARGET"
+        print(f"  {'total':<24} {total:8.2f} ms  ({status}, target {FIRST_PIXEL_TARGET_MS} ms)")
@@ -0,0 +1,78 @@
+import json
+import os
+import platform
+import sys
+import time
+from batch_writer import BatchWriter
+
+class TelemetrySink:
+    """ Append-only session log for balancing: one compact JSON line per minigame played and
+    per finished board, after a metadata line. The game thread only queues dicts; a
+    BatchWriter thread serializes them and appends them in batches.
+    Opt-in with --telemetry or BS2_TELEMETRY=1, files go to telemetry/ next to the game. """
+
+    def __init__(self, output_dir, enabled=None):
+        if enabled is None:
+            enabled = "--telemetry" in sys.argv or os.environ.get("BS2_TELEMETRY") == "1"
+        self.enabled = enabled
+        self.session = os.urandom(6).hex()
+        self.started = time.time()
+        self.records = 0
+        self.path = None
+        self.writer = BatchWriter("telemetry", self.write_batch, teardown=self.close_file)
+        if not enabled:
+            return
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+            self.path = os.path.join(output_dir, f"session_{time.strftime('%Y%m%d_%H%M%S')}_{self.session}.jsonl")
+            self.file = open(self.path, "a", encoding="utf-8")
+        except OSError as e:
+            print(f"Telemetry disabled: {e}")
+            self.enabled = False
+            return
+        self.writer.start()
+        print(f"Telemetry: {self.path}")
+
+    def emit(self, kind, **fields):
+        if not self.enabled:
+            return
+        fields["type"] = kind
+        fields["session"] = self.session
+        fields["t"] = round(time.time() - self.started, 3)
+        self.writer.put(fields)
+
+    def session_start(self, game):
+        import pygame
+        self.emit(
+            "session",
+            start=time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started)),
+            platform=platform.platform(),
+            python=platform.python_version(),
+            pygame=pygame.version.ver,
+            screen=list(game.screen.get_size()),
+            render_fps=game.render_fps,
+        )
+
+    def minigame(self, result, game, dice_value):
+        self.emit("minigame", turn=game.turn, players=game.num_players, expansion=game.expansion_enabled,
+                  dice=dice_value, stars_before=list(game.stars), **result.to_dict())
+
+    def game_over(self, game):
+        self.emit("game_over", winner=game.turn, players=game.num_players, stars=list(game.stars))
+
+    def write_batch(self, records):
+        # On the writer thread
+        try:
+            self.file.write("".join(json.dumps(record, separators=(",", ":")) + "\n" for record in records))
+            self.file.flush()
+            self.records += len(records)
+        except OSError as e:
+            print(f"Error writing telemetry: {e}")
+
+    def close_file(self):
+        self.file.close()
+
+    def close(self):
+        if not self.writer.stop():
+            return
+        print(f"Telemetry: {self.records} records written to {self.path}")
@@ -0,0 +1,53 @@
+import pygame
+
+class Transitions:
+    """ Screen fades and state crossfades that reuse one preallocated snapshot surface """
+
+    def __init__(self, screen):
+        # Allocated once; capture() copies into it instead of making new surfaces
+        self.snapshot = pygame.Surface(screen.get_size(), 0, screen)
+        self.snapshot_valid = False
+        self.crossfades = {} # (from_state, to_state) -> frames
+        self.default_frames = None # Crossfade for pairs not in the table, None = cut
+        self.frames = 0
+        self.timer = 0
+
+    def set_crossfade(self, from_state, to_state, frames):
+        self.crossfades[(from_state, to_state)] = frames
+
+    def fade(self, surface, alpha):
+        # Darken what is already drawn, 255 = untouched, 0 = black.
+        # Multiply blend is done in place, no overlay surface needed.
+        if alpha < 255:
+            alpha = max(0, alpha)
+            surface.fill((alpha, alpha, alpha), special_flags=pygame.BLEND_RGB_MULT)
+
+    def capture(self, surface):
+        self.snapshot.blit(surface, (0, 0))
+        self.snapshot_valid = True
+
+    def state_changed(self, surface, from_state, to_state):
+        # Call before the new state draws anything: surface still holds the last frame
+        frames = self.crossfades.get((from_state, to_state), self.default_frames)
+        if frames:
+            self.capture(surface)
+            self.frames = frames
+            self.timer = frames
+        else:
+            # A cut: drop any crossfade still running, it shows a state we already left
+            self.timer = 0
+            self.snapshot.set_alpha(None)
+
+    @property
+    def active(self):
+        return self.timer > 0 and self.snapshot_valid
+
+    def draw(self, surface):
+        # Blend the captured old state over the freshly drawn new one
+        if not self.active:
+            return
+        self.snapshot.set_alpha(int(255 * self.timer / self.frames))
+        surface.blit(self.snapshot, (0, 0))
+        self.timer -= 1
+        if self.timer == 0:
+            self.snapshot.set_alpha(None)
@@ -0,0 +1,68 @@
+import time
+import types
+from collections import deque
+
+class WarmupScheduler:
+    """ Spreads startup work over idle frames (the splash screen) within a per-frame time budget.
+    A task is a callable; if it returns a generator, every next() is one slice of work. """
+
+    def __init__(self, budget_ms=8.0):
+        self.budget = budget_ms / 1000
+        self.tasks = deque() # [name, callable or generator, seconds spent]
+        self.finished = [] # (name, ms, in_time)
+        self.frames = 0
+
+    def add(self, name, task):
+        self.tasks.append([name, task, 0.0])
+
+    @property
+    def done(self):
+        return not self.tasks
+
+    def step(self):
+        # Do as much work as fits in this frame's budget
+        if not self.tasks:
+            return
+        self.frames += 1
+        deadline = time.perf_counter() + self.budget
+        while self.tasks and time.perf_counter() < deadline:
+            self.run_slice(in_time=True)
+
+    def finish(self):
+        # Out of idle frames, whatever is left runs now
+        while self.tasks:
+            self.run_slice(in_time=False)
+
+    def run_slice(self, in_time):
+        entry = self.tasks[0]
+        name, task, spent = entry
+        start = time.perf_counter()
+        try:
+            if isinstance(task, types.GeneratorType):
+                next(task)
+                complete = False
+            else:
+                result = task()
+                if isinstance(result, types.GeneratorType):
+                    entry[1] = result # Continue slicing it on the next call
+                    complete = False
+                else:
+                    complete = True
+        except StopIteration:
+            complete = True
+        except Exception as e:
+            print(f"Warm-up task {name} failed: {e}")
+            complete = True
+        entry[2] = spent + time.perf_counter() - start
+
+        if complete:
+            self.tasks.popleft()
+            self.finished.append((name, entry[2] * 1000, in_time))
+
+    def report(self):
+        print(f"Warm-up over {self.frames} frames:")
+        for name, ms, in_time in self.finished:
+            status = "ok" if in_time else "LATE"
+            print(f"  {name:<20} {ms:7.2f} ms  {status}")
+        for name, _, _ in self.tasks:
+            print(f"  {name:<20} not run")